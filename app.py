@@ -6,11 +6,11 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
+from functools import partial
 
 # Import utilities
 import config
-from utils import styling, metrics, data_generator, charts, dialogs
+from utils import styling, metrics, charts, dialogs, trends, data_store, views, warmup, disk_cache, exports, board_pack, bulk_export, landlords, rollup, search, tables
 
 # Page configuration
 st.set_page_config(
@@ -23,9 +23,11 @@ st.set_page_config(
 # Apply custom styling
 styling.apply_custom_css()
 
-# Initialize session state
-if 'df' not in st.session_state:
-    st.session_state.df = data_generator.generate_historical_data(24)
+# Shared data snapshot; the first run in a fresh worker also starts the cache warm-up
+# and the background refresher, which swaps in a new (pre-warmed) snapshot every CACHE_TTL
+warmup.start()
+data_store.start_refresher(prepare=warmup.warm_default_views)
+snapshot = data_store.get_snapshot()
 
 # Sidebar - Filters
 with st.sidebar:
@@ -44,8 +46,8 @@ with st.sidebar:
     if selected_agency == "Whole Agency":
         pm_list = ["All Managers"] + sorted(config.PORTFOLIO_MANAGERS)
     else:
-        filtered_pms = st.session_state.df[
-            st.session_state.df['agency'] == selected_agency
+        filtered_pms = snapshot.df[
+            snapshot.df['agency'] == selected_agency
         ]['portfolio_manager'].unique()
         pm_list = ["All Managers"] + sorted(filtered_pms.tolist())
 
@@ -60,7 +62,7 @@ with st.sidebar:
     # Date Selection
     st.markdown("### Date Periods")
 
-    df_dates = st.session_state.df['date']
+    df_dates = snapshot.df['date']
     min_date = df_dates.min().date()
     max_date = df_dates.max().date()
 
@@ -280,59 +282,125 @@ with st.sidebar:
 
     # Info section
     st.info(f"**Data Mode:** {'Mock Data' if config.USE_MOCK_DATA else 'Live Data'}")
-    st.caption(f"Last refreshed: {datetime.now().strftime('%H:%M:%S')}")
+    snapshot_age = metrics.format_age(data_store.snapshot_age(snapshot))
+    st.caption(f"Data as of {snapshot.loaded_at.strftime('%H:%M:%S')} ({snapshot_age})")
+    if not warmup.is_ready():
+        st.caption("Warming up caches in the background…")
 
-    # Refresh button
+    # Refresh button: the reload runs in the background, this session keeps the current snapshot
     if st.button("↻ Refresh Data"):
-        st.session_state.df = data_generator.generate_historical_data(24)
-        st.rerun()
+        data_store.request_refresh()
+    if data_store.is_refreshing():
+        st.caption("Refreshing data in the background; rerun or interact to pick it up")
+    elif data_store.get_refresh_error():
+        st.caption(f"Last refresh failed, showing previous data: {data_store.get_refresh_error()}")
 
 # Main content
 styling.create_header(config.APP_TITLE, config.APP_SUBTITLE)
 
-# Filter data based on selections
-df = st.session_state.df.copy()
+# Filter data based on selections (cached per snapshot, shared read-only across sessions)
+df = views.scoped_data(snapshot, selected_agency, selected_pm)
 
-if selected_agency != "Whole Agency":
-    df = df[df['agency'] == selected_agency]
+# Data version and filter scope, used by dialogs to key their cached views and drill-downs
+st.session_state.data_version = snapshot.version
+st.session_state.data_as_of = snapshot.as_of
+st.session_state.data_scope = (selected_agency, selected_pm)
 
-if selected_pm != "All Managers":
-    df = df[df['portfolio_manager'] == selected_pm]
+# Precomputed trend series for the current filter scope
+trend_cube = snapshot.trend_cube
+trend_scope = trends.get_scope(selected_agency, selected_pm)
 
 # Get data for current and comparison periods
 current_date = pd.Timestamp(current_period)
 comparison_date = pd.Timestamp(comparison_period)
 
-# Find closest dates in dataset
-current_date_actual = df['date'][df['date'] <= current_date].max()
-comparison_date_actual = df['date'][df['date'] <= comparison_date].max()
+# Closest month in the dataset on or before each selected date
+current_date_actual, current_data = views.period_data(snapshot, selected_agency, selected_pm, current_date)
+comparison_date_actual, comparison_data = views.period_data(snapshot, selected_agency, selected_pm, comparison_date)
+st.session_state.data_periods = (current_date_actual, comparison_date_actual)
+
+@st.fragment(run_every=config.EXPORT_POLL_SECONDS)
+def show_job_progress(get_job, job_id: str, label: str):
+    """Poll a running background job; a full rerun swaps in its download button once it finishes"""
+    job = get_job(job_id)
+    if job is None or job['status'] != 'running':
+        st.rerun()
+    finished = job['completed'] + job['failed']
+    st.progress(finished / job['total'], text=f"{label}: {finished}/{job['total']}")
+
+def read_file(path: str) -> bytes:
+    """Deferred download data for a file written by a background job"""
+    with open(path, 'rb') as handle:
+        return handle.read()
 
-current_data = df[df['date'] == current_date_actual]
-comparison_data = df[df['date'] == comparison_date_actual]
+# Search across every PM's drill-down lists; a clicked hit opens its drill-down below
+search_hit = None
+with st.sidebar:
+    search_text = st.text_input("🔍 Search", key="entity_search", placeholder="Address, tenant, landlord or ID").strip()
+    if search_text:
+        search_index = search.get_index(snapshot)
+        hits = search.query(search_index, search_text, selected_agency, selected_pm, limit=config.SEARCH_RESULT_LIMIT)
+        if hits.empty:
+            st.caption("No matches")
+        for position, hit in enumerate(hits.to_dict('records')):
+            if st.button(
+                f"{hit['kind']}: {hit['title']}",
+                key=f"search_hit_{position}",
+                help=f"{hit['detail']} ({hit['record_id']}), {hit['portfolio_manager']}",
+                use_container_width=True
+            ):
+                search_hit = hit
+    st.markdown("---")
+
+# Exports for the current filters and periods: the workbook is built only when
+# clicked, board packs and bulk PM lists run in background worker processes
+with st.sidebar:
+    exports.workbook_download_button(snapshot, selected_agency, selected_pm, current_date_actual, comparison_date_actual)
+
+    board_pack_job = board_pack.get_job(st.session_state.get('board_pack_job', ''))
+    if board_pack_job and board_pack_job['status'] == 'running':
+        show_job_progress(board_pack.get_job, board_pack_job['id'], "Rendering board packs")
+    else:
+        if st.button("📑 Generate Board Packs", use_container_width=True):
+            st.session_state.board_pack_job = board_pack.start_board_packs(
+                snapshot, selected_agency, current_date_actual, comparison_date_actual
+            )
+            st.rerun()
+        if board_pack_job and board_pack_job['errors']:
+            st.caption(f"{board_pack_job['failed']} board pack(s) failed: {board_pack_job['errors'][0]}")
+        if board_pack_job and board_pack_job['files']:
+            st.download_button(
+                "📥 Download Board Packs",
+                data=partial(board_pack.pack_archive, board_pack_job['id']),
+                file_name=f"board_packs_{board_pack.slugify(selected_agency)}_{current_date_actual:%Y_%m}.zip",
+                mime="application/zip",
+                on_click="ignore",
+                use_container_width=True
+            )
+
+    bulk_job = bulk_export.get_job(st.session_state.get('bulk_export_job', ''))
+    if bulk_job and bulk_job['status'] == 'running':
+        show_job_progress(bulk_export.get_job, bulk_job['id'], "Exporting PM lists")
+    else:
+        resume = bulk_job is not None and bulk_job['status'] in ('failed', 'interrupted')
+        if st.button("🗂️ Resume PM List Export" if resume else "🗂️ Export All PM Lists", use_container_width=True):
+            st.session_state.bulk_export_job = bulk_export.start(snapshot, selected_agency, current_date_actual)
+            st.rerun()
+        if bulk_job and bulk_job['errors']:
+            st.caption(f"{bulk_job['failed']} PM export(s) failed: {bulk_job['errors'][0]}")
+        if bulk_job and bulk_job['archive']:
+            st.download_button(
+                "📥 Download PM Lists",
+                data=partial(read_file, bulk_job['archive']),
+                file_name=bulk_job['archive_name'],
+                mime="application/zip",
+                on_click="ignore",
+                use_container_width=True
+            )
 
 # Calculate KPIs
-kpis = {
-    'landlords': current_data['landlords'].sum(),
-    'properties': current_data['properties'].sum(),
-    'leases': current_data['leases'].sum(),
-    'vacancies': current_data['vacancies'].sum(),
-    'avg_occupancy': current_data['occupancy_rate'].mean(),
-    'rent_roll': current_data['rent_roll'].sum(),
-    'total_revenue': current_data['total_revenue'].sum(),
-    'total_arrears': current_data['total_arrears'].sum(),
-    'avg_fee': current_data['avg_fee_per_tenancy'].mean(),
-}
-
-comparison_kpis = {
-    'landlords': comparison_data['landlords'].sum() if not comparison_data.empty else kpis['landlords'],
-    'properties': comparison_data['properties'].sum() if not comparison_data.empty else kpis['properties'],
-    'leases': comparison_data['leases'].sum() if not comparison_data.empty else kpis['leases'],
-    'vacancies': comparison_data['vacancies'].sum() if not comparison_data.empty else kpis['vacancies'],
-    'avg_occupancy': comparison_data['occupancy_rate'].mean() if not comparison_data.empty else kpis['avg_occupancy'],
-    'rent_roll': comparison_data['rent_roll'].sum() if not comparison_data.empty else kpis['rent_roll'],
-    'total_revenue': comparison_data['total_revenue'].sum() if not comparison_data.empty else kpis['total_revenue'],
-    'total_arrears': comparison_data['total_arrears'].sum() if not comparison_data.empty else kpis['total_arrears'],
-}
+kpis = views.period_kpis(snapshot, selected_agency, selected_pm, current_date)
+comparison_kpis = views.period_kpis(snapshot, selected_agency, selected_pm, comparison_date) if not comparison_data.empty else kpis
 
 # Create tabs
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -346,6 +414,10 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
 # Track if a dialog was opened (only allow one per run)
 dialog_opened = False
 
+if search_hit is not None:
+    dialogs.open_search_result(search_hit, pd.Series(search_index.pm_rows[search_hit['portfolio_manager']]))
+    dialog_opened = True
+
 # Initialize session state to track last selection to prevent dialog reopening
 if 'last_selection' not in st.session_state:
     st.session_state.last_selection = None
@@ -429,7 +501,8 @@ with tab1:
             "vs comparison",
             key="rent_roll_btn"
         ):
-            dialogs.show_rent_roll_details(current_data, comparison_data, df)
+            rent_trend = trends.get_group_trend(trend_cube, 'rent_roll', df['portfolio_manager'].unique())
+            dialogs.show_rent_roll_details(current_data, comparison_data, rent_trend)
 
     with col7:
         delta = metrics.calculate_percent_change(kpis['total_arrears'], comparison_kpis['total_arrears'])
@@ -457,6 +530,11 @@ with tab1:
         ):
             dialogs.show_arrears_ratio_details(current_data, comparison_data)
 
+    if not dialog_opened and st.button("🧭 Drill Down: Agency → PM → Landlord → Property", key="portfolio_drill_btn", use_container_width=True):
+        drill_tree = rollup.get_tree(snapshot, current_date_actual)
+        dialogs.open_portfolio_drill(drill_tree, rollup.scope_node(drill_tree, selected_agency, selected_pm))
+        dialog_opened = True
+
     st.markdown("---")
 
     # Charts section
@@ -465,23 +543,19 @@ with tab1:
     col1, col2 = st.columns(2)
 
     with col1:
-        pm_properties = current_data.groupby('portfolio_manager')['properties'].sum().reset_index()
-        pm_properties.columns = ['Portfolio Manager', 'Properties']
-        fig = charts.create_horizontal_bar_chart(
-            pm_properties,
-            'Properties',
-            'Portfolio Manager',
-            'Properties by Portfolio Manager'
+        fig = views.pm_bar_chart(
+            snapshot, selected_agency, selected_pm, current_date,
+            'properties', 'Properties', 'Properties by Portfolio Manager'
         )
-        properties_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="properties_chart")
+        properties_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="properties_chart")
 
         if not dialog_opened and properties_event and len(properties_event.selection.get("points", [])) > 0:
-            selected_pm = properties_event.selection["points"][0]["y"]
-            selection_key = f"properties_{selected_pm}"
+            selected_pm_name = properties_event.selection["points"][0]["y"]
+            selection_key = f"properties_{selected_pm_name}"
             if st.session_state.last_selection != selection_key:
                 st.session_state.last_selection = selection_key
-                pm_data = current_data[current_data['portfolio_manager'] == selected_pm].iloc[0]
-                dialogs.show_pm_property_list(pm_data, selected_pm)
+                pm_data = current_data[current_data['portfolio_manager'] == selected_pm_name].iloc[0]
+                dialogs.show_pm_property_list(pm_data, selected_pm_name)
                 dialog_opened = True
 
         if not dialog_opened and st.button("📊 View Summary & Download", key="chart_properties_btn", use_container_width=True):
@@ -489,23 +563,19 @@ with tab1:
             dialog_opened = True
 
     with col2:
-        pm_leases = current_data.groupby('portfolio_manager')['leases'].sum().reset_index()
-        pm_leases.columns = ['Portfolio Manager', 'Leases']
-        fig = charts.create_horizontal_bar_chart(
-            pm_leases,
-            'Leases',
-            'Portfolio Manager',
-            'Active Leases by Portfolio Manager'
+        fig = views.pm_bar_chart(
+            snapshot, selected_agency, selected_pm, current_date,
+            'leases', 'Leases', 'Active Leases by Portfolio Manager'
         )
-        leases_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="leases_chart", selection_mode="points")
+        leases_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="leases_chart", selection_mode="points")
 
         if not dialog_opened and leases_event and len(leases_event.selection.get("points", [])) > 0:
-            selected_pm = leases_event.selection["points"][0]["y"]
-            selection_key = f"leases_{selected_pm}"
+            selected_pm_name = leases_event.selection["points"][0]["y"]
+            selection_key = f"leases_{selected_pm_name}"
             if st.session_state.last_selection != selection_key:
                 st.session_state.last_selection = selection_key
-                pm_data = current_data[current_data['portfolio_manager'] == selected_pm].iloc[0]
-                dialogs.show_pm_lease_list(pm_data, selected_pm)
+                pm_data = current_data[current_data['portfolio_manager'] == selected_pm_name].iloc[0]
+                dialogs.show_pm_lease_list(pm_data, selected_pm_name)
                 dialog_opened = True
 
         if not dialog_opened and st.button("📊 View Summary & Download", key="chart_leases_btn", use_container_width=True):
@@ -515,30 +585,16 @@ with tab1:
     col3, col4 = st.columns(2)
 
     with col3:
-        trend_data = df.groupby('date')['properties'].sum().reset_index()
-        fig = charts.create_trend_line_chart(
-            trend_data,
-            'date',
-            'properties',
-            'Property Count Trend',
-            show_area=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = views.trend_chart(snapshot, trend_scope, 'properties', 'Property Count Trend')
+        charts.plotly_chart(fig, use_container_width=True)
         if st.button("📊 View Details & Download", key="chart_property_trend", use_container_width=True):
-            dialogs.show_property_trend_details(df)
+            dialogs.show_property_trend_details(trends.get_trend_summary(trend_cube, trend_scope, 'properties'))
 
     with col4:
-        trend_data = df.groupby('date')['occupancy_rate'].mean().reset_index()
-        fig = charts.create_trend_line_chart(
-            trend_data,
-            'date',
-            'occupancy_rate',
-            'Average Occupancy Rate Trend',
-            show_area=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = views.trend_chart(snapshot, trend_scope, 'occupancy_rate', 'Average Occupancy Rate Trend')
+        charts.plotly_chart(fig, use_container_width=True)
         if st.button("📊 View Details & Download", key="chart_occupancy_trend", use_container_width=True):
-            dialogs.show_occupancy_trend_details(df)
+            dialogs.show_occupancy_trend_details(trends.get_trend_summary(trend_cube, trend_scope, 'occupancy_rate'))
 
 # TAB 2: MANAGEMENT FEES
 with tab2:
@@ -602,46 +658,26 @@ with tab2:
     col1, col2 = st.columns(2)
 
     with col1:
-        revenue_trend = df.groupby('date')['total_revenue'].sum().reset_index()
-        fig = charts.create_trend_line_chart(
-            revenue_trend,
-            'date',
-            'total_revenue',
-            'Total Revenue Trend',
-            show_area=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = views.trend_chart(snapshot, trend_scope, 'total_revenue', 'Total Revenue Trend')
+        charts.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        revenue_breakdown = data_generator.generate_revenue_breakdown(
-            df,
-            selected_pm if selected_pm != "All Managers" else "Whole Agency"
-        )
-        fig = charts.create_donut_chart(
-            revenue_breakdown,
-            'amount',
-            'account_code',
-            'Revenue Breakdown by Account Code'
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    pm_revenue = current_data.groupby('portfolio_manager')['total_revenue'].sum().reset_index()
-    pm_revenue.columns = ['Portfolio Manager', 'Revenue']
-    fig = charts.create_horizontal_bar_chart(
-        pm_revenue,
-        'Revenue',
-        'Portfolio Manager',
-        'Revenue by Portfolio Manager'
+        fig = views.revenue_breakdown_chart(snapshot, selected_agency, selected_pm)
+        charts.plotly_chart(fig, use_container_width=True)
+
+    fig = views.pm_bar_chart(
+        snapshot, selected_agency, selected_pm, current_date,
+        'total_revenue', 'Revenue', 'Revenue by Portfolio Manager'
     )
-    revenue_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="revenue_chart")
+    revenue_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="revenue_chart")
 
     if not dialog_opened and revenue_event and len(revenue_event.selection.get("points", [])) > 0:
-        selected_pm = revenue_event.selection["points"][0]["y"]
-        selection_key = f"revenue_{selected_pm}"
+        selected_pm_name = revenue_event.selection["points"][0]["y"]
+        selection_key = f"revenue_{selected_pm_name}"
         if st.session_state.last_selection != selection_key:
             st.session_state.last_selection = selection_key
-            pm_data = current_data[current_data['portfolio_manager'] == selected_pm].iloc[0]
-            dialogs.show_pm_revenue_details(pm_data, selected_pm)
+            pm_data = current_data[current_data['portfolio_manager'] == selected_pm_name].iloc[0]
+            dialogs.show_pm_revenue_details(pm_data, selected_pm_name)
             dialog_opened = True
 
     if not dialog_opened and st.button("📊 View Summary & Download", key="chart_revenue_pm_btn", use_container_width=True):
@@ -651,33 +687,27 @@ with tab2:
     st.markdown("---")
     styling.create_section_header("Top 10 Landlords by Revenue")
 
-    top_landlords = data_generator.generate_top_landlords(
-        df,
-        selected_pm if selected_pm != "All Managers" else "Whole Agency",
-        limit=10
-    )
+    top_landlords = views.top_landlords(snapshot, selected_agency, selected_pm, current_date, limit=10)
 
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        fig = charts.create_horizontal_bar_chart(
-            top_landlords,
-            'revenue',
-            'landlord_name',
-            'Top 10 Landlords by Revenue'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = views.top_landlords_chart(snapshot, selected_agency, selected_pm, current_date, limit=10)
+        landlords_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="top_landlords_chart")
 
     with col2:
-        st.dataframe(
-            top_landlords.style.format({
-                'properties': '{:,.0f}',
-                'revenue': '${:,.0f}'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(top_landlords, {'properties': 'count', 'revenue': 'currency'})
+
+    if not dialog_opened and landlords_event and len(landlords_event.selection.get("points", [])) > 0:
+        selected_label = landlords_event.selection["points"][0]["y"]
+        selection_key = f"landlord_{selected_label}"
+        matches = top_landlords[landlords.display_names(top_landlords) == selected_label]
+        if st.session_state.last_selection != selection_key and not matches.empty:
+            st.session_state.last_selection = selection_key
+            landlord = matches.iloc[0]
+            pm_data = current_data[current_data['portfolio_manager'] == landlord['portfolio_manager']].iloc[0]
+            dialogs.show_landlord_property_list(pm_data, landlord['portfolio_manager'], landlord['landlord_name'])
+            dialog_opened = True
 
 # TAB 3: ARREARS
 with tab3:
@@ -752,7 +782,7 @@ with tab3:
             ]
         })
         fig = charts.create_arrears_bucket_chart(arrears_buckets, 'Arrears by Days Overdue')
-        arrears_bar_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="arrears_bucket_chart")
+        arrears_bar_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="arrears_bucket_chart")
 
         if not dialog_opened and arrears_bar_event and len(arrears_bar_event.selection.get("points", [])) > 0:
             selected_bucket = arrears_bar_event.selection["points"][0]["x"]
@@ -770,7 +800,7 @@ with tab3:
             'Bucket',
             'Arrears Distribution'
         )
-        arrears_donut_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="arrears_donut_chart")
+        arrears_donut_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="arrears_donut_chart")
 
         if not dialog_opened and arrears_donut_event and len(arrears_donut_event.selection.get("points", [])) > 0:
             selected_bucket = arrears_donut_event.selection["points"][0]["label"]
@@ -780,7 +810,7 @@ with tab3:
                 dialogs.show_arrears_bucket_list(df, selected_bucket, selected_pm)
                 dialog_opened = True
 
-    arrears_trend = df.groupby('date')['total_arrears'].sum().reset_index()
+    arrears_trend = trends.get_trend(trend_cube, trend_scope, 'total_arrears')
     fig = charts.create_trend_line_chart(
         arrears_trend,
         'date',
@@ -788,7 +818,7 @@ with tab3:
         'Total Arrears Trend',
         show_area=True
     )
-    st.plotly_chart(fig, use_container_width=True)
+    charts.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
     styling.create_section_header("Arrears Details")
@@ -798,21 +828,14 @@ with tab3:
         ['All', '0-30', '31-60', '61-90', '90+']
     )
 
-    arrears_details = data_generator.generate_arrears_details(
-        df,
-        selected_pm if selected_pm != "All Managers" else "Whole Agency",
+    arrears_details = views.arrears_details(
+        snapshot,
+        selected_agency,
+        selected_pm,
         None if selected_bucket == 'All' else selected_bucket
     )
 
-    st.dataframe(
-        arrears_details.style.format({
-            'amount_overdue': '${:,.2f}',
-            'days_overdue': '{:.0f}'
-        }),
-        use_container_width=True,
-        hide_index=True,
-        height=400
-    )
+    tables.render_table(arrears_details, {'amount_overdue': 'currency_cents', 'days_overdue': 'count'})
 
 # TAB 4: CRITICAL DATES
 with tab4:
@@ -886,7 +909,7 @@ with tab4:
             'Portfolio Manager',
             'Rent Reviews by Portfolio Manager'
         )
-        rent_reviews_pm_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="rent_reviews_pm_chart")
+        rent_reviews_pm_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="rent_reviews_pm_chart")
 
         if not dialog_opened and rent_reviews_pm_event and len(rent_reviews_pm_event.selection.get("points", [])) > 0:
             selected_pm_name = rent_reviews_pm_event.selection["points"][0]["y"]
@@ -906,7 +929,7 @@ with tab4:
             'Portfolio Manager',
             'Lease Expiries by Portfolio Manager'
         )
-        lease_expiries_pm_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="lease_expiries_pm_chart")
+        lease_expiries_pm_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="lease_expiries_pm_chart")
 
         if not dialog_opened and lease_expiries_pm_event and len(lease_expiries_pm_event.selection.get("points", [])) > 0:
             selected_pm_name = lease_expiries_pm_event.selection["points"][0]["y"]
@@ -923,11 +946,7 @@ with tab4:
     col1, col2 = st.columns(2)
 
     with col1:
-        rent_reviews_details = data_generator.generate_critical_dates_details(
-            df,
-            selected_pm if selected_pm != "All Managers" else "Whole Agency",
-            "rent_reviews"
-        )
+        rent_reviews_details = views.critical_dates_details(snapshot, selected_agency, selected_pm, "rent_reviews")
         fig = charts.create_trend_line_chart(
             rent_reviews_details,
             'month',
@@ -935,14 +954,10 @@ with tab4:
             'Upcoming Rent Reviews (Next 12 Months)',
             show_area=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        lease_expiries_details = data_generator.generate_critical_dates_details(
-            df,
-            selected_pm if selected_pm != "All Managers" else "Whole Agency",
-            "lease_expiries"
-        )
+        lease_expiries_details = views.critical_dates_details(snapshot, selected_agency, selected_pm, "lease_expiries")
         fig = charts.create_trend_line_chart(
             lease_expiries_details,
             'month',
@@ -950,7 +965,7 @@ with tab4:
             'Upcoming Lease Expiries (Next 12 Months)',
             show_area=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
     styling.create_section_header("Detailed Breakdown")
@@ -959,20 +974,16 @@ with tab4:
 
     with col1:
         st.markdown("**Rent Reviews by Month**")
-        st.dataframe(
+        tables.render_table(
             rent_reviews_details[['month', 'count']].rename(columns={'month': 'Month', 'count': 'Count'}),
-            use_container_width=True,
-            hide_index=True,
-            height=400
+            {'Count': 'count'}
         )
 
     with col2:
         st.markdown("**Lease Expiries by Month**")
-        st.dataframe(
+        tables.render_table(
             lease_expiries_details[['month', 'count']].rename(columns={'month': 'Month', 'count': 'Count'}),
-            use_container_width=True,
-            hide_index=True,
-            height=400
+            {'Count': 'count'}
         )
 
 # TAB 5: TASK MANAGEMENT
@@ -1048,15 +1059,15 @@ with tab5:
             'Portfolio Manager',
             'Overdue Diary Items by Portfolio Manager'
         )
-        overdue_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="overdue_chart")
+        overdue_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="overdue_chart")
 
         if not dialog_opened and overdue_event and len(overdue_event.selection.get("points", [])) > 0:
-            selected_pm = overdue_event.selection["points"][0]["y"]
-            selection_key = f"overdue_{selected_pm}"
+            selected_pm_name = overdue_event.selection["points"][0]["y"]
+            selection_key = f"overdue_{selected_pm_name}"
             if st.session_state.last_selection != selection_key:
                 st.session_state.last_selection = selection_key
-                pm_data = current_data[current_data['portfolio_manager'] == selected_pm].iloc[0]
-                dialogs.show_pm_overdue_items_list(pm_data, selected_pm)
+                pm_data = current_data[current_data['portfolio_manager'] == selected_pm_name].iloc[0]
+                dialogs.show_pm_overdue_items_list(pm_data, selected_pm_name)
                 dialog_opened = True
 
         if not dialog_opened and st.button("📊 View Summary & Download", key="chart_overdue_btn", use_container_width=True):
@@ -1074,15 +1085,15 @@ with tab5:
             'Portfolio Manager',
             'Completed Diary Items by Portfolio Manager'
         )
-        completed_event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="completed_chart")
+        completed_event = charts.plotly_chart(fig, use_container_width=True, on_select="rerun", key="completed_chart")
 
         if not dialog_opened and completed_event and len(completed_event.selection.get("points", [])) > 0:
-            selected_pm = completed_event.selection["points"][0]["y"]
-            selection_key = f"completed_{selected_pm}"
+            selected_pm_name = completed_event.selection["points"][0]["y"]
+            selection_key = f"completed_{selected_pm_name}"
             if st.session_state.last_selection != selection_key:
                 st.session_state.last_selection = selection_key
-                pm_data = current_data[current_data['portfolio_manager'] == selected_pm].iloc[0]
-                dialogs.show_pm_completed_items_list(pm_data, selected_pm)
+                pm_data = current_data[current_data['portfolio_manager'] == selected_pm_name].iloc[0]
+                dialogs.show_pm_completed_items_list(pm_data, selected_pm_name)
                 dialog_opened = True
 
         if not dialog_opened and st.button("📊 View Summary & Download", key="chart_completed_btn", use_container_width=True):
@@ -1094,7 +1105,7 @@ with tab5:
     col3, col4 = st.columns(2)
 
     with col3:
-        overdue_trend = df.groupby('date')['overdue_diary_items'].sum().reset_index()
+        overdue_trend = trends.get_trend(trend_cube, trend_scope, 'overdue_diary_items')
         fig = charts.create_trend_line_chart(
             overdue_trend,
             'date',
@@ -1102,10 +1113,10 @@ with tab5:
             'Overdue Items Trend',
             show_area=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     with col4:
-        completed_trend = df.groupby('date')['completed_diary_items'].sum().reset_index()
+        completed_trend = trends.get_trend(trend_cube, trend_scope, 'completed_diary_items')
         fig = charts.create_trend_line_chart(
             completed_trend,
             'date',
@@ -1113,7 +1124,7 @@ with tab5:
             'Completed Items Trend',
             show_area=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
     styling.create_section_header("Diary Item Details")
@@ -1124,21 +1135,30 @@ with tab5:
         horizontal=True
     )
 
-    diary_items = data_generator.generate_diary_items_details(
-        df,
-        selected_pm if selected_pm != "All Managers" else "Whole Agency",
-        status_filter.lower()
-    )
+    diary_items = views.diary_items_details(snapshot, selected_agency, selected_pm, status_filter.lower())
 
-    st.dataframe(
-        diary_items.style.format({
-            'due_date': lambda x: x.strftime('%Y-%m-%d'),
-            'days_overdue': '{:.0f}'
-        }),
-        use_container_width=True,
-        hide_index=True,
-        height=400
-    )
+    tables.render_table(diary_items, {'due_date': 'date', 'days_overdue': 'count'})
 
 # Footer
 styling.create_footer()
+
+# Figure payload sizes (enable with CHART_PAYLOAD_REPORT=1)
+if config.CHART_PAYLOAD_REPORT:
+    with st.sidebar.expander("Chart Payloads"):
+        payload_report = charts.get_payload_report()
+        if not payload_report.empty:
+            st.caption(
+                f"{payload_report['compact_bytes'].sum() / 1024:,.1f} KB sent "
+                f"({payload_report['raw_bytes'].sum() / 1024:,.1f} KB before compaction)"
+            )
+        tables.render_table(payload_report, height="auto")
+
+# Cache and request-coalescing counters (enable with CACHE_STATS_REPORT=1)
+if config.CACHE_STATS_REPORT:
+    with st.sidebar.expander("Cache Stats"):
+        cache_stats = data_store.get_cache_stats()
+        cache_stats.update({f'disk_{name}': value for name, value in disk_cache.get_stats().items()})
+        tables.render_table(
+            pd.DataFrame({'counter': list(cache_stats), 'value': list(cache_stats.values())}),
+            height="auto"
+        )
@@ -22,6 +22,17 @@ USE_MOCK_DATA = True
 
 # Cache configuration (TTL in seconds)
 CACHE_TTL = 3600  # 1 hour
+HISTORY_MONTHS = 24  # Months of history held in each data snapshot
+DATA_AS_OF = os.getenv("DASHBOARD_AS_OF", "")  # Pin the data date (YYYY-MM-DD) for reproducible runs; empty uses today
+VIEW_CACHE_SIZE = 256  # Max cached views/figures per process (LRU)
+WARMUP_ON_START = os.getenv("DASHBOARD_WARMUP", "1") == "1"  # Precompute default views in the background
+DATA_SEGMENT_DIR = os.getenv("DASHBOARD_SEGMENT_DIR", "")  # Shared memory-mapped data for multi-worker hosts; empty keeps data in-process
+DISK_CACHE_PATH = os.getenv(  # Persistent drill-down cache shared by workers; empty disables it
+    "DASHBOARD_DISK_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "drilldowns.sqlite")
+)
+DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024  # LRU eviction above this size
+CACHE_STATS_REPORT = os.getenv("CACHE_STATS_REPORT", "0") == "1"  # Show cache and coalescing counters in the sidebar
 
 # Comparison periods
 COMPARISON_PERIODS = {
@@ -91,9 +102,27 @@ PROPERTY_TYPES = [
     "Medical",
 ]
 
+# Tables
+TABLE_PAGE_SIZE = 100  # Rows sent to the browser per page of a drill-down table
+
+# Landlord rankings
+TOP_LANDLORDS_DEPTH = 25  # Landlords precomputed per agency/PM/month ranking; shorter top-N lists read a prefix
+
+# Search
+SEARCH_RESULT_LIMIT = 8  # Hits listed under the sidebar search box
+
 # Export settings
 EXPORT_PDF_ORIENTATION = "landscape"
 EXPORT_EXCEL_SHEET_NAME = "Dashboard Export"
+EXPORT_CHUNK_ROWS = 50_000  # Rows converted per chunk when writing CSV and Excel exports
+EXPORT_CSV_GZIP_ROWS = 100_000  # Exports with at least this many rows download as .csv.gz; 0 disables
+EXPORT_DIR = os.getenv(  # Generated board packs and bulk exports
+    "DASHBOARD_EXPORT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "exports")
+)
+EXPORT_WORKERS = int(os.getenv("DASHBOARD_EXPORT_WORKERS", "2"))  # Worker processes for background export jobs
+EXPORT_POLL_SECONDS = 1.0  # How often the sidebar refreshes a running job's progress
+EXPORT_RETENTION_HOURS = float(os.getenv("DASHBOARD_EXPORT_RETENTION_HOURS", "24"))  # Finished board packs kept this long
 
 # Styling - Brand-inspired color palette
 PRIMARY_COLOR = "#ffe512"  # Broom Yellow (brand accent)
@@ -108,6 +137,12 @@ NEUTRAL_COLOR = "#7a7a7a"  # Medium gray
 
 CHART_COLORS = ["#ffe512", "#d4b000", "#b89f00", "#9e8700", "#856f00", "#6b5800"]
 
+# Chart performance settings
+CHART_DOWNSAMPLE_THRESHOLD = 1000  # Series longer than this are decimated
+CHART_DOWNSAMPLE_POINTS = 600  # Roughly one point per horizontal pixel of a half-width chart
+CHART_WEBGL_THRESHOLD = 2000  # Charts with more points than this render with WebGL (Scattergl)
+CHART_PAYLOAD_REPORT = os.getenv("CHART_PAYLOAD_REPORT", "0") == "1"  # Track figure JSON bytes per chart
+
 # Date format
 DATE_FORMAT = "%Y-%m-%d"
 DISPLAY_DATE_FORMAT = "%d %b %Y"
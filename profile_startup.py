@@ -0,0 +1,103 @@
+"""
+Startup profiler for the dashboard
+Measures import time and first-render time of a cold worker
+"""
+import argparse
+import ast
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parent
+
+def startup_imports(script: Path = ROOT / "app.py") -> str:
+    """
+    Everything app.py pulls in before it renders anything, as one statement line
+
+    Read from the script's module-level imports, so the profile follows app.py
+    as modules are added instead of drifting from a hand-kept list.
+    """
+    tree = ast.parse(script.read_text(encoding='utf-8'))
+    return "; ".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def profile_imports(top: int) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Run the startup imports in a fresh interpreter with -X importtime
+
+    Args:
+        top: Number of slowest top-level packages to return
+
+    Returns:
+        Tuple of (total import time in ms, [(cumulative ms, package), ...])
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", startup_imports()],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    packages = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries are the ones importtime does not indent
+        if name.startswith(" ") and not name.startswith("  ") and cumulative.strip().isdigit():
+            packages.append((int(cumulative) / 1000, name.strip()))
+
+    total = sum(ms for ms, _ in packages)
+    return total, sorted(packages, reverse=True)[:top]
+
+def profile_first_render() -> Tuple[float, float]:
+    """
+    Time the first (cold) and second (warm) script run with Streamlit's AppTest
+
+    Returns:
+        Tuple of (first render ms, second render ms)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+
+    start = time.perf_counter()
+    app.run()
+    first = (time.perf_counter() - start) * 1000
+    if app.exception:
+        raise RuntimeError(f"app.py raised during first render: {app.exception[0].message}")
+
+    start = time.perf_counter()
+    app.run()
+    second = (time.perf_counter() - start) * 1000
+
+    return first, second
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-import-ms", type=float, default=1500, help="Fail if startup imports take longer")
+    parser.add_argument("--max-render-ms", type=float, default=5000, help="Fail if the first render takes longer")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    import_ms, slowest = profile_imports(args.top)
+    print(f"Startup imports: {import_ms:,.0f} ms")
+    for ms, name in slowest:
+        print(f"  {ms:8,.1f} ms  {name}")
+
+    first_ms, second_ms = profile_first_render()
+    print(f"First render:    {first_ms:,.0f} ms")
+    print(f"Second render:   {second_ms:,.0f} ms")
+
+    failures = []
+    if import_ms > args.max_import_ms:
+        failures.append(f"imports {import_ms:,.0f} ms > {args.max_import_ms:,.0f} ms")
+    if first_ms > args.max_render_ms:
+        failures.append(f"first render {first_ms:,.0f} ms > {args.max_render_ms:,.0f} ms")
+
+    if failures:
+        print("Startup budget exceeded: " + "; ".join(failures))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
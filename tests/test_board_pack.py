@@ -0,0 +1,58 @@
+"""
+Board pack jobs
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import config
+from utils import board_pack, data_store, views
+
+def _write_placeholder_pdf(figures, path):
+    """Stands in for Kaleido rendering, which needs a Chrome install"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'%PDF')
+
+def test_job_after_version_change_reloads_stale_worker(tmp_path, monkeypatch):
+    stale = data_store._build_snapshot(pd.Timestamp('2026-01-15'))
+    current = data_store._build_snapshot(pd.Timestamp('2026-01-16'))
+    assert stale.version != current.version
+
+    # Pool worker that loaded its snapshot before the server moved to a new version
+    monkeypatch.setattr(data_store, '_snapshot', stale)
+    monkeypatch.setattr(board_pack, '_executor', ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(board_pack, 'render_pdf', _write_placeholder_pdf)
+    monkeypatch.setattr(config, 'EXPORT_DIR', str(tmp_path))
+
+    current_date, comparison_date = views.default_periods(current)
+    job_id = board_pack.start_board_packs(current, config.AGENCIES[0], current_date, comparison_date)
+    deadline = time.time() + 120
+    while board_pack.get_job(job_id)['status'] == 'running' and time.time() < deadline:
+        time.sleep(0.05)
+
+    job = board_pack.get_job(job_id)
+    assert job['status'] == 'done', job['errors']
+    assert job['completed'] == job['total']
+    assert data_store.get_snapshot().version == current.version
+
+def test_prune_jobs_removes_expired_packs(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'EXPORT_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'EXPORT_RETENTION_HOURS', 1)
+    monkeypatch.setattr(board_pack, '_jobs', {})
+    monkeypatch.setattr(board_pack, '_job_keys', {})
+    now = time.time()
+    for job_id, finished_at in (('old', now - 7200), ('recent', now - 60), ('running', None)):
+        directory = tmp_path / f"board_packs_{job_id}"
+        directory.mkdir()
+        board_pack._jobs[job_id] = {'id': job_id, 'directory': str(directory), 'finished_at': finished_at}
+        board_pack._job_keys[(job_id,)] = job_id
+    # Left by an earlier server process
+    orphan = tmp_path / "board_packs_orphan"
+    orphan.mkdir()
+    os.utime(orphan, (now - 7200, now - 7200))
+
+    board_pack.prune_jobs(now)
+
+    assert sorted(board_pack._jobs) == ['recent', 'running']
+    assert sorted(board_pack._job_keys) == [('recent',), ('running',)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['board_packs_recent', 'board_packs_running']
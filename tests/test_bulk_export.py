@@ -0,0 +1,49 @@
+"""
+Bulk export jobs
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pandas as pd
+import config
+from utils import board_pack, bulk_export, data_store, views
+
+class _BreakingExecutor(ThreadPoolExecutor):
+    """Pool whose workers died after the first export was submitted"""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        if self.submitted > 1:
+            raise BrokenProcessPool("pool broke")
+        return super().submit(*args, **kwargs)
+
+def _wait(job_id: str) -> dict:
+    deadline = time.time() + 120
+    while bulk_export.get_job(job_id)['status'] == 'running' and time.time() < deadline:
+        time.sleep(0.05)
+    return bulk_export.get_job(job_id)
+
+def test_resume_after_broken_pool_finishes_the_export(tmp_path, monkeypatch):
+    snapshot = data_store._build_snapshot(pd.Timestamp('2026-01-15'))
+    broken = _BreakingExecutor()
+    monkeypatch.setattr(board_pack, '_executor', broken)
+    monkeypatch.setattr(config, 'EXPORT_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'EXPORT_WORKERS', 1)
+
+    current_date, _ = views.default_periods(snapshot)
+    job_id = bulk_export.start(snapshot, config.AGENCIES[0], current_date)
+    job = _wait(job_id)
+    assert job['status'] == 'failed'
+    assert job['failed'] == 0 and job['errors'] == [repr(BrokenProcessPool("pool broke"))]
+    # The broken pool was dropped; the resume gets a working one
+    assert board_pack._executor is None
+    monkeypatch.setattr(board_pack, '_executor', ThreadPoolExecutor(max_workers=1))
+
+    job = _wait(bulk_export.start(snapshot, config.AGENCIES[0], current_date))
+    assert job['status'] == 'done', job['errors']
+    assert (job['completed'], job['failed'], job['errors']) == (job['total'], 0, [])
+    assert job['archive'] is not None
@@ -0,0 +1,39 @@
+"""
+Figure compaction and downsampling
+"""
+import numpy as np
+import plotly.graph_objects as go
+import config
+from utils import charts
+
+def test_compact_figure_keeps_raw_size_for_cached_figures(monkeypatch):
+    monkeypatch.setattr(config, 'CHART_PAYLOAD_REPORT', True)
+    fig = go.Figure(go.Scatter(y=[1 / 3, 2 / 3, 1.0] * 50))
+    raw_bytes = charts.figure_payload_size(fig)
+
+    charts.compact_figure(fig)
+    # A cached figure is compacted again on every render; its raw size must not be remeasured
+    charts.compact_figure(fig)
+
+    assert fig._raw_payload_bytes == raw_bytes
+    assert charts.figure_payload_size(fig) < raw_bytes
+
+def _sequential_lttb(x, y, n_out):
+    """Textbook LTTB: one bucket at a time, anchored on the previous pick"""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = [0]
+    for i, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        bx, by = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        ax, ay = x[selected[-1]], y[selected[-1]]
+        areas = np.abs((by - ay) * x[start:end] + (ax - bx) * y[start:end] + (ay * bx - ax * by))
+        selected.append(start + int(np.argmax(areas)))
+    return np.array(selected + [n - 1])
+
+def test_lttb_indices_matches_sequential_lttb():
+    rng = np.random.default_rng(0)
+    for n, n_out in ((50, 3), (1200, 600), (5000, 600), (20000, 1500)):
+        x = np.sort(rng.uniform(0, 1000, n))
+        for y in (np.cumsum(rng.normal(size=n)), rng.normal(size=n), rng.integers(0, 3, n).astype(float)):
+            np.testing.assert_array_equal(charts.lttb_indices(x, y, n_out), _sequential_lttb(x, y, n_out))
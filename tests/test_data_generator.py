@@ -0,0 +1,24 @@
+"""
+Per-PM drill-down lists
+"""
+import pandas as pd
+from utils import data_generator, data_store
+
+def test_lists_agree_with_property_list():
+    snapshot = data_store._build_snapshot(pd.Timestamp('2026-01-15'))
+    df = snapshot.df
+    for row in df[df['date'] == df['date'].max()].head(3).to_dict('records'):
+        pm_data, pm_name = pd.Series(row), row['portfolio_manager']
+        properties = data_generator.generate_property_list(pm_data, pm_name).set_index('Property ID')
+        leases = data_generator.generate_lease_list(pm_data, pm_name, snapshot.as_of)
+        reviews = data_generator.generate_rent_reviews_list(pm_data, pm_name, snapshot.as_of)
+        expiries = data_generator.generate_lease_expiries_list(pm_data, pm_name, snapshot.as_of)
+
+        for rows, rent in ((leases, 'Weekly Rent'), (reviews, 'Current Rent'), (expiries, 'Weekly Rent')):
+            matched = properties.loc[rows['Property ID']]
+            assert (rows['Address'].to_numpy() == matched['Address'].to_numpy()).all()
+            assert (rows[rent].to_numpy() == matched['Weekly Rent'].to_numpy()).all()
+        assert len(reviews) == row['rent_reviews_upcoming']
+        assert len(expiries) == row['lease_expiries_upcoming']
+        tenants = leases.set_index('Lease ID').loc[expiries['Lease ID'], 'Tenant']
+        assert (expiries['Tenant'].to_numpy() == tenants.to_numpy()).all()
@@ -0,0 +1,24 @@
+"""
+Memory-mapped dataset segments
+"""
+import numpy as np
+import pandas as pd
+import config
+from utils import segments
+
+def test_round_trip_keeps_missing_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATA_SEGMENT_DIR', str(tmp_path))
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2026-01-01', '2026-02-01', '2026-03-01']),
+        'agency': ['North', None, 'South'],
+        'properties': [10, 20, 30],
+        'rent_roll': [1.5, np.nan, 3.0],
+    })
+
+    manifest = segments.publish('v1', {'df': df})
+    attached = segments.attach(manifest)['df']
+
+    assert attached['agency'].isna().tolist() == [False, True, False]
+    assert attached['agency'].iloc[2] == 'South'
+    # Copy so numeric columns are plain arrays rather than memory maps
+    pd.testing.assert_frame_equal(attached.copy(deep=True), df, check_dtype=False)
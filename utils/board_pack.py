@@ -0,0 +1,254 @@
+"""
+Landscape PDF board packs rendered in a background process pool
+"""
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import plotly.graph_objects as go
+import config
+from utils import charts, data_store, trends, views
+from utils.data_store import Snapshot
+
+PAGE_SIZES = {'landscape': (1600, 900), 'portrait': (900, 1600)}  # Pixels per page image
+PAGE_RESOLUTION = 150  # Image DPI written into the PDF
+
+# (KPI key, card label, number prefix, number suffix, d3 format, increase is bad)
+KPI_CARDS = [
+    ('landlords', 'Landlords', '', '', ',.0f', False),
+    ('properties', 'Properties', '', '', ',.0f', False),
+    ('leases', 'Leases', '', '', ',.0f', False),
+    ('vacancies', 'Vacancies', '', '', ',.0f', True),
+    ('avg_occupancy', 'Average Occupancy', '', '%', '.1f', False),
+    ('rent_roll', 'Rent Roll', '$', '', ',.0f', False),
+    ('total_revenue', 'Total Revenue', '$', '', ',.0f', False),
+    ('total_arrears', 'Total Arrears', '$', '', ',.0f', True),
+    ('avg_fee', 'Average Fee per Tenancy', '$', '', ',.0f', False),
+]
+
+# job id -> {'id', 'status', 'total', 'completed', 'failed', 'errors', 'files', 'directory', 'started_at', 'finished_at'}
+_jobs: Dict[str, dict] = {}
+# (version, agency, current date, comparison date) -> id of the job producing those packs
+_job_keys: Dict[Tuple, str] = {}
+_jobs_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Process pool shared by export jobs in this server process
+
+    Workers are spawned rather than forked: the Streamlit server is
+    multi-threaded and forking it could copy held locks into the children.
+    """
+    global _executor
+    with _jobs_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=config.EXPORT_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+def discard_broken_executor(exc: BaseException, executor: Optional[ProcessPoolExecutor] = None):
+    """
+    Drop the shared pool if exc says a worker died
+
+    A broken pool refuses all new work, so the next get_executor() call
+    starts a fresh one. Only the given pool (default: the current one) is
+    dropped, so a pool already replaced by another job is left alone.
+    """
+    global _executor
+    if isinstance(exc, BrokenProcessPool):
+        with _jobs_lock:
+            if executor is None or _executor is executor:
+                _executor = None
+
+def slugify(text: str) -> str:
+    """Lower-case file-name fragment: 'Whole Agency' -> 'whole_agency'"""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+def pack_filename(selected_agency: str, selected_pm: str) -> str:
+    """Deterministic PDF name for a pack's scope"""
+    scope = selected_agency if selected_pm == "All Managers" else selected_pm
+    return f"board_pack_{slugify(scope)}.pdf"
+
+def pack_figures(snapshot: Snapshot, selected_agency: str, selected_pm: str,
+                 current_date: pd.Timestamp, comparison_date: pd.Timestamp) -> List[go.Figure]:
+    """KPI cards followed by the key dashboard charts for one agency or PM"""
+    kpis = views.period_kpis(snapshot, selected_agency, selected_pm, current_date)
+    comparison_kpis = views.period_kpis(snapshot, selected_agency, selected_pm, comparison_date)
+    cards = [
+        {
+            'label': label, 'value': float(kpis[key]), 'reference': float(comparison_kpis[key]),
+            'prefix': prefix, 'suffix': suffix, 'valueformat': valueformat, 'inverse': inverse
+        }
+        for key, label, prefix, suffix, valueformat, inverse in KPI_CARDS
+    ]
+    scope_label = selected_agency if selected_pm == "All Managers" else selected_pm
+    figures = [charts.create_kpi_cards_figure(
+        cards, f"{scope_label}: {current_date:%B %Y} vs {comparison_date:%B %Y}"
+    )]
+
+    if selected_pm == "All Managers":
+        figures.append(views.pm_bar_chart(snapshot, selected_agency, selected_pm, current_date,
+                                          'properties', 'Properties', 'Properties by Portfolio Manager'))
+        figures.append(views.pm_bar_chart(snapshot, selected_agency, selected_pm, current_date,
+                                          'total_revenue', 'Revenue', 'Revenue by Portfolio Manager'))
+
+    scope = trends.get_scope(selected_agency, selected_pm)
+    figures.append(views.trend_chart(snapshot, scope, 'properties', 'Property Count Trend'))
+    figures.append(views.trend_chart(snapshot, scope, 'occupancy_rate', 'Average Occupancy Rate Trend'))
+    figures.append(views.trend_chart(snapshot, scope, 'total_revenue', 'Total Revenue Trend'))
+    figures.append(views.revenue_breakdown_chart(snapshot, selected_agency, selected_pm))
+    figures.append(views.top_landlords_chart(snapshot, selected_agency, selected_pm, current_date))
+    return figures
+
+def render_pdf(figures: List[go.Figure], path: Path):
+    """
+    Render figures to PNG with Kaleido and write them as one page each to a PDF
+
+    The file is written under a temporary name and moved into place, so a
+    partially written pack is never picked up.
+    """
+    from PIL import Image  # Only needed in export workers
+
+    width, height = PAGE_SIZES.get(config.EXPORT_PDF_ORIENTATION, PAGE_SIZES['landscape'])
+    pages = []
+    for fig in figures:
+        image = Image.open(io.BytesIO(fig.to_image(format='png', width=width, height=height))).convert('RGBA')
+        # Dashboard figures have transparent backgrounds; flatten them onto white paper
+        page = Image.new('RGB', image.size, 'white')
+        page.paste(image, mask=image.getchannel('A'))
+        pages.append(page)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    pages[0].save(tmp, 'PDF', save_all=True, append_images=pages[1:], resolution=PAGE_RESOLUTION)
+    os.replace(tmp, path)
+
+def _render_pack_task(version: str, as_of: str, selected_agency: str, selected_pm: str,
+                      current_date: pd.Timestamp, comparison_date: pd.Timestamp, path: str) -> str:
+    """Worker-process body: render one pack from the job's data version, reloading it if this worker's is stale"""
+    snapshot = data_store.get_snapshot_version(version, as_of)
+    render_pdf(pack_figures(snapshot, selected_agency, selected_pm, current_date, comparison_date), Path(path))
+    return path
+
+def _on_pack_done(job_id: str, future: Future):
+    """Record a finished pack (or its error) and close the job once every pack is in"""
+    try:
+        path, error = future.result(), None
+    except Exception as exc:  # Record and carry on; one failed PM shouldn't lose the others
+        path, error = None, exc
+        discard_broken_executor(exc)
+    with _jobs_lock:
+        job = _jobs[job_id]
+        if error is None:
+            job['files'].append(path)
+            job['completed'] += 1
+        else:
+            job['failed'] += 1
+            job['errors'].append(repr(error))
+        if job['completed'] + job['failed'] == job['total']:
+            job['status'] = 'done' if job['failed'] == 0 else 'failed'
+            job['finished_at'] = time.time()
+
+def prune_jobs(now: Optional[float] = None):
+    """
+    Forget finished jobs older than EXPORT_RETENTION_HOURS and delete their packs
+
+    Pack directories left by an earlier server process are unknown to this
+    one, so they are removed once their last change is as old.
+    """
+    now = time.time() if now is None else now
+    cutoff = now - config.EXPORT_RETENTION_HOURS * 3600
+    with _jobs_lock:
+        expired = [job for job in _jobs.values() if job['finished_at'] is not None and job['finished_at'] < cutoff]
+        for job in expired:
+            del _jobs[job['id']]
+        for key in [key for key, job_id in _job_keys.items() if job_id not in _jobs]:
+            del _job_keys[key]
+        known = {job['directory'] for job in _jobs.values()}
+
+    directories = {job['directory'] for job in expired}
+    for directory in Path(config.EXPORT_DIR).glob("board_packs_*"):
+        try:
+            if str(directory) not in known and directory.stat().st_mtime < cutoff:
+                directories.add(str(directory))
+        except FileNotFoundError:
+            pass
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def start_board_packs(snapshot: Snapshot, selected_agency: str,
+                      current_date: pd.Timestamp, comparison_date: pd.Timestamp) -> str:
+    """
+    Queue one pack for the agency scope and one per portfolio manager in it
+
+    Returns immediately; packs render in the process pool. Asking again for
+    the same data version, agency and periods returns the existing job
+    unless it failed. Old finished jobs are pruned first (see prune_jobs()).
+
+    Returns:
+        Job id to poll with get_job()
+    """
+    prune_jobs()
+    key = (snapshot.version, selected_agency, current_date, comparison_date)
+    with _jobs_lock:
+        existing = _job_keys.get(key)
+        if existing is not None and _jobs[existing]['status'] != 'failed':
+            return existing
+
+    managers = sorted(views.scoped_data(snapshot, selected_agency, "All Managers")['portfolio_manager'].unique())
+    scopes = [(selected_agency, "All Managers")] + [(selected_agency, pm) for pm in managers]
+    job_id = uuid.uuid4().hex[:12]
+    directory = Path(config.EXPORT_DIR) / f"board_packs_{job_id}"
+    with _jobs_lock:
+        _jobs[job_id] = {
+            'id': job_id,
+            'status': 'running',
+            'total': len(scopes),
+            'completed': 0,
+            'failed': 0,
+            'errors': [],
+            'files': [],
+            'directory': str(directory),
+            'started_at': time.time(),
+            'finished_at': None,
+        }
+        _job_keys[key] = job_id
+
+    executor = get_executor()
+    for agency, pm in scopes:
+        future = executor.submit(
+            _render_pack_task, snapshot.version, snapshot.as_of.isoformat(), agency, pm, current_date, comparison_date,
+            str(directory / pack_filename(agency, pm))
+        )
+        future.add_done_callback(partial(_on_pack_done, job_id))
+    return job_id
+
+def get_job(job_id: str) -> Optional[dict]:
+    """Snapshot of a job's status and progress, or None for an unknown id"""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return None if job is None else dict(job, errors=list(job['errors']), files=sorted(job['files']))
+
+def pack_archive(job_id: str) -> bytes:
+    """Zip of a job's finished packs, in file-name order"""
+    job = get_job(job_id)
+    buffer = io.BytesIO()
+    # PDFs are already compressed; storing them keeps zipping cheap
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for path in job['files'] if job else []:
+            archive.write(path, arcname=os.path.basename(path))
+    return buffer.getvalue()
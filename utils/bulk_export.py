@@ -0,0 +1,215 @@
+"""
+Bulk export of every per-PM drill-down list into one zip archive
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+import config
+from utils import board_pack, data_generator, exports, views
+from utils.data_store import Snapshot
+
+# List name (file name in each PM's folder) -> generator taking (pm_data, pm_name, as_of)
+PM_LISTS = {
+    'properties': lambda pm_data, pm_name, as_of: data_generator.generate_property_list(pm_data, pm_name),
+    'leases': data_generator.generate_lease_list,
+    'overdue_items': lambda pm_data, pm_name, as_of: data_generator.generate_diary_items_list(pm_data, pm_name, "overdue", as_of),
+    'completed_items': lambda pm_data, pm_name, as_of: data_generator.generate_diary_items_list(pm_data, pm_name, "completed", as_of),
+    'rent_reviews': data_generator.generate_rent_reviews_list,
+    'lease_expiries': data_generator.generate_lease_expiries_list,
+}
+
+JOB_RECORD = "job.json"
+ARCHIVE_DATE = (2000, 1, 1, 0, 0, 0)  # Fixed member timestamps: same data, byte-identical archive
+
+# job id -> coordinator thread running it in this process
+_running: Dict[str, threading.Thread] = {}
+_running_lock = threading.Lock()
+
+def job_id_for(version: str, selected_agency: str, date: pd.Timestamp) -> str:
+    """Deterministic job id, so a restarted server finds and resumes the same job"""
+    return hashlib.sha1(repr((version, selected_agency, str(date))).encode('utf-8')).hexdigest()[:12]
+
+def _job_dir(job_id: str) -> Path:
+    return Path(config.EXPORT_DIR) / f"pm_lists_{job_id}"
+
+def _read_record(job_id: str) -> Optional[dict]:
+    try:
+        return json.loads((_job_dir(job_id) / JOB_RECORD).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _write_record(record: dict):
+    """Persist the job record atomically; it is the source of truth for resuming"""
+    record['updated_at'] = time.time()
+    path = _job_dir(record['id']) / JOB_RECORD
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    tmp.write_text(json.dumps(record, indent=2))
+    os.replace(tmp, path)
+
+def _export_pm_lists(pm_data: dict, pm_name: str, as_of: str, directory: str) -> List[str]:
+    """
+    Worker-process body: write every list for one PM as CSV files
+
+    Only the PM's period row is shipped to the worker; the generators are
+    pure functions of it and the as-of date, so workers need no snapshot.
+
+    Returns:
+        Archive member names written, relative to directory
+    """
+    row = pd.Series(pm_data)
+    folder = board_pack.slugify(pm_name)
+    names = []
+    for list_name, generate in PM_LISTS.items():
+        name = f"{folder}/{list_name}.csv"
+        path = Path(directory) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, 'w', encoding='utf-8', newline='') as handle:
+            exports.write_csv(generate(row, pm_name, pd.Timestamp(as_of)), handle)
+        os.replace(tmp, path)
+        names.append(name)
+    return names
+
+def _write_archive(record: dict) -> str:
+    """Stream the finished part files into the zip in name order, one file at a time"""
+    directory = _job_dir(record['id'])
+    parts = directory / "parts"
+    archive_path = directory / record['archive_name']
+    tmp = archive_path.with_name(f".{archive_path.name}.tmp")
+    with zipfile.ZipFile(tmp, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name in sorted(name for names in record['files'].values() for name in names):
+            info = zipfile.ZipInfo(name, date_time=ARCHIVE_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(parts / name, 'rb') as source, archive.open(info, 'w') as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+    os.replace(tmp, archive_path)
+    shutil.rmtree(parts, ignore_errors=True)
+    return str(archive_path)
+
+def _run(record: dict, pm_rows: Dict[str, dict]):
+    """
+    Coordinator thread: keep at most 2 x EXPORT_WORKERS PMs in flight,
+    record each finished PM, then assemble the archive
+    """
+    parts = str(_job_dir(record['id']) / "parts")
+    pending = [pm for pm in record['managers'] if pm not in record['files']]
+    executor = board_pack.get_executor()
+    limit = max(1, config.EXPORT_WORKERS * 2)
+    in_flight = {}
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < limit:
+                pm_name = pending.pop(0)
+                future = executor.submit(_export_pm_lists, pm_rows[pm_name], pm_name, record['as_of'], parts)
+                in_flight[future] = pm_name
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                pm_name = in_flight.pop(future)
+                try:
+                    record['files'][pm_name] = future.result()
+                    record['errors'].pop(pm_name, None)
+                except Exception as exc:  # Keep going; a rerun of the job retries only failed PMs
+                    record['errors'][pm_name] = repr(exc)
+                    board_pack.discard_broken_executor(exc, executor)
+                _write_record(record)
+
+        if record['errors']:
+            record['status'] = 'failed'
+        else:
+            record['archive'] = _write_archive(record)
+            record['status'] = 'done'
+    except Exception as exc:
+        # Kept apart from the per-PM errors, so it doesn't count as a failed PM and a resume clears it
+        record['status'] = 'failed'
+        record['error'] = repr(exc)
+        board_pack.discard_broken_executor(exc, executor)
+    finally:
+        # Together, so start() never sees a finished record for a job it still counts as running
+        with _running_lock:
+            _write_record(record)
+            _running.pop(record['id'], None)
+
+def start(snapshot: Snapshot, selected_agency: str, date: pd.Timestamp) -> str:
+    """
+    Start (or resume) the bulk export for an agency and period
+
+    PMs already recorded as finished in the job record are not exported
+    again, so a job interrupted by a restart or a failure picks up where
+    it stopped. A finished job is returned as-is.
+
+    Returns:
+        Job id to poll with get_job()
+    """
+    job_id = job_id_for(snapshot.version, selected_agency, date)
+    with _running_lock:
+        if job_id in _running:
+            return job_id
+
+        record = _read_record(job_id)
+        if record is not None and record['status'] == 'done' and Path(record['archive']).exists():
+            return job_id
+
+        _, rows = views.period_data(snapshot, selected_agency, "All Managers", date)
+        pm_rows = {row['portfolio_manager']: row for row in rows.to_dict('records')}
+        if record is None:
+            _job_dir(job_id).mkdir(parents=True, exist_ok=True)
+            record = {
+                'id': job_id,
+                'version': snapshot.version,
+                'agency': selected_agency,
+                'date': str(date),
+                'as_of': snapshot.as_of.isoformat(),
+                'managers': sorted(pm_rows),
+                'files': {},
+                'errors': {},
+                'error': None,
+                'archive': None,
+                'archive_name': f"pm_lists_{board_pack.slugify(selected_agency)}_{date:%Y_%m}.zip",
+                'started_at': time.time(),
+            }
+        elif record['status'] == 'done':
+            # The archive was deleted along with its parts; export everything again
+            record.update(files={}, archive=None)
+        record['errors'].pop('job', None)  # Job-level error as stored before it had its own field
+        record.update(status='running', error=None)
+        _write_record(record)
+
+        thread = threading.Thread(target=_run, args=(record, pm_rows), name=f"bulk-export-{job_id}", daemon=True)
+        _running[job_id] = thread
+        thread.start()
+    return job_id
+
+def get_job(job_id: str) -> Optional[dict]:
+    """
+    Progress of a job from its record
+
+    Returns:
+        Dict with id, status, total, completed, failed, errors and archive,
+        or None if the job is unknown. errors lists the per-PM errors and,
+        last, any error that stopped the job itself.
+    """
+    record = _read_record(job_id)
+    if record is None:
+        return None
+    status = record['status']
+    with _running_lock:
+        if status == 'running' and job_id not in _running:
+            status = 'interrupted'  # Left running by a previous server process; start() resumes it
+    return {
+        'id': job_id,
+        'status': status,
+        'total': len(record['managers']),
+        'completed': len(record['files']),
+        'failed': len(record['errors']),
+        'errors': list(record['errors'].values()) + ([record['error']] if record.get('error') else []),
+        'archive': record['archive'] if status == 'done' else None,
+        'archive_name': record['archive_name'],
+    }
@@ -1,14 +1,300 @@
 """
 Chart creation utilities using Plotly
 """
+import re
+import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional
 import config
 
+TEMPLATE_NAME = "dashboard"
+GRID_COLOR = 'rgba(0,0,0,0.05)'
+
+# Shared look for every dashboard figure, registered once at import.
+# Figures reference it by name so per-figure layouts only carry what differs.
+pio.templates[TEMPLATE_NAME] = go.layout.Template(
+    layout=dict(
+        font=dict(family="Lato, sans-serif", size=12, color=config.DARK_COLOR),
+        title=dict(x=0.05, font=dict(family="Playfair Display, serif", size=18, weight=700)),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=400,
+        margin=dict(l=40, r=40, t=60, b=40),
+        legend=dict(title=dict(text=""), orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hoverlabel=dict(align='left'),
+        xaxis=dict(showgrid=False, zeroline=False, automargin=True),
+        yaxis=dict(showgrid=True, gridwidth=1, gridcolor=GRID_COLOR, zeroline=False, automargin=True)
+    )
+)
+pio.templates.default = TEMPLATE_NAME
+
+# Trace attributes that only restate Plotly defaults (mostly added by Plotly Express)
+_DEFAULT_TRACE_ATTRIBUTES = {'xaxis': 'x', 'yaxis': 'y', 'showlegend': True}
+_NUMERIC_TRACE_ATTRIBUTES = ('x', 'y', 'z', 'values', 'text')
+# Trace attribute -> its name in hover/text template placeholders
+_TEMPLATE_VARIABLES = {'x': 'x', 'y': 'y', 'z': 'z', 'values': 'value', 'text': 'text'}
+DEFAULT_DECIMALS = 2  # Kept for values displayed without a fixed precision
+_D3_PRECISION = re.compile(r'\.(\d+)([a-z%]?)$')
+
+# Session state key of the session's last measured payload per figure title
+PAYLOAD_REPORT_KEY = 'chart_payload_report'
+
+def _format_decimals(number_format: Optional[str]) -> int:
+    """
+    Decimals a d3 number format displays: ',.0f' -> 0, '.1%' -> 3
+
+    Formats without a fixed number of decimals (',', '.3s', none) display
+    whatever they are given, so they keep DEFAULT_DECIMALS.
+    """
+    match = _D3_PRECISION.search(number_format or '')
+    if match is None or match.group(2) not in ('', 'f', '%'):
+        return DEFAULT_DECIMALS
+    return int(match.group(1)) + (2 if match.group(2) == '%' else 0)
+
+def _display_decimals(fig: go.Figure, trace, attribute: str) -> int:
+    """
+    Decimals of a trace attribute that the figure can show
+
+    Read from the formats that display it: the hover and text templates'
+    placeholders and, when hover falls back to them, the axis hover/tick
+    format. The magnitude of the values plays no part, so cents survive
+    next to large values unless a format rounds them away.
+    """
+    variable = _TEMPLATE_VARIABLES[attribute]
+    templates = [trace[name] for name in ('hovertemplate', 'texttemplate') if name in trace and trace[name]]
+    formats = [
+        number_format
+        for template in templates
+        for number_format in re.findall(r'%\{' + variable + r'(?::([^}]*))?\}', template)
+    ]
+    axis_name = f'{attribute}axis'
+    if attribute in ('x', 'y') and axis_name in trace and not trace['hovertemplate']:
+        axis = fig.layout[axis_name + (trace[axis_name] or attribute)[1:]]
+        formats.append(axis.hoverformat or axis.tickformat)
+    return max((_format_decimals(number_format) for number_format in formats), default=DEFAULT_DECIMALS)
+
+def compact_array(values, decimals: int = DEFAULT_DECIMALS):
+    """
+    Round a numeric array to display precision and use the smallest lossless dtype
+
+    Non-numeric values (dates, labels, mixed lists) are returned unchanged.
+
+    Args:
+        values: Trace data
+        decimals: Decimals the figure displays (see _display_decimals())
+    """
+    if values is None or isinstance(values, str):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind not in 'fiu' or array.size == 0:
+        return values
+
+    if array.dtype.kind == 'f':
+        array = np.round(array, decimals)
+        finite = array[np.isfinite(array)]
+        if finite.size == array.size and np.array_equal(finite, np.round(finite)):
+            array = array.astype(np.int64)
+        else:
+            as_float32 = array.astype(np.float32)
+            if np.allclose(as_float32, array, rtol=0, atol=0.005, equal_nan=True):
+                array = as_float32
+
+    if array.dtype.kind in 'iu' and array.size:
+        if np.iinfo(np.int32).min <= array.min() and array.max() <= np.iinfo(np.int32).max:
+            array = array.astype(np.int32)
+
+    return array
+
+def compact_figure(fig: go.Figure) -> go.Figure:
+    """
+    Trim a figure's JSON payload before it is sent to the browser
+
+    Rounds numeric trace data to the precision its formats display, casts it to int32 or
+    float32 where that is lossless at that precision, and drops trace
+    attributes that only restate Plotly defaults. Safe to call repeatedly;
+    figures that were already compacted (e.g. cached ones shared across
+    sessions) are returned untouched.
+
+    While CHART_PAYLOAD_REPORT is enabled, the size before compaction is
+    kept on the figure, so plotly_chart() reports it for cached figures too.
+    """
+    if getattr(fig, '_compacted', False):
+        return fig
+    if config.CHART_PAYLOAD_REPORT:
+        fig._raw_payload_bytes = figure_payload_size(fig)
+    for trace in fig.data:
+        for attribute in _NUMERIC_TRACE_ATTRIBUTES:
+            if attribute in trace and trace[attribute] is not None:
+                trace[attribute] = compact_array(trace[attribute], _display_decimals(fig, trace, attribute))
+        for attribute, default in _DEFAULT_TRACE_ATTRIBUTES.items():
+            if attribute in trace and trace[attribute] == default:
+                trace[attribute] = None
+    fig._compacted = True
+    return fig
+
+def figure_payload_size(fig: go.Figure) -> int:
+    """Size in bytes of the figure JSON that st.plotly_chart sends over the websocket"""
+    return len(pio.to_json(fig, validate=False).encode('utf-8'))
+
+def get_payload_report() -> pd.DataFrame:
+    """This session's per-figure payload sizes, recorded while CHART_PAYLOAD_REPORT is enabled"""
+    report = pd.DataFrame.from_dict(st.session_state.get(PAYLOAD_REPORT_KEY, {}), orient='index')
+    return report.rename_axis('figure').reset_index()
+
+def plotly_chart(fig: go.Figure, **kwargs):
+    """
+    Compact a figure and render it with st.plotly_chart using the dashboard template
+
+    Streamlit's own chart theme is disabled because it would override the
+    template's fonts and colours in the browser.
+    """
+    compact_figure(fig)
+
+    # Figures compacted while the report was off have no raw size, so they are left out
+    raw_bytes = getattr(fig, '_raw_payload_bytes', None)
+    if config.CHART_PAYLOAD_REPORT and raw_bytes is not None:
+        # Per session, so concurrent sessions don't mix their figures into one report
+        payload_report = st.session_state.setdefault(PAYLOAD_REPORT_KEY, {})
+        title = fig.layout.title.text or kwargs.get('key') or f"figure {len(payload_report) + 1}"
+        payload_report[title] = {
+            'traces': len(fig.data),
+            'raw_bytes': raw_bytes,
+            'compact_bytes': figure_payload_size(fig)
+        }
+
+    return st.plotly_chart(fig, theme=None, **kwargs)
+
+def _numeric_axis(values) -> np.ndarray:
+    """Convert x values (dates, numbers or labels) to floats for downsampling"""
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.astype('datetime64[ns]').astype('int64').to_numpy(dtype=float)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float)
+    return np.arange(len(values), dtype=float)
+
+def _line_coefficients(ax, ay, bx, by):
+    """(c1, c2, c0) such that |c1 * px + c2 * py + c0| is twice the area of triangle A-B-P"""
+    return by - ay, ax - bx, ay * bx - ax * by
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with largest-triangle-three-buckets (LTTB) downsampling
+
+    Each bucket keeps the point forming the largest triangle with the point
+    kept in the previous bucket and the next bucket's average. That chain
+    is sequential, so it is solved by iteration: every pass scores all
+    buckets at once in flat numpy arrays, anchored on the previous pass's
+    picks (the first on bucket averages), and a pick whose anchor has
+    stopped changing is final. Passes continue while they settle at least
+    half of the remaining buckets; a sequential sweep then recomputes only
+    the buckets whose anchor still moved. The result is exact LTTB.
+
+    Args:
+        x: Numeric x values, sorted ascending
+        y: Numeric y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted array of indices into x/y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    starts, ends = edges[:-1], edges[1:]
+
+    # Bucket averages in one pass via cumulative sums
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = ends - starts
+    avg_x = np.append((cum_x[ends] - cum_x[starts]) / counts, x[-1])
+    avg_y = np.append((cum_y[ends] - cum_y[starts]) / counts, y[-1])
+    next_x, next_y = avg_x[1:], avg_y[1:]  # Third corner of each bucket's triangles
+    inner_x, inner_y = x[1:-1], y[1:-1]
+
+    def pick(ax, ay):
+        """Index of the largest triangle in every bucket, for per-bucket anchors"""
+        c1, c2, c0 = (np.repeat(c, counts) for c in _line_coefficients(ax, ay, next_x, next_y))
+        areas = np.abs(c1 * inner_x + c2 * inner_y + c0)
+        nan = np.isnan(areas)
+        if nan.any():  # A NaN maximum would match no point and lose its bucket
+            areas[nan] = -1.0
+        is_max = np.flatnonzero(areas == np.repeat(np.maximum.reduceat(areas, starts - 1), counts)) + 1
+        bucket = np.searchsorted(ends, is_max, side='right')
+        return is_max[np.r_[True, bucket[1:] != bucket[:-1]]]  # First maximum, as np.argmax
+
+    # anchors[i] is the point bucket i's pick was scored against
+    anchors = np.r_[0, pick(np.r_[x[0], avg_x[:-2]], np.r_[y[0], avg_y[:-2]])[:-1]]
+    selected = pick(x[anchors], y[anchors])
+    unsettled = len(selected)
+    while True:
+        stale = np.count_nonzero(anchors[1:] != selected[:-1])
+        if stale == 0 or stale > unsettled // 2:
+            break
+        unsettled = stale
+        anchors = np.r_[0, selected[:-1]]
+        selected = pick(x[anchors], y[anchors])
+
+    stale = np.flatnonzero(anchors[1:] != selected[:-1]) + 1
+    for i in range(stale[0] if stale.size else len(selected), len(selected)):
+        a = selected[i - 1]
+        if anchors[i] != a:
+            start, end = starts[i], ends[i]
+            c1, c2, c0 = _line_coefficients(x[a], y[a], next_x[i], next_y[i])
+            selected[i] = start + int(np.argmax(np.abs(c1 * x[start:end] + c2 * y[start:end] + c0)))
+            anchors[i] = a
+
+    return np.r_[0, selected, n - 1]
+
+def downsample_series(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    group_col: Optional[str] = None,
+    n_out: Optional[int] = None,
+    threshold: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Reduce each series to a pixel-appropriate number of points
+
+    Series at or below the threshold are returned untouched, so the
+    monthly dashboard data passes straight through.
+    """
+    n_out = n_out or config.CHART_DOWNSAMPLE_POINTS
+    threshold = threshold or config.CHART_DOWNSAMPLE_THRESHOLD
+
+    groups = [df] if group_col is None else [g for _, g in df.groupby(group_col, sort=False)]
+    if all(len(g) <= threshold for g in groups):
+        return df
+
+    parts = []
+    for group in groups:
+        if len(group) <= threshold:
+            parts.append(group)
+            continue
+        group = group.dropna(subset=[y_col]).sort_values(x_col, kind='stable')
+        keep = lttb_indices(_numeric_axis(group[x_col]), group[y_col].to_numpy(dtype=float), n_out)
+        parts.append(group.iloc[keep])
+
+    return pd.concat(parts)
+
+def use_webgl(num_points: int) -> bool:
+    """Whether a chart with this many points should render with WebGL"""
+    return num_points > config.CHART_WEBGL_THRESHOLD
+
+def _scatter_trace(num_points: int):
+    """Scatter trace class for the given point count (SVG or WebGL)"""
+    return go.Scattergl if use_webgl(num_points) else go.Scatter
+
 def create_comparison_bar_chart(
     df: pd.DataFrame,
     x_col: str,
@@ -39,26 +325,77 @@ def create_comparison_bar_chart(
     ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
+        template=TEMPLATE_NAME,
+        title_text=title,
         barmode='group',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
-        hovermode='x unified',
-        height=400,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=40, r=40, t=60, b=40)
+        hovermode='x unified'
     )
 
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
+    return fig
+
+def create_period_comparison_chart(
+    breakdown: pd.DataFrame,
+    title: str,
+    x_title: Optional[str] = None,
+    y_col: str = 'Portfolio Manager'
+) -> go.Figure:
+    """Create a horizontal grouped bar chart of comparison vs current period (drill-down dialogs)"""
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Comparison Period',
+        y=breakdown[y_col],
+        x=breakdown['Comparison Period'],
+        orientation='h',
+        marker=dict(color=config.SECONDARY_COLOR)
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Current Period',
+        y=breakdown[y_col],
+        x=breakdown['Current Period'],
+        orientation='h',
+        marker=dict(color=config.PRIMARY_COLOR)
+    ))
+
+    fig.update_layout(
+        template=TEMPLATE_NAME,
+        title=dict(text=title, font_size=16),
+        barmode='group',
+        xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title=x_title),
+        yaxis=dict(showgrid=False)
+    )
+
+    return fig
+
+def create_area_trend_chart(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    title: str,
+    x_title: Optional[str] = None,
+    y_title: Optional[str] = None
+) -> go.Figure:
+    """Create a filled line chart for a single trend series (drill-down dialogs)"""
+
+    df = downsample_series(df, x_col, y_col)
+
+    fig = go.Figure(_scatter_trace(len(df))(
+        x=df[x_col],
+        y=df[y_col],
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color=config.PRIMARY_COLOR, width=2),
+        fillcolor='rgba(255, 229, 18, 0.3)'
+    ))
+
+    fig.update_layout(
+        template=TEMPLATE_NAME,
+        title=dict(text=title, font_size=16),
+        xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title=x_title),
+        yaxis=dict(gridcolor='#e5e5e0', title=y_title)
+    )
 
     return fig
 
@@ -72,7 +409,30 @@ def create_trend_line_chart(
 ) -> go.Figure:
     """Create a line chart showing trends over time"""
 
-    if group_col:
+    df = downsample_series(df, x_col, y_col, group_col)
+
+    if group_col and use_webgl(len(df)):
+        # WebGL lines, one trace per group so each keeps its colour and legend entry.
+        # Dates go out as epoch milliseconds on a date axis, which serialize far smaller than ISO strings.
+        df = df.sort_values(x_col, kind='stable')
+        is_date = pd.api.types.is_datetime64_any_dtype(df[x_col])
+        if is_date:
+            df = df.assign(**{x_col: df[x_col].astype('datetime64[ms]').astype('int64')})
+        fig = go.Figure([
+            go.Scattergl(
+                x=group[x_col].to_numpy(),
+                y=group[y_col].to_numpy(),
+                name=str(name),
+                mode='lines',
+                line=dict(width=2),
+                hovertemplate=f'<b>{name}</b><br>%{{x}}<br>%{{y:,}}<extra></extra>'
+            )
+            for name, group in df.groupby(group_col, sort=False)
+        ])
+        if is_date:
+            fig.update_xaxes(type='date')
+    elif group_col:
+        import plotly.express as px  # Heaviest plotly module, so imported on first use
         fig = px.line(
             df,
             x=x_col,
@@ -89,7 +449,7 @@ def create_trend_line_chart(
     else:
         fig = go.Figure()
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(_scatter_trace(len(df))(
             x=df[x_col],
             y=df[y_col],
             mode='lines+markers',
@@ -100,27 +460,12 @@ def create_trend_line_chart(
         ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
+        template=TEMPLATE_NAME,
+        title_text=title,
         hovermode='x unified',
-        height=400,
-        legend=dict(
-            title="",
-            orientation="v",
-            yanchor="top",
-            y=1,
-            xanchor="left",
-            x=1.02
-        ),
-        margin=dict(l=40, r=40, t=60, b=40)
+        legend=dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.02)
     )
 
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-
     return fig
 
 def create_horizontal_bar_chart(
@@ -136,6 +481,7 @@ def create_horizontal_bar_chart(
     df_sorted = df.sort_values(x_col, ascending=True)
 
     if color_col:
+        import plotly.express as px
         fig = px.bar(
             df_sorted,
             x=x_col,
@@ -158,19 +504,15 @@ def create_horizontal_bar_chart(
         ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
+        template=TEMPLATE_NAME,
+        title_text=title,
         height=max(400, len(df) * 40),
         showlegend=False if not color_col else True,
-        margin=dict(l=150, r=40, t=60, b=40)
+        margin=dict(l=150),
+        xaxis=dict(showgrid=True, gridwidth=1, gridcolor=GRID_COLOR),
+        yaxis=dict(showgrid=False)
     )
 
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-    fig.update_yaxes(showgrid=False)
-
     return fig
 
 def create_donut_chart(
@@ -195,21 +537,56 @@ def create_donut_chart(
     )])
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
-        height=400,
+        template=TEMPLATE_NAME,
+        title_text=title,
         showlegend=True,
-        legend=dict(
-            orientation="v",
-            yanchor="middle",
-            y=0.5,
-            xanchor="left",
-            x=1.02
-        ),
-        margin=dict(l=40, r=120, t=60, b=40)
+        legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.02),
+        margin=dict(r=120)
+    )
+
+    return fig
+
+def create_kpi_cards_figure(cards: List[Dict], title: str, columns: int = 3) -> go.Figure:
+    """
+    Grid of KPI "cards" (value and change vs comparison) for static export
+
+    Args:
+        cards: Dicts with label, value, reference and optional prefix, suffix,
+            valueformat and inverse (True when an increase is bad, e.g. arrears)
+        title: Figure title
+        columns: Cards per row
+    """
+    rows = -(-len(cards) // columns)
+    fig = go.Figure()
+    for position, card in enumerate(cards):
+        good, bad = config.SUCCESS_COLOR, config.DANGER_COLOR
+        if card.get('inverse'):
+            good, bad = bad, good
+        fig.add_trace(go.Indicator(
+            mode='number+delta',
+            value=card['value'],
+            number=dict(
+                prefix=card.get('prefix', ''),
+                suffix=card.get('suffix', ''),
+                valueformat=card.get('valueformat', ',.0f'),
+                font=dict(size=40)
+            ),
+            delta=dict(
+                reference=card['reference'],
+                relative=True,
+                valueformat='.1%',
+                increasing=dict(color=good),
+                decreasing=dict(color=bad)
+            ),
+            title=dict(text=card['label'], font=dict(size=16)),
+            domain=dict(row=position // columns, column=position % columns)
+        ))
+
+    fig.update_layout(
+        template=TEMPLATE_NAME,
+        title_text=title,
+        grid=dict(rows=rows, columns=columns, pattern='independent'),
+        margin=dict(l=40, r=40, t=100, b=40)
     )
 
     return fig
@@ -222,6 +599,7 @@ def create_stacked_bar_chart(
     title: str
 ) -> go.Figure:
     """Create a stacked bar chart"""
+    import plotly.express as px
 
     fig = px.bar(
         df,
@@ -234,27 +612,11 @@ def create_stacked_bar_chart(
     )
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
-        hovermode='x unified',
-        height=400,
-        legend=dict(
-            title="",
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=40, r=40, t=60, b=40)
+        template=TEMPLATE_NAME,
+        title_text=title,
+        hovermode='x unified'
     )
 
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-
     return fig
 
 def create_heatmap(
@@ -286,14 +648,10 @@ def create_heatmap(
     ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
-        height=400,
+        template=TEMPLATE_NAME,
+        title_text=title,
         xaxis={'side': 'bottom'},
-        margin=dict(l=150, r=40, t=60, b=80)
+        margin=dict(l=150, b=80)
     )
 
     return fig
@@ -330,14 +688,11 @@ def create_waterfall_chart(
     ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
+        template=TEMPLATE_NAME,
+        title_text=title,
         showlegend=False,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
         height=450,
-        margin=dict(l=40, r=40, t=60, b=80)
+        margin=dict(b=80)
     )
 
     return fig
@@ -361,21 +716,13 @@ def create_arrears_bucket_chart(
     ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
+        template=TEMPLATE_NAME,
+        title_text=title,
         showlegend=False,
-        height=400,
         xaxis_title="Days Overdue",
-        yaxis_title="Amount ($)",
-        margin=dict(l=40, r=40, t=60, b=40)
+        yaxis_title="Amount ($)"
     )
 
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-
     return fig
 
 def create_multi_metric_chart(
@@ -389,9 +736,10 @@ def create_multi_metric_chart(
     fig = go.Figure()
 
     for i, metric in enumerate(metrics):
-        fig.add_trace(go.Scatter(
-            x=df[x_col],
-            y=df[metric],
+        series = downsample_series(df[[x_col, metric]], x_col, metric)
+        fig.add_trace(_scatter_trace(len(series))(
+            x=series[x_col],
+            y=series[metric],
             mode='lines+markers',
             name=metric,
             line=dict(width=3, color=config.CHART_COLORS[i % len(config.CHART_COLORS)]),
@@ -400,26 +748,12 @@ def create_multi_metric_chart(
         ))
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
+        template=TEMPLATE_NAME,
+        title_text=title,
         hovermode='x unified',
-        height=450,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        margin=dict(l=40, r=40, t=60, b=40)
+        height=450
     )
 
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-
     return fig
 
 def create_scatter_matrix(
@@ -432,6 +766,7 @@ def create_scatter_matrix(
     title: str
 ) -> go.Figure:
     """Create a scatter plot with size and color dimensions"""
+    import plotly.express as px
 
     fig = px.scatter(
         df,
@@ -442,20 +777,15 @@ def create_scatter_matrix(
         hover_name=hover_name_col,
         title=title,
         color_continuous_scale='RdYlGn',
-        labels={x_col: x_col, y_col: y_col, color_col: color_col}
+        labels={x_col: x_col, y_col: y_col, color_col: color_col},
+        render_mode='webgl' if use_webgl(len(df)) else 'svg'
     )
 
     fig.update_layout(
-        title={'text': title, 'font': {'size': 18, 'weight': 700}},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-        title_font=dict(family="Playfair Display, serif"),
+        template=TEMPLATE_NAME,
+        title_text=title,
         height=450,
-        margin=dict(l=40, r=40, t=60, b=40)
+        xaxis=dict(showgrid=True)
     )
 
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.05)')
-
     return fig
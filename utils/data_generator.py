@@ -1,40 +1,193 @@
 """
 Mock data generation for the dashboard
 """
-import pandas as pd
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 import random
-from typing import List, Dict
+import zlib
+from typing import List, Dict, Optional, Tuple
 import config
 
-def generate_historical_data(months: int = 24) -> pd.DataFrame:
+def resolve_as_of(as_of: Optional[datetime] = None) -> pd.Timestamp:
+    """As-of date for generated data: the given date, or today, at midnight"""
+    return pd.Timestamp(as_of if as_of is not None else datetime.now()).normalize()
+
+def stable_seed(*parts) -> int:
+    """Seed derived from the parts' text; unlike hash() it is the same in every process"""
+    return zlib.crc32("|".join(str(part) for part in parts).encode('utf-8'))
+
+def _record_id(prefix: str, pm_name: str, index: int, series: str = "") -> str:
+    """
+    Record identifier unique across the dataset, such as PROP-03-0042
+
+    Built from the PM's position in config.PORTFOLIO_MANAGERS, an optional
+    series letter (for lists that aren't the PM's main property or lease
+    book) and the row index, so ids never collide the way a hash would.
+    """
+    return f"{prefix}-{config.PORTFOLIO_MANAGERS.index(pm_name):02d}-{series}{index:04d}"
+
+LANDLORD_FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+                        "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica"]
+LANDLORD_LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+                       "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor"]
+
+def landlord_names(pm_name: str, count: int) -> List[str]:
+    """Distinct, deterministic names for the landlords in a PM's book"""
+    rng = random.Random(stable_seed(pm_name, "landlord_names"))
+    names = [f"{first} {last}" for first in LANDLORD_FIRST_NAMES for last in LANDLORD_LAST_NAMES]
+    rng.shuffle(names)
+    # Past 256 landlords the names repeat with a number so they stay distinct
+    return [names[i % len(names)] + (f" ({i // len(names) + 1})" if i >= len(names) else "") for i in range(count)]
+
+def property_owners(pm_name: str, num_properties: int, num_landlords: int) -> Tuple[List[str], List[int]]:
+    """
+    Landlords in a PM's book and the owner of each property
+
+    Every landlord owns at least one property; the rest go mostly to the
+    first (larger) landlords.
+
+    Returns:
+        Tuple of (landlord names, index into them for each property)
+    """
+    num_landlords = max(1, min(num_landlords, num_properties))
+    owner_rng = random.Random(stable_seed(pm_name, "owners"))
+    owners = list(range(num_landlords)) + owner_rng.choices(
+        range(num_landlords), weights=[1 / (k + 1) for k in range(num_landlords)], k=max(0, num_properties - num_landlords)
+    )
+    owner_rng.shuffle(owners)
+    return landlord_names(pm_name, num_landlords), owners
+
+ARREARS_BUCKETS = {  # PM-month column -> days overdue range (inclusive)
+    'arrears_0_30': (1, 30),
+    'arrears_31_60': (31, 60),
+    'arrears_61_90': (61, 90),
+    'arrears_90_plus': (91, 365),
+}
+
+def _property_draws(pm_name: str, date: datetime, num_properties: int) -> Dict[str, np.ndarray]:
+    """Column arrays of property_facts()"""
+    # One uniform draw per property, so property i gets the same rent whatever the size of the book
+    rent_rng = np.random.default_rng(stable_seed(pm_name, "rent"))
+    weekly_rent = 350 + (rent_rng.random(num_properties) * 851).astype(np.int64)
+
+    rng = np.random.default_rng(stable_seed(pm_name, pd.Timestamp(date).strftime('%Y-%m'), "facts"))
+    occupancy = rng.uniform(0.80, 0.95)
+    # Tenants in arrears owe about a month's rent on average, so this share owes 2-8% of the rent roll
+    arrears_rate = rng.uniform(0.02, 0.08)
+    leased = rng.random(num_properties) < occupancy
+    in_arrears = leased & (rng.random(num_properties) < arrears_rate)
+    days_overdue = np.where(in_arrears, np.ceil(120 * rng.random(num_properties) ** 3), 0).astype(np.int64)
+
+    return {
+        'property_index': np.arange(num_properties),
+        'leased': leased,
+        'weekly_rent': weekly_rent,
+        'arrears': np.round(weekly_rent * days_overdue / 7, 2),
+        'days_overdue': days_overdue,
+    }
+
+def property_facts(pm_name: str, date: datetime, num_properties: int) -> pd.DataFrame:
+    """
+    One PM's properties in one month: lease status, weekly rent and arrears
+
+    Every draw is seeded by the PM and month alone, so a PM's slice can be
+    rebuilt on its own (e.g. by a property list in an export worker) and
+    always matches the full fact table. Properties are numbered from 0 and
+    keep their rent from month to month.
+
+    Returns:
+        DataFrame with property_index, leased, weekly_rent, arrears and
+        days_overdue columns, one row per property
+    """
+    return pd.DataFrame(_property_draws(pm_name, date, num_properties))
+
+def generate_property_facts(pm_months: pd.DataFrame) -> pd.DataFrame:
+    """
+    Property-month fact table: the source of truth for stock, rent and arrears
+
+    Args:
+        pm_months: One row per PM-month with date, portfolio_manager and properties
+
+    Returns:
+        property_facts() rows for every PM-month, with pm_code (position in
+        config.PORTFOLIO_MANAGERS) and month_code (position among the
+        sorted distinct dates) identifying the PM-month
+    """
+    months = np.sort(pm_months['date'].unique())
+    columns: Dict[str, List[np.ndarray]] = {'pm_code': [], 'month_code': []}
+    for row in pm_months[['date', 'portfolio_manager', 'properties']].to_dict('records'):
+        num_properties = int(row['properties'])
+        columns['pm_code'].append(np.full(num_properties, config.PORTFOLIO_MANAGERS.index(row['portfolio_manager'])))
+        columns['month_code'].append(np.full(num_properties, np.searchsorted(months, np.datetime64(row['date']))))
+        for column, values in _property_draws(row['portfolio_manager'], row['date'], num_properties).items():
+            columns.setdefault(column, []).append(values)
+    return pd.DataFrame({column: np.concatenate(parts) for column, parts in columns.items()})
+
+def aggregate_property_facts(facts: pd.DataFrame, num_months: int) -> pd.DataFrame:
+    """
+    PM-month totals of a fact table in one np.bincount pass per measure
+
+    Args:
+        facts: generate_property_facts() output
+        num_months: Number of distinct months (month codes) in the table
+
+    Returns:
+        DataFrame indexed by pm_code * num_months + month_code with
+        properties, leases, vacancies, rent_roll (monthly), total_arrears
+        and the ARREARS_BUCKETS columns
+    """
+    codes = facts['pm_code'].to_numpy() * num_months + facts['month_code'].to_numpy()
+    size = len(config.PORTFOLIO_MANAGERS) * num_months
+
+    def total(weights=None) -> np.ndarray:
+        return np.bincount(codes, weights=weights, minlength=size)
+
+    leased = facts['leased'].to_numpy()
+    arrears = facts['arrears'].to_numpy()
+    days_overdue = facts['days_overdue'].to_numpy()
+    totals = pd.DataFrame({
+        'properties': total(),
+        'leases': total(leased.astype(np.float64)).astype(np.int64),
+        'rent_roll': total(np.where(leased, facts['weekly_rent'].to_numpy() * 52 / 12, 0.0)),
+        'total_arrears': total(arrears),
+    })
+    totals.insert(2, 'vacancies', totals['properties'] - totals['leases'])
+    for column, (low, high) in ARREARS_BUCKETS.items():
+        totals[column] = total(np.where((days_overdue >= low) & (days_overdue <= high), arrears, 0.0))
+    return totals
+
+def generate_historical_data(months: int = 24, as_of: Optional[datetime] = None) -> pd.DataFrame:
     """
     Generate comprehensive mock historical data for the dashboard
 
+    Property counts, leases, vacancies, rent roll and arrears are summed from
+    the property-month fact table, so they reconcile with the property and
+    lease drill-downs; fees and activity counts are drawn per PM-month.
+
     Args:
         months: Number of months of historical data to generate
+        as_of: Date the data runs up to (default: today)
 
     Returns:
         DataFrame with comprehensive property management data
     """
-    np.random.seed(42)
-    random.seed(42)
+    rng = random.Random(42)
 
     # Generate date range
-    end_date = datetime.now()
+    end_date = resolve_as_of(as_of)
     start_date = end_date - timedelta(days=months * 30)
     date_range = pd.date_range(start=start_date, end=end_date, freq='MS')
 
     data = []
 
     for pm in config.PORTFOLIO_MANAGERS:
-        agency = random.choice(config.AGENCIES)
+        agency = rng.choice(config.AGENCIES)
 
         # Generate trend for this PM (some growing, some stable, some declining)
-        base_landlords = random.randint(20, 80)
-        base_properties = random.randint(50, 300)
-        trend = random.choice(['growing', 'stable', 'declining'])
+        base_landlords = rng.randint(20, 80)
+        base_properties = rng.randint(50, 300)
+        trend = rng.choice(['growing', 'stable', 'declining'])
 
         for i, date in enumerate(date_range):
             # Apply trend
@@ -43,41 +196,10 @@ def generate_historical_data(months: int = 24) -> pd.DataFrame:
             elif trend == 'declining':
                 growth_factor = 1 - (i * 0.01)
             else:
-                growth_factor = 1 + random.uniform(-0.05, 0.05)
-
-            landlords = int(base_landlords * growth_factor) + random.randint(-5, 5)
-            properties = int(base_properties * growth_factor) + random.randint(-10, 10)
-            leases = int(properties * random.uniform(0.80, 0.95))
-            vacancies = properties - leases
-
-            # Revenue calculations
-            avg_fee = random.uniform(800, 2500)
-            management_fees = leases * avg_fee * random.uniform(0.9, 1.1)
-            leasing_fees = vacancies * random.uniform(1000, 5000)
-            other_fees = properties * random.uniform(50, 200)
-            total_revenue = management_fees + leasing_fees + other_fees
-
-            # Rent roll
-            avg_rent_per_lease = random.uniform(1500, 8000)
-            rent_roll = leases * avg_rent_per_lease
-
-            # Arrears
-            arrears_rate = random.uniform(0.02, 0.08)
-            total_arrears = rent_roll * arrears_rate
-
-            # Distribute arrears across buckets
-            arrears_0_30 = total_arrears * random.uniform(0.35, 0.45)
-            arrears_31_60 = total_arrears * random.uniform(0.25, 0.35)
-            arrears_61_90 = total_arrears * random.uniform(0.15, 0.25)
-            arrears_90_plus = total_arrears - arrears_0_30 - arrears_31_60 - arrears_61_90
-
-            # Critical dates (upcoming)
-            rent_reviews = random.randint(2, 15)
-            lease_expiries = random.randint(1, 12)
-
-            # Diary items
-            overdue_items = random.randint(5, 30)
-            completed_items = random.randint(20, 100)
+                growth_factor = 1 + rng.uniform(-0.05, 0.05)
+
+            landlords = int(base_landlords * growth_factor) + rng.randint(-5, 5)
+            properties = int(base_properties * growth_factor) + rng.randint(-10, 10)
 
             data.append({
                 'date': date,
@@ -85,27 +207,55 @@ def generate_historical_data(months: int = 24) -> pd.DataFrame:
                 'portfolio_manager': pm,
                 'landlords': max(0, landlords),
                 'properties': max(0, properties),
-                'leases': max(0, leases),
-                'vacancies': max(0, vacancies),
-                'occupancy_rate': (leases / properties * 100) if properties > 0 else 0,
-                'management_fees': management_fees,
-                'leasing_fees': leasing_fees,
-                'other_fees': other_fees,
-                'total_revenue': total_revenue,
-                'rent_roll': rent_roll,
-                'total_arrears': total_arrears,
-                'arrears_0_30': arrears_0_30,
-                'arrears_31_60': arrears_31_60,
-                'arrears_61_90': arrears_61_90,
-                'arrears_90_plus': arrears_90_plus,
-                'avg_fee_per_tenancy': management_fees / leases if leases > 0 else 0,
-                'rent_reviews_upcoming': rent_reviews,
-                'lease_expiries_upcoming': lease_expiries,
-                'overdue_diary_items': overdue_items,
-                'completed_diary_items': completed_items
+                # Fee rates, applied once leases are known
+                'avg_fee': rng.uniform(800, 2500),
+                'fee_factor': rng.uniform(0.9, 1.1),
+                'leasing_fee': rng.uniform(1000, 5000),
+                'other_fee': rng.uniform(50, 200),
+                # Critical dates (upcoming)
+                'rent_reviews_upcoming': rng.randint(2, 15),
+                'lease_expiries_upcoming': rng.randint(1, 12),
+                # Diary items
+                'overdue_diary_items': rng.randint(5, 30),
+                'completed_diary_items': rng.randint(20, 100)
             })
 
-    df = pd.DataFrame(data)
+    plan = pd.DataFrame(data)
+    facts = generate_property_facts(plan)
+    totals = aggregate_property_facts(facts, len(date_range))
+    # Line the totals up with the plan rows
+    codes = (plan['portfolio_manager'].map(config.PORTFOLIO_MANAGERS.index) * len(date_range)
+             + np.searchsorted(date_range.to_numpy(), plan['date'].to_numpy()))
+    totals = totals.iloc[codes.to_numpy()].reset_index(drop=True)
+
+    leases = totals['leases'].to_numpy()
+    properties = totals['properties'].to_numpy()
+    management_fees = leases * plan['avg_fee'].to_numpy() * plan['fee_factor'].to_numpy()
+    leasing_fees = totals['vacancies'].to_numpy() * plan['leasing_fee'].to_numpy()
+    other_fees = properties * plan['other_fee'].to_numpy()
+
+    df = pd.DataFrame({
+        'date': plan['date'],
+        'agency': plan['agency'],
+        'portfolio_manager': plan['portfolio_manager'],
+        'landlords': plan['landlords'],
+        'properties': properties,
+        'leases': leases,
+        'vacancies': totals['vacancies'],
+        'occupancy_rate': np.divide(leases * 100, properties, out=np.zeros(len(plan)), where=properties > 0),
+        'management_fees': management_fees,
+        'leasing_fees': leasing_fees,
+        'other_fees': other_fees,
+        'total_revenue': management_fees + leasing_fees + other_fees,
+        'rent_roll': totals['rent_roll'],
+        'total_arrears': totals['total_arrears'],
+        **{column: totals[column] for column in ARREARS_BUCKETS},
+        'avg_fee_per_tenancy': np.divide(management_fees, leases, out=np.zeros(len(plan)), where=leases > 0),
+        'rent_reviews_upcoming': plan['rent_reviews_upcoming'],
+        'lease_expiries_upcoming': plan['lease_expiries_upcoming'],
+        'overdue_diary_items': plan['overdue_diary_items'],
+        'completed_diary_items': plan['completed_diary_items']
+    })
     return df
 
 def generate_revenue_breakdown(df: pd.DataFrame, pm_filter: str = "Whole Agency") -> pd.DataFrame:
@@ -133,8 +283,62 @@ def generate_revenue_breakdown(df: pd.DataFrame, pm_filter: str = "Whole Agency"
 
     return pd.DataFrame(breakdown_data)
 
+def _shares(values: np.ndarray) -> np.ndarray:
+    """Each value's share of the total (all zero when the total is zero)"""
+    total = values.sum()
+    return values / total if total > 0 else np.zeros(len(values))
+
+def generate_landlord_revenue(pm_months: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per landlord per PM-month, built from property_facts() and property_owners()
+
+    Each PM-month's fees are shared among its landlords: management fees by
+    leased weekly rent, leasing fees by vacant properties and other fees by
+    properties, so a PM's landlords add up to its total revenue.
+
+    Args:
+        pm_months: generate_historical_data() rows
+
+    Returns:
+        DataFrame with date, agency, portfolio_manager, landlord, properties,
+        leases, weekly_rent and revenue columns
+    """
+    columns: Dict[str, List[np.ndarray]] = {}
+    for row in pm_months.to_dict('records'):
+        pm_name, num_properties = row['portfolio_manager'], int(row['properties'])
+        if not num_properties:
+            continue
+        draws = _property_draws(pm_name, row['date'], num_properties)
+        names, owners = property_owners(pm_name, num_properties, int(row['landlords']))
+
+        def total(weights=None) -> np.ndarray:
+            return np.bincount(owners, weights=weights, minlength=len(names))
+
+        leased = draws['leased']
+        properties = total()
+        leases = total(leased.astype(np.float64))
+        weekly_rent = total(np.where(leased, draws['weekly_rent'], 0).astype(np.float64))
+        revenue = (row['management_fees'] * _shares(weekly_rent) + row['leasing_fees'] * _shares(properties - leases)
+                   + row['other_fees'] * _shares(properties))
+
+        landlords = {
+            'date': np.full(len(names), np.datetime64(row['date'])),
+            'agency': np.full(len(names), row['agency'], dtype=object),
+            'portfolio_manager': np.full(len(names), pm_name, dtype=object),
+            'landlord': np.array(names, dtype=object),
+            'properties': properties,
+            'leases': leases.astype(np.int64),
+            'weekly_rent': weekly_rent,
+            'revenue': revenue,
+        }
+        for column, values in landlords.items():
+            columns.setdefault(column, []).append(values)
+    if not columns:
+        return pd.DataFrame(columns=['date', 'agency', 'portfolio_manager', 'landlord', 'properties', 'leases', 'weekly_rent', 'revenue'])
+    return pd.DataFrame({column: np.concatenate(parts) for column, parts in columns.items()})
+
 def generate_top_landlords(df: pd.DataFrame, pm_filter: str = "Whole Agency", limit: int = 10) -> pd.DataFrame:
-    """Generate top landlords by revenue"""
+    """Top landlords by revenue in the latest month (see utils/landlords.py for the precomputed rankings)"""
     if pm_filter != "Whole Agency":
         df = df[df['portfolio_manager'] == pm_filter]
 
@@ -142,33 +346,10 @@ def generate_top_landlords(df: pd.DataFrame, pm_filter: str = "Whole Agency", li
     latest_date = df['date'].max()
     latest_data = df[df['date'] == latest_date]
 
-    # Generate mock landlord data
-    landlord_data = []
-    total_properties = int(latest_data['properties'].sum())
-
-    # Generate random landlord names
-    first_names = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
-                   "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica"]
-    last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-                  "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor"]
-
-    num_landlords = min(limit * 3, total_properties)
-
-    for i in range(num_landlords):
-        landlord_name = f"{random.choice(first_names)} {random.choice(last_names)}"
-        properties = random.randint(1, 15)
-        revenue = properties * random.uniform(2000, 10000)
-
-        landlord_data.append({
-            'landlord_name': landlord_name,
-            'properties': properties,
-            'revenue': revenue
-        })
-
-    landlords_df = pd.DataFrame(landlord_data)
-    landlords_df = landlords_df.sort_values('revenue', ascending=False).head(limit).reset_index(drop=True)
-
-    return landlords_df
+    landlords = generate_landlord_revenue(latest_data).nlargest(limit, 'revenue')
+    return landlords.rename(columns={'landlord': 'landlord_name'})[
+        ['landlord_name', 'portfolio_manager', 'properties', 'revenue']
+    ].reset_index(drop=True)
 
 def generate_arrears_details(df: pd.DataFrame, pm_filter: str = "Whole Agency", bucket: str = None) -> pd.DataFrame:
     """Generate detailed arrears data for drill-down"""
@@ -193,18 +374,19 @@ def generate_arrears_details(df: pd.DataFrame, pm_filter: str = "Whole Agency",
         total_amount = latest_data['total_arrears'].sum()
 
     # Generate mock tenant details
-    num_tenants = random.randint(15, 50)
+    rng = random.Random(stable_seed('arrears', pm_filter, bucket, latest_date))
+    num_tenants = rng.randint(15, 50)
     details = []
 
     property_types = config.PROPERTY_TYPES
     tenant_types = ["Company A Pty Ltd", "Company B Limited", "Individual Name", "Trust Name", "Partnership"]
 
     for i in range(num_tenants):
-        property_address = f"{random.randint(1, 999)} {random.choice(['Main', 'High', 'King', 'Queen', 'George'])} Street"
-        tenant = random.choice(tenant_types).replace("Name", f"Tenant {i+1}")
-        property_type = random.choice(property_types)
-        amount = (total_amount / num_tenants) * random.uniform(0.5, 1.5)
-        days_overdue = random.randint(1, 120) if not bucket else random.randint(*_get_bucket_range(bucket))
+        property_address = f"{rng.randint(1, 999)} {rng.choice(['Main', 'High', 'King', 'Queen', 'George'])} Street"
+        tenant = rng.choice(tenant_types).replace("Name", f"Tenant {i+1}")
+        property_type = rng.choice(property_types)
+        amount = (total_amount / num_tenants) * rng.uniform(0.5, 1.5)
+        days_overdue = rng.randint(1, 120) if not bucket else rng.randint(*_get_bucket_range(bucket))
 
         details.append({
             'property_address': property_address,
@@ -219,18 +401,20 @@ def generate_arrears_details(df: pd.DataFrame, pm_filter: str = "Whole Agency",
 
     return details_df
 
-def generate_critical_dates_details(df: pd.DataFrame, pm_filter: str = "Whole Agency", event_type: str = "rent_reviews") -> pd.DataFrame:
-    """Generate detailed critical dates for drill-down"""
+def generate_critical_dates_details(df: pd.DataFrame, pm_filter: str = "Whole Agency", event_type: str = "rent_reviews",
+                                    as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate detailed critical dates for drill-down, for the 12 months from as_of (default: today)"""
     if pm_filter != "Whole Agency":
         df = df[df['portfolio_manager'] == pm_filter]
 
     # Generate monthly breakdown for next 12 months
-    start_date = datetime.now()
+    start_date = resolve_as_of(as_of)
+    rng = random.Random(stable_seed('critical_dates', pm_filter, event_type, start_date))
     months = []
 
     for i in range(12):
         month_date = start_date + timedelta(days=i*30)
-        count = random.randint(3, 15)
+        count = rng.randint(3, 15)
 
         months.append({
             'month': month_date.strftime('%b %Y'),
@@ -240,8 +424,9 @@ def generate_critical_dates_details(df: pd.DataFrame, pm_filter: str = "Whole Ag
 
     return pd.DataFrame(months)
 
-def generate_diary_items_details(df: pd.DataFrame, pm_filter: str = "Whole Agency", status: str = "overdue") -> pd.DataFrame:
-    """Generate detailed diary items for drill-down"""
+def generate_diary_items_details(df: pd.DataFrame, pm_filter: str = "Whole Agency", status: str = "overdue",
+                                 as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate detailed diary items for drill-down, dated relative to as_of (default: today)"""
     if pm_filter != "Whole Agency":
         df = df[df['portfolio_manager'] == pm_filter]
 
@@ -255,20 +440,22 @@ def generate_diary_items_details(df: pd.DataFrame, pm_filter: str = "Whole Agenc
         total_count = int(latest_data['completed_diary_items'].sum())
 
     # Generate mock diary items
+    as_of = resolve_as_of(as_of)
+    rng = random.Random(stable_seed('diary_items', pm_filter, status, as_of))
     items = []
 
     for i in range(min(total_count, 50)):  # Limit to 50 for display
-        item_type = random.choice([t for t in config.DIARY_ITEM_TYPES if t != "All Types"])
-        property_address = f"{random.randint(1, 999)} {random.choice(['Main', 'High', 'King', 'Queen', 'George'])} Street"
-        due_date = datetime.now() - timedelta(days=random.randint(1, 90)) if status == "overdue" else datetime.now() - timedelta(days=random.randint(1, 30))
-        pm = random.choice(config.PORTFOLIO_MANAGERS)
+        item_type = rng.choice([t for t in config.DIARY_ITEM_TYPES if t != "All Types"])
+        property_address = f"{rng.randint(1, 999)} {rng.choice(['Main', 'High', 'King', 'Queen', 'George'])} Street"
+        due_date = as_of - timedelta(days=rng.randint(1, 90)) if status == "overdue" else as_of - timedelta(days=rng.randint(1, 30))
+        pm = rng.choice(config.PORTFOLIO_MANAGERS)
 
         items.append({
             'item_type': item_type,
             'property_address': property_address,
             'due_date': due_date,
             'portfolio_manager': pm,
-            'days_overdue': (datetime.now() - due_date).days if status == "overdue" else 0
+            'days_overdue': (as_of - due_date).days if status == "overdue" else 0
         })
 
     items_df = pd.DataFrame(items)
@@ -291,168 +478,221 @@ def _get_bucket_range(bucket: str) -> tuple:
     else:  # 90+
         return (91, 365)
 
-def generate_property_list(pm_data: pd.Series, pm_name: str) -> pd.DataFrame:
-    """Generate individual property list for a portfolio manager"""
-    np.random.seed(hash(pm_name + "_properties") % 10000)
+def property_details(pm_name: str, num_properties: int) -> List[dict]:
+    """
+    Address, type and bedrooms of a PM's properties, by property index
 
+    Drawn in index order from one stream per PM, so property i keeps its
+    details whatever the size of the book. Every list that shows a
+    property takes its address from here.
+    """
+    rng = random.Random(stable_seed(pm_name, "properties"))
+    details = []
+    for _ in range(num_properties):
+        street_num = rng.randint(1, 999)
+        street = rng.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
+        suburb = rng.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
+        details.append({
+            'address': f"{street_num} {street}, {suburb}",
+            'property_type': rng.choice(['House', 'Apartment', 'Townhouse', 'Villa']),
+            'bedrooms': rng.choice([1, 2, 2, 3, 3, 3, 4, 4, 5]),
+        })
+    return details
+
+def generate_property_list(pm_data: pd.Series, pm_name: str) -> pd.DataFrame:
+    """Generate individual property list for a portfolio manager, with status and rent from property_facts()"""
     num_properties = int(pm_data['properties'])
-    num_leases = int(pm_data['leases'])
+    facts = property_facts(pm_name, pm_data['date'], num_properties)
+    leased = facts['leased'].to_numpy()
+    weekly_rent = facts['weekly_rent'].to_numpy()
+
+    landlords, owners = property_owners(pm_name, num_properties, int(pm_data.get('landlords', 1)))
+    details = property_details(pm_name, num_properties)
 
     properties = []
     for i in range(num_properties):
-        is_leased = i < num_leases
-        property_id = f"PROP-{hash(pm_name + str(i)) % 10000:04d}"
-
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
+        is_leased = bool(leased[i])
+        property_id = _record_id("PROP", pm_name, i)
 
         properties.append({
             'Property ID': property_id,
-            'Address': f"{street_num} {street}, {suburb}",
-            'Property Type': random.choice(['House', 'Apartment', 'Townhouse', 'Villa']),
-            'Bedrooms': random.choice([1, 2, 2, 3, 3, 3, 4, 4, 5]),
+            'Address': details[i]['address'],
+            'Property Type': details[i]['property_type'],
+            'Bedrooms': details[i]['bedrooms'],
             'Status': 'Leased' if is_leased else 'Vacant',
-            'Weekly Rent': f"${random.randint(350, 1200)}" if is_leased else '-',
+            'Weekly Rent': int(weekly_rent[i]) if is_leased else None,
+            'Landlord': landlords[owners[i]],
             'Portfolio Manager': pm_name
         })
 
     return pd.DataFrame(properties)
 
-def generate_lease_list(pm_data: pd.Series, pm_name: str) -> pd.DataFrame:
-    """Generate individual lease list for a portfolio manager"""
-    np.random.seed(hash(pm_name + "_leases") % 10000)
+def generate_property_register(period_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per property across every PM for a period
+
+    Built from each PM's property list, so the register always agrees with
+    the property drill-downs.
 
-    num_leases = int(pm_data['leases'])
+    Args:
+        period_rows: One row per portfolio manager for the period
 
-    leases = []
-    for i in range(num_leases):
-        property_id = f"PROP-{hash(pm_name + str(i)) % 10000:04d}"
-        lease_id = f"LSE-{hash(pm_name + str(i)) % 10000:04d}"
+    Returns:
+        DataFrame with agency, portfolio_manager, landlord, property_id,
+        address, property_type, bedrooms, status and weekly_rent columns
+    """
+    columns = {
+        'Landlord': 'landlord', 'Property ID': 'property_id', 'Address': 'address', 'Property Type': 'property_type',
+        'Bedrooms': 'bedrooms', 'Status': 'status', 'Weekly Rent': 'weekly_rent'
+    }
+    frames = []
+    for row in period_rows.to_dict('records'):
+        properties = generate_property_list(pd.Series(row), row['portfolio_manager'])
+        if properties.empty:
+            continue
+        frame = properties[list(columns)].rename(columns=columns)
+        frame.insert(0, 'portfolio_manager', row['portfolio_manager'])
+        frame.insert(0, 'agency', row['agency'])
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=['agency', 'portfolio_manager'] + list(columns.values()))
+    return pd.concat(frames, ignore_index=True)
+
+def generate_lease_list(pm_data: pd.Series, pm_name: str, as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Generate individual lease list for a portfolio manager, with start dates before as_of (default: today)
 
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
+    One lease per property leased in property_facts(), at that property's
+    rent and address.
+    """
+    rng = random.Random(stable_seed(pm_name, "leases"))
+    as_of = resolve_as_of(as_of)
 
-        tenant_first = random.choice(['James', 'Emma', 'Michael', 'Sarah', 'John', 'Lisa', 'David', 'Amy', 'Peter', 'Kate'])
-        tenant_last = random.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Davis', 'Wilson', 'Moore', 'Taylor', 'Anderson', 'Thomas'])
+    num_properties = int(pm_data['properties'])
+    facts = property_facts(pm_name, pm_data['date'], num_properties)
+    facts = facts[facts['leased']]
+    details = property_details(pm_name, num_properties)
 
-        start_date = datetime.now() - timedelta(days=random.randint(30, 730))
-        lease_term = random.choice([6, 12, 12, 12, 24])
-        end_date = start_date + timedelta(days=lease_term * 30)
+    leases = []
+    for i, weekly_rent in zip(facts['property_index'].tolist(), facts['weekly_rent'].tolist()):
+        property_id = _record_id("PROP", pm_name, i)
+        lease_id = _record_id("LSE", pm_name, i)
 
-        weekly_rent = random.randint(350, 1200)
+        tenant_first = rng.choice(['James', 'Emma', 'Michael', 'Sarah', 'John', 'Lisa', 'David', 'Amy', 'Peter', 'Kate'])
+        tenant_last = rng.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Davis', 'Wilson', 'Moore', 'Taylor', 'Anderson', 'Thomas'])
+
+        start_date = as_of - timedelta(days=rng.randint(30, 730))
+        lease_term = rng.choice([6, 12, 12, 12, 24])
+        end_date = start_date + timedelta(days=lease_term * 30)
 
         leases.append({
             'Lease ID': lease_id,
             'Property ID': property_id,
-            'Address': f"{street_num} {street}, {suburb}",
+            'Address': details[i]['address'],
             'Tenant': f"{tenant_first} {tenant_last}",
-            'Start Date': start_date.strftime('%d/%m/%Y'),
-            'End Date': end_date.strftime('%d/%m/%Y'),
-            'Weekly Rent': f"${weekly_rent}",
+            'Start Date': start_date,
+            'End Date': end_date,
+            'Weekly Rent': weekly_rent,
             'Term (months)': lease_term,
             'Portfolio Manager': pm_name
         })
 
     return pd.DataFrame(leases)
 
-def generate_rent_reviews_list(pm_data: pd.Series, pm_name: str) -> pd.DataFrame:
-    """Generate list of properties with upcoming rent reviews for a portfolio manager"""
-    np.random.seed(hash(pm_name + "_rent_reviews") % 10000)
-
-    num_reviews = int(pm_data['rent_reviews_upcoming'])
+def _upcoming_leases(pm_data: pd.Series, pm_name: str, count: int, as_of: Optional[datetime], *seed) -> pd.DataFrame:
+    """count leases of generate_lease_list(), picked by a stream seeded with seed, in lease order"""
+    leases = generate_lease_list(pm_data, pm_name, as_of)
+    rng = random.Random(stable_seed(pm_name, *seed))
+    picked = sorted(rng.sample(range(len(leases)), min(count, len(leases))))
+    return leases.iloc[picked].reset_index(drop=True)
 
-    reviews = []
-    for i in range(num_reviews):
-        property_id = f"PROP-{hash(pm_name + 'review' + str(i)) % 10000:04d}"
-
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
+def generate_rent_reviews_list(pm_data: pd.Series, pm_name: str, as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Generate list of properties with rent reviews in the 90 days after as_of (default: today) for a portfolio manager
 
-        tenant_first = random.choice(['James', 'Emma', 'Michael', 'Sarah', 'John', 'Lisa', 'David', 'Amy', 'Peter', 'Kate'])
-        tenant_last = random.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Davis', 'Wilson', 'Moore', 'Taylor', 'Anderson', 'Thomas'])
+    Reviews fall on leases from generate_lease_list(), so property, address,
+    tenant and current rent match the lease and property lists.
+    """
+    as_of = resolve_as_of(as_of)
+    leases = _upcoming_leases(pm_data, pm_name, int(pm_data['rent_reviews_upcoming']), as_of, "rent_reviews")
+    rng = random.Random(stable_seed(pm_name, "rent_reviews", "terms"))
 
+    reviews = []
+    for lease in leases.to_dict('records'):
         # Review date within next 90 days
-        review_date = datetime.now() + timedelta(days=random.randint(1, 90))
+        review_date = as_of + timedelta(days=rng.randint(1, 90))
 
-        current_rent = random.randint(350, 1200)
-        proposed_rent = int(current_rent * random.uniform(1.03, 1.08))  # 3-8% increase
+        current_rent = lease['Weekly Rent']
+        proposed_rent = int(current_rent * rng.uniform(1.03, 1.08))  # 3-8% increase
 
         reviews.append({
-            'Property ID': property_id,
-            'Address': f"{street_num} {street}, {suburb}",
-            'Tenant': f"{tenant_first} {tenant_last}",
-            'Review Date': review_date.strftime('%d/%m/%Y'),
-            'Current Rent': f"${current_rent}/week",
-            'Proposed Rent': f"${proposed_rent}/week",
-            'Increase': f"{((proposed_rent - current_rent) / current_rent * 100):.1f}%",
+            'Property ID': lease['Property ID'],
+            'Address': lease['Address'],
+            'Tenant': lease['Tenant'],
+            'Review Date': review_date,
+            'Current Rent': current_rent,
+            'Proposed Rent': proposed_rent,
+            'Increase': round((proposed_rent - current_rent) / current_rent * 100, 1),
             'Portfolio Manager': pm_name
         })
 
     return pd.DataFrame(reviews)
 
-def generate_lease_expiries_list(pm_data: pd.Series, pm_name: str) -> pd.DataFrame:
-    """Generate list of leases expiring soon for a portfolio manager"""
-    np.random.seed(hash(pm_name + "_expiries") % 10000)
+def generate_lease_expiries_list(pm_data: pd.Series, pm_name: str, as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Generate list of leases expiring in the 90 days after as_of (default: today) for a portfolio manager
 
-    num_expiries = int(pm_data['lease_expiries_upcoming'])
+    Expiring leases are leases from generate_lease_list(), with their ids,
+    address, tenant and rent.
+    """
+    as_of = resolve_as_of(as_of)
+    leases = _upcoming_leases(pm_data, pm_name, int(pm_data['lease_expiries_upcoming']), as_of, "expiries")
+    rng = random.Random(stable_seed(pm_name, "expiries", "dates"))
 
     expiries = []
-    for i in range(num_expiries):
-        property_id = f"PROP-{hash(pm_name + 'expiry' + str(i)) % 10000:04d}"
-        lease_id = f"LSE-{hash(pm_name + 'expiry' + str(i)) % 10000:04d}"
-
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
-
-        tenant_first = random.choice(['James', 'Emma', 'Michael', 'Sarah', 'John', 'Lisa', 'David', 'Amy', 'Peter', 'Kate'])
-        tenant_last = random.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Davis', 'Wilson', 'Moore', 'Taylor', 'Anderson', 'Thomas'])
-
+    for lease in leases.to_dict('records'):
         # Expiry date within next 90 days
-        expiry_date = datetime.now() + timedelta(days=random.randint(1, 90))
-        days_to_expiry = (expiry_date - datetime.now()).days
-
-        weekly_rent = random.randint(350, 1200)
+        expiry_date = as_of + timedelta(days=rng.randint(1, 90))
+        days_to_expiry = (expiry_date - as_of).days
 
         expiries.append({
-            'Lease ID': lease_id,
-            'Property ID': property_id,
-            'Address': f"{street_num} {street}, {suburb}",
-            'Tenant': f"{tenant_first} {tenant_last}",
-            'Expiry Date': expiry_date.strftime('%d/%m/%Y'),
+            'Lease ID': lease['Lease ID'],
+            'Property ID': lease['Property ID'],
+            'Address': lease['Address'],
+            'Tenant': lease['Tenant'],
+            'Expiry Date': expiry_date,
             'Days to Expiry': days_to_expiry,
-            'Weekly Rent': f"${weekly_rent}",
+            'Weekly Rent': lease['Weekly Rent'],
             'Portfolio Manager': pm_name
         })
 
     return pd.DataFrame(expiries)
 
-def generate_diary_items_list(pm_data: pd.Series, pm_name: str, item_type: str = "overdue") -> pd.DataFrame:
-    """Generate individual diary items list for a portfolio manager"""
-    np.random.seed(hash(pm_name + "_diary_" + item_type) % 10000)
+def generate_diary_items_list(pm_data: pd.Series, pm_name: str, item_type: str = "overdue",
+                              as_of: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate individual diary items list for a portfolio manager, dated relative to as_of (default: today)"""
+    rng = random.Random(stable_seed(pm_name, "diary", item_type))
+    as_of = resolve_as_of(as_of)
 
     num_items = int(pm_data['overdue_diary_items'] if item_type == "overdue" else pm_data['completed_diary_items'])
 
     items = []
     for i in range(num_items):
-        item_id = f"DRY-{hash(pm_name + str(i)) % 10000:04d}"
+        item_id = _record_id("DRY", pm_name, i, "O" if item_type == "overdue" else "C")
 
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern'])
+        street_num = rng.randint(1, 999)
+        street = rng.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St'])
+        suburb = rng.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern'])
 
-        task_type = random.choice(['Inspection', 'Maintenance', 'Lease Renewal', 'Rent Review', 'Repairs', 'Follow-up'])
-        priority = random.choice(['High', 'Medium', 'Low'])
+        task_type = rng.choice(['Inspection', 'Maintenance', 'Lease Renewal', 'Rent Review', 'Repairs', 'Follow-up'])
+        priority = rng.choice(['High', 'Medium', 'Low'])
 
         if item_type == "overdue":
-            due_date = datetime.now() - timedelta(days=random.randint(1, 60))
-            days_overdue = (datetime.now() - due_date).days
+            due_date = as_of - timedelta(days=rng.randint(1, 60))
+            days_overdue = (as_of - due_date).days
             status = 'Overdue'
         else:
-            due_date = datetime.now() - timedelta(days=random.randint(1, 30))
+            due_date = as_of - timedelta(days=rng.randint(1, 30))
             days_overdue = 0
             status = 'Completed'
 
@@ -461,37 +701,15 @@ def generate_diary_items_list(pm_data: pd.Series, pm_name: str, item_type: str =
             'Property': f"{street_num} {street}, {suburb}",
             'Task Type': task_type,
             'Priority': priority,
-            'Due Date': due_date.strftime('%d/%m/%Y'),
+            'Due Date': due_date,
             'Status': status,
-            'Days Overdue': days_overdue if item_type == "overdue" else '-',
+            'Days Overdue': days_overdue if item_type == "overdue" else None,
             'Portfolio Manager': pm_name
         })
 
     return pd.DataFrame(items)
 
-def generate_landlord_properties(landlord_name: str, num_properties: int) -> pd.DataFrame:
-    """Generate individual property list for a landlord"""
-    np.random.seed(hash(landlord_name) % 10000)
-
-    properties = []
-    for i in range(num_properties):
-        is_leased = random.random() > 0.15  # 85% occupancy
-        property_id = f"PROP-{hash(landlord_name + str(i)) % 10000:04d}"
-
-        street_num = random.randint(1, 999)
-        street = random.choice(['Main St', 'High St', 'Park Ave', 'Church St', 'King St', 'Queen St', 'Victoria Rd', 'Station Rd', 'Mill Rd', 'George St'])
-        suburb = random.choice(['Paddington', 'Newtown', 'Surry Hills', 'Bondi', 'Redfern', 'Glebe', 'Balmain', 'Pyrmont', 'Ultimo', 'Darlinghurst'])
-
-        weekly_rent = random.randint(350, 1200) if is_leased else None
-
-        properties.append({
-            'Property ID': property_id,
-            'Address': f"{street_num} {street}, {suburb}",
-            'Property Type': random.choice(['House', 'Apartment', 'Townhouse', 'Villa']),
-            'Bedrooms': random.choice([1, 2, 2, 3, 3, 3, 4, 4, 5]),
-            'Status': 'Leased' if is_leased else 'Vacant',
-            'Weekly Rent': f"${weekly_rent}" if weekly_rent else '-',
-            'Landlord': landlord_name
-        })
-
-    return pd.DataFrame(properties)
+def generate_landlord_properties(pm_data: pd.Series, pm_name: str, landlord_name: str) -> pd.DataFrame:
+    """Properties a landlord owns in a portfolio manager's book: their rows of generate_property_list()"""
+    properties = generate_property_list(pm_data, pm_name)
+    return properties[properties['Landlord'] == landlord_name].reset_index(drop=True)
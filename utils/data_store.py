@@ -0,0 +1,258 @@
+"""
+Process-level data store shared by every session
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Hashable, Optional, Tuple
+import pandas as pd
+import config
+from utils import data_generator, segments, singleflight, trends
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One immutable, versioned load of the dashboard data"""
+    version: str
+    df: pd.DataFrame
+    trend_cube: pd.DataFrame
+    as_of: pd.Timestamp  # Date the data describes; time-dependent drill-downs are generated relative to it
+    loaded_at: datetime
+
+_snapshot: Optional[Snapshot] = None
+_snapshot_lock = threading.Lock()
+
+# Background refresher state
+_refresh_requested = threading.Event()
+_refreshing = threading.Event()
+_refresher_started = False
+_refresh_error: Optional[BaseException] = None
+
+# (data version, *key) -> value, least recently used first
+_cache: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {'hits': 0, 'misses': 0}
+
+def fingerprint(df: pd.DataFrame, *context) -> str:
+    """
+    Content fingerprint of a frame: identical data gives the identical version
+    in every process, so cache keys stay valid across reloads and workers.
+    Extra context values (e.g. the as-of date) are mixed into the digest.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr(context).encode('utf-8'))
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _build_snapshot(as_of: Optional[datetime] = None) -> Snapshot:
+    """Load the dataset and build its trend cube in this process, as of a date (default: DATA_AS_OF or today)"""
+    as_of = data_generator.resolve_as_of(as_of or config.DATA_AS_OF or None)
+    df = data_generator.generate_historical_data(config.HISTORY_MONTHS, as_of)
+    return Snapshot(
+        version=fingerprint(df, as_of.isoformat()),
+        df=df,
+        trend_cube=trends.build_trend_cube(df),
+        as_of=as_of,
+        loaded_at=datetime.now()
+    )
+
+def load_snapshot(force: bool = False) -> Snapshot:
+    """
+    Load the dataset and build its trend cube as a new snapshot
+
+    With DATA_SEGMENT_DIR set, the frames live in memory-mapped segments
+    shared by all workers on the host: a worker attaches to the current
+    segment if it is younger than CACHE_TTL, otherwise it builds and
+    publishes a new version and retires old ones.
+
+    Args:
+        force: Build a new version even if the shared segment is still fresh
+    """
+    if not segments.enabled():
+        return _build_snapshot()
+
+    with segments.publish_lock():
+        manifest = segments.current_manifest()
+        if force or manifest is None or time.time() - manifest['created_at'] >= config.CACHE_TTL:
+            built = _build_snapshot()
+            manifest = segments.publish(
+                built.version,
+                {'df': built.df, 'trend_cube': built.trend_cube},
+                {'as_of': built.as_of.isoformat()}
+            )
+            segments.retire()
+
+    frames = segments.attach(manifest)
+    loaded_at = datetime.fromtimestamp(manifest['created_at'])
+    return Snapshot(
+        version=manifest['version'],
+        df=frames['df'],
+        trend_cube=frames['trend_cube'],
+        as_of=data_generator.resolve_as_of(manifest.get('metadata', {}).get('as_of') or loaded_at),
+        loaded_at=loaded_at
+    )
+
+def get_snapshot() -> Snapshot:
+    """Current snapshot, loading the first one if nothing has been loaded yet"""
+    if _snapshot is None:
+        # Sessions arriving together on a cold worker share one load
+        singleflight.do(('snapshot',), _load_first_snapshot)
+    return _snapshot
+
+def _load_first_snapshot():
+    """Load the first snapshot unless another flight already did"""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = load_snapshot()
+
+def reload_snapshot(prepare: Optional[Callable[[Snapshot], None]] = None, force: bool = True) -> Snapshot:
+    """
+    Load a fresh snapshot, make it current and drop views cached for older ones
+
+    Sessions keep reading the previous snapshot until the new one (and
+    anything ``prepare`` warms for it) is ready; the swap is a single
+    reference assignment.
+    """
+    snapshot = load_snapshot(force)
+    if _snapshot is not None and snapshot.version == _snapshot.version:
+        return _snapshot
+    if prepare is not None:
+        prepare(snapshot)
+    _make_current(snapshot)
+    return snapshot
+
+def _make_current(snapshot: Snapshot):
+    """Swap in a snapshot and drop views cached for other versions"""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = snapshot
+    with _cache_lock:
+        for key in [key for key in _cache if key[0] != snapshot.version]:
+            del _cache[key]
+
+def get_snapshot_version(version: str, as_of: str) -> Snapshot:
+    """
+    Snapshot of a given version, for worker processes running a server's job
+
+    Pool workers outlive data versions; when the server has moved on, the
+    worker rebuilds the job's data from its as-of date (data is a pure
+    function of it) and makes that current.
+
+    Args:
+        version: Snapshot.version the job was started on
+        as_of: That snapshot's as-of date (ISO format)
+
+    Raises:
+        RuntimeError: If the rebuilt data still has a different version
+    """
+    snapshot = get_snapshot()
+    if snapshot.version == version:
+        return snapshot
+    snapshot = _build_snapshot(pd.Timestamp(as_of))
+    if snapshot.version != version:
+        raise RuntimeError(f"Data version {version} can't be rebuilt in this worker (got {snapshot.version})")
+    _make_current(snapshot)
+    return snapshot
+
+def _refresh_loop(prepare: Optional[Callable[[Snapshot], None]]):
+    """Reload every CACHE_TTL seconds, or sooner when a refresh is requested"""
+    global _refresh_error
+    while True:
+        # A requested refresh always builds new data; a timed one may pick up
+        # a segment another worker has just published
+        requested = _refresh_requested.wait(timeout=config.CACHE_TTL)
+        _refresh_requested.clear()
+        _refreshing.set()
+        try:
+            reload_snapshot(prepare, force=requested)
+            _refresh_error = None
+        except Exception as exc:  # Keep serving the current snapshot and retry next cycle
+            _refresh_error = exc
+        finally:
+            _refreshing.clear()
+
+def start_refresher(prepare: Optional[Callable[[Snapshot], None]] = None) -> bool:
+    """
+    Start the background refresher thread once per process
+
+    Args:
+        prepare: Optional callback run on each new snapshot before it is swapped in
+
+    Returns:
+        True if this call started it
+    """
+    global _refresher_started
+    with _snapshot_lock:
+        if _refresher_started:
+            return False
+        _refresher_started = True
+    threading.Thread(target=_refresh_loop, args=(prepare,), name="dashboard-refresher", daemon=True).start()
+    return True
+
+def request_refresh():
+    """Ask the refresher to reload now without blocking the caller"""
+    _refresh_requested.set()
+
+def is_refreshing() -> bool:
+    """True while a refresh is requested or a new snapshot is being built"""
+    return _refresh_requested.is_set() or _refreshing.is_set()
+
+def get_refresh_error() -> Optional[str]:
+    """Error from the last failed refresh, if the last attempt failed"""
+    return repr(_refresh_error) if _refresh_error else None
+
+def snapshot_age(snapshot: Snapshot) -> float:
+    """Seconds since a snapshot was loaded"""
+    return (datetime.now() - snapshot.loaded_at).total_seconds()
+
+def cached(version: str, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+    """
+    Return a view derived from a data version, computing it on first use
+
+    Lookups hash only the small key tuple, never the frames the view is
+    built from. Values are shared across sessions and must be treated as
+    read-only. Concurrent misses for the same key are coalesced into one
+    computation.
+
+    Args:
+        version: Snapshot.version of the data the view is derived from
+        key: Hashable description of the view (name, filters, periods, parameters)
+        compute: Builds the view when it is not cached
+
+    Returns:
+        The cached or freshly computed value
+    """
+    full_key = (version,) + tuple(key)
+    with _cache_lock:
+        if full_key in _cache:
+            _cache_stats['hits'] += 1
+            _cache.move_to_end(full_key)
+            return _cache[full_key]
+        _cache_stats['misses'] += 1
+
+    return singleflight.do(full_key, lambda: _compute_and_store(full_key, compute))
+
+def _compute_and_store(full_key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+    """Single-flight body of cached(): skip work a just-finished flight already stored"""
+    with _cache_lock:
+        if full_key in _cache:
+            return _cache[full_key]
+
+    value = compute()
+
+    with _cache_lock:
+        _cache[full_key] = value
+        _cache.move_to_end(full_key)
+        while len(_cache) > config.VIEW_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return value
+
+def get_cache_stats() -> dict:
+    """View cache hits/misses and entries, plus single-flight coalescing counters"""
+    with _cache_lock:
+        stats = dict(_cache_stats, entries=len(_cache))
+    stats.update({f'flight_{name}': value for name, value in singleflight.get_stats().items()})
+    return stats
@@ -3,18 +3,61 @@ Dialog/Modal components for interactive drill-downs
 """
 import streamlit as st
 import pandas as pd
-from utils import charts, metrics, data_generator
+from functools import partial
+from typing import Optional
+from utils import charts, metrics, data_generator, data_store, disk_cache, exports, rollup, search, tables
+
+def _as_of():
+    """As-of date of the session's snapshot; None lets the generators use today"""
+    return st.session_state.get('data_as_of')
+
+def _drilldown(name: str, params: tuple, compute, scoped: bool = False) -> pd.DataFrame:
+    """
+    Drill-down frame from the in-memory view cache, backed by the persistent disk cache
+
+    Keyed by the session's data version, the drill-down name and its
+    parameters; scoped drill-downs (built from the filtered frame) also
+    include the sidebar agency/PM filters. Reruns while a dialog is open
+    (e.g. turning pages) hit memory; SQLite is read only when this process
+    has not held the frame yet or has evicted it. The frame is shared, so
+    treat it as read-only.
+    """
+    version = st.session_state.get('data_version')
+    if version is None:
+        return compute()
+    key = (name,) + tuple(st.session_state.get('data_scope', ()) if scoped else ()) + params
+    return data_store.cached(version, ('drilldown',) + key, lambda: disk_cache.cached((version,) + key, compute))
+
+def _view_key(name: str, params: tuple) -> Optional[tuple]:
+    """
+    (data version, agency/PM filter, current/comparison period, name, parameters)
+    identifying a view of the session's data, or None outside a dashboard session
+    """
+    version = st.session_state.get('data_version')
+    if version is None:
+        return None
+    scope = tuple(st.session_state.get('data_scope', ()))
+    periods = tuple(st.session_state.get('data_periods', ()))
+    return (version,) + scope + periods + (name,) + params
+
+def _cached_view(name: str, params: tuple, compute):
+    """
+    In-memory view derived from the session's filtered period data
+
+    Keyed by _view_key() so lookups never hash the frames themselves.
+    """
+    key = _view_key(name, params)
+    if key is None:
+        return compute()
+    return data_store.cached(key[0], key[1:], compute)
 
 def create_download_button(data: pd.DataFrame, filename: str, label: str = "📥 Download CSV"):
-    """Helper function to create a download button for dataframe"""
-    csv = data.to_csv(index=False)
-    st.download_button(
-        label=label,
-        data=csv,
-        file_name=filename,
-        mime="text/csv",
-        use_container_width=True
-    )
+    """Download button for a dataframe; the CSV is built on click and cached per data version, filters and periods"""
+    version = st.session_state.get('data_version')
+    cache_key = None
+    if version is not None:
+        cache_key = (version,) + tuple(st.session_state.get('data_scope', ())) + tuple(st.session_state.get('data_periods', ()))
+    exports.download_button(data, filename, label, cache_key=cache_key)
 
 @st.dialog("Landlord Details", width="large")
 def show_landlord_details(current_data, comparison_data):
@@ -24,17 +67,10 @@ def show_landlord_details(current_data, comparison_data):
         st.markdown("### Landlords by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['landlords'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['landlords'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('landlords', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'landlords', 'sum')
+    )
 
     # Download button
     with col_download:
@@ -43,52 +79,13 @@ def show_landlord_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
         # Create grouped bar chart
-        import plotly.graph_objects as go
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Landlords by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Landlords by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     # Period comparison summary
     st.markdown("---")
@@ -108,29 +105,21 @@ def show_landlord_details(current_data, comparison_data):
         'Period',
         'Landlords - Period Comparison'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Property Details", width="large")
 def show_property_details(current_data, comparison_data):
     """Show detailed property breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Properties by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['properties'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['properties'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('properties', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'properties', 'sum')
+    )
 
     # Download button
 
@@ -142,71 +131,26 @@ def show_property_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Properties by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Properties by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Lease Details", width="large")
 def show_lease_details(current_data, comparison_data):
     """Show detailed lease breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Active Leases by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['leases'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['leases'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('leases', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'leases', 'sum')
+    )
 
     # Download button
 
@@ -218,71 +162,26 @@ def show_lease_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Active Leases by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Active Leases by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Vacancy Details", width="large")
 def show_vacancy_details(current_data, comparison_data):
     """Show detailed vacancy breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Vacancies by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['vacancies'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['vacancies'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('vacancies', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'vacancies', 'sum')
+    )
 
     # Download button
 
@@ -294,73 +193,26 @@ def show_vacancy_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Vacancies by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Vacancies by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Occupancy Rate Details", width="large")
 def show_occupancy_details(current_data, comparison_data):
     """Show detailed occupancy breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Occupancy Rate by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['occupancy_rate'].mean().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-    current_breakdown['Current Period'] = current_breakdown['Current Period'].round(1)
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['occupancy_rate'].mean().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-    comparison_breakdown['Comparison Period'] = comparison_breakdown['Comparison Period'].round(1)
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('occupancy_rate', 'mean', 1),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'occupancy_rate', 'mean', decimals=1)
+    )
 
     # Download button
 
@@ -372,71 +224,26 @@ def show_occupancy_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.1f}%',
-                'Comparison Period': '{:.1f}%',
-                'Change': '{:+.1f}%',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['percent'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Occupancy Rate by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Occupancy Rate (%)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Occupancy Rate by Portfolio Manager', x_title='Occupancy Rate (%)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Rent Roll Details", width="large")
-def show_rent_roll_details(current_data, comparison_data, df):
-    """Show detailed rent roll breakdown"""
-    import plotly.graph_objects as go
+def show_rent_roll_details(current_data, comparison_data, rent_trend):
+    """Show detailed rent roll breakdown with per-PM trend from the trend cube"""
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Rent Roll by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['rent_roll'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['rent_roll'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('rent_roll', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'rent_roll', 'sum')
+    )
 
     # Download button
 
@@ -448,54 +255,16 @@ def show_rent_roll_details(current_data, comparison_data, df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Rent Roll by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Rent Roll ($)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Rent Roll by Portfolio Manager', x_title='Rent Roll ($)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     # Trend chart
     st.markdown("---")
     st.markdown("### Rent Roll Trend")
-    rent_trend = df.groupby(['date', 'portfolio_manager'])['rent_roll'].sum().reset_index()
     fig = charts.create_trend_line_chart(
         rent_trend,
         'date',
@@ -503,31 +272,22 @@ def show_rent_roll_details(current_data, comparison_data, df):
         'Rent Roll Trend Over Time',
         group_col='portfolio_manager'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Arrears Details", width="large")
 def show_arrears_details(current_data, comparison_data, df, selected_pm):
     """Show detailed arrears breakdown"""
     from utils import data_generator
 
-    import plotly.graph_objects as go
-
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Arrears Analysis")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['total_arrears'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['total_arrears'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('total_arrears', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'total_arrears', 'sum')
+    )
 
     # Download button
 
@@ -539,49 +299,12 @@ def show_arrears_details(current_data, comparison_data, df, selected_pm):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Arrears by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Arrears ($)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Arrears by Portfolio Manager', x_title='Arrears ($)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     # Arrears aging breakdown
     st.markdown("---")
@@ -598,7 +321,7 @@ def show_arrears_details(current_data, comparison_data, df, selected_pm):
     })
 
     fig = charts.create_arrears_bucket_chart(aging_data, 'Arrears by Days Overdue')
-    st.plotly_chart(fig, use_container_width=True)
+    charts.plotly_chart(fig, use_container_width=True)
 
     # Detailed drill-down
     st.markdown("---")
@@ -609,43 +332,29 @@ def show_arrears_details(current_data, comparison_data, df, selected_pm):
         ['All', '0-30', '31-60', '61-90', '90+']
     )
 
-    arrears_details = data_generator.generate_arrears_details(
-        df,
-        selected_pm if selected_pm != "All Managers" else "Whole Agency",
-        None if selected_bucket == 'All' else selected_bucket
+    pm_filter = selected_pm if selected_pm != "All Managers" else "Whole Agency"
+    bucket = None if selected_bucket == 'All' else selected_bucket
+    arrears_details = _drilldown(
+        'arrears_details', (pm_filter, bucket),
+        lambda: data_generator.generate_arrears_details(df, pm_filter, bucket),
+        scoped=True
     )
 
-    st.dataframe(
-        arrears_details.style.format({
-            'amount_overdue': '${:,.2f}',
-            'days_overdue': '{:.0f}'
-        }),
-        use_container_width=True,
-        hide_index=True,
-        height=400
-    )
+    tables.render_table(arrears_details, {'amount_overdue': 'currency_cents', 'days_overdue': 'count'})
 
 @st.dialog("Total Revenue Details", width="large")
 def show_revenue_details(current_data, comparison_data, df):
     """Show detailed revenue breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Total Revenue by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['total_revenue'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['total_revenue'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('total_revenue', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'total_revenue', 'sum')
+    )
 
     # Download button
 
@@ -657,69 +366,25 @@ def show_revenue_details(current_data, comparison_data, df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Total Revenue by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Total Revenue by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Management Fees Details", width="large")
 def show_management_fees_details(current_data, comparison_data, df):
     """Show detailed management fees breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Management Fees by Portfolio Manager")
 
-    current_breakdown = current_data.groupby('portfolio_manager')['management_fees'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['management_fees'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('management_fees', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'management_fees', 'sum')
+    )
 
     # Download button
 
@@ -731,69 +396,25 @@ def show_management_fees_details(current_data, comparison_data, df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Management Fees by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Management Fees by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Leasing Fees Details", width="large")
 def show_leasing_fees_details(current_data, comparison_data, df):
     """Show detailed leasing fees breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Leasing Fees by Portfolio Manager")
 
-    current_breakdown = current_data.groupby('portfolio_manager')['leasing_fees'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['leasing_fees'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('leasing_fees', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'leasing_fees', 'sum')
+    )
 
     # Download button
 
@@ -805,69 +426,25 @@ def show_leasing_fees_details(current_data, comparison_data, df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Leasing Fees by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Leasing Fees by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Avg Fee per Tenancy Details", width="large")
 def show_avg_fee_details(current_data, comparison_data, df):
     """Show detailed average fee breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Average Fee per Tenancy by Portfolio Manager")
 
-    current_breakdown = current_data.groupby('portfolio_manager')['avg_fee_per_tenancy'].mean().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['avg_fee_per_tenancy'].mean().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('avg_fee_per_tenancy', 'mean'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'avg_fee_per_tenancy', 'mean')
+    )
 
     # Download button
 
@@ -879,49 +456,12 @@ def show_avg_fee_details(current_data, comparison_data, df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Avg Fee per Tenancy by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Avg Fee per Tenancy by Portfolio Manager')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Arrears Ratio Details", width="large")
 def show_arrears_ratio_details(current_data, comparison_data):
@@ -941,12 +481,7 @@ def show_arrears_ratio_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            arrears_ratio_breakdown,
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(arrears_ratio_breakdown, {'Arrears Ratio (%)': 'percent'})
 
     with col2:
         fig = charts.create_horizontal_bar_chart(
@@ -955,7 +490,7 @@ def show_arrears_ratio_details(current_data, comparison_data):
             'Portfolio Manager',
             'Arrears Ratio by Portfolio Manager'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
     # Period comparison
     st.markdown("---")
@@ -975,29 +510,21 @@ def show_arrears_ratio_details(current_data, comparison_data):
         'Period',
         'Arrears Ratio - Period Comparison'
     )
-    st.plotly_chart(fig, use_container_width=True)
+    charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Arrears 0-30 Days Details", width="large")
 def show_arrears_0_30_details(current_data, comparison_data):
     """Show detailed 0-30 days arrears breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### 0-30 Days Arrears by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['arrears_0_30'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['arrears_0_30'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('arrears_0_30', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'arrears_0_30', 'sum')
+    )
 
     # Download button
 
@@ -1009,71 +536,26 @@ def show_arrears_0_30_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='0-30 Days Arrears by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Amount ($)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, '0-30 Days Arrears by Portfolio Manager', x_title='Amount ($)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Arrears 31-60 Days Details", width="large")
 def show_arrears_31_60_details(current_data, comparison_data):
     """Show detailed 31-60 days arrears breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### 31-60 Days Arrears by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['arrears_31_60'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['arrears_31_60'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('arrears_31_60', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'arrears_31_60', 'sum')
+    )
 
     # Download button
 
@@ -1085,71 +567,26 @@ def show_arrears_31_60_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='31-60 Days Arrears by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Amount ($)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, '31-60 Days Arrears by Portfolio Manager', x_title='Amount ($)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Arrears 90+ Days Details", width="large")
 def show_arrears_90_plus_details(current_data, comparison_data):
     """Show detailed 90+ days arrears breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### 90+ Days Arrears by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['arrears_90_plus'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['arrears_90_plus'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('arrears_90_plus', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'arrears_90_plus', 'sum')
+    )
 
     # Download button
 
@@ -1161,70 +598,25 @@ def show_arrears_90_plus_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '${:,.0f}',
-                'Comparison Period': '${:,.0f}',
-                'Change': '${:+,.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['currency'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='90+ Days Arrears by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Amount ($)'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, '90+ Days Arrears by Portfolio Manager', x_title='Amount ($)')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 @st.dialog("Rent Reviews Details", width="large")
 def show_rent_reviews_details(current_data, comparison_data):
     """Show detailed rent reviews breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Upcoming Rent Reviews by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['rent_reviews_upcoming'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['rent_reviews_upcoming'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('rent_reviews_upcoming', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'rent_reviews_upcoming', 'sum')
+    )
 
     # Download button
 
@@ -1236,71 +628,26 @@ def show_rent_reviews_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Rent Reviews by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Count'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Rent Reviews by Portfolio Manager', x_title='Count')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Lease Expiries Details", width="large")
 def show_lease_expiries_details(current_data, comparison_data):
     """Show detailed lease expiries breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Upcoming Lease Expiries by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['lease_expiries_upcoming'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['lease_expiries_upcoming'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('lease_expiries_upcoming', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'lease_expiries_upcoming', 'sum')
+    )
 
     # Download button
 
@@ -1312,71 +659,26 @@ def show_lease_expiries_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Lease Expiries by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Count'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Lease Expiries by Portfolio Manager', x_title='Count')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Overdue Items Details", width="large")
 def show_overdue_items_details(current_data, comparison_data):
     """Show detailed overdue items breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Overdue Diary Items by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['overdue_diary_items'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['overdue_diary_items'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('overdue_diary_items', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'overdue_diary_items', 'sum')
+    )
 
     # Download button
 
@@ -1388,71 +690,26 @@ def show_overdue_items_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Overdue Items by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Count'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Overdue Items by Portfolio Manager', x_title='Count')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Completed Items Details", width="large")
 def show_completed_items_details(current_data, comparison_data):
     """Show detailed completed items breakdown"""
-    import plotly.graph_objects as go
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Completed Diary Items by Portfolio Manager")
 
     # Get data for both periods
-    current_breakdown = current_data.groupby('portfolio_manager')['completed_diary_items'].sum().reset_index()
-    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
-
-    comparison_breakdown = comparison_data.groupby('portfolio_manager')['completed_diary_items'].sum().reset_index() if not comparison_data.empty else current_breakdown.copy()
-    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
-
-    # Merge both periods
-    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
-    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
-    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
-    breakdown = breakdown.sort_values('Current Period', ascending=False)
+    breakdown = _cached_view(
+        'period_breakdown', ('completed_diary_items', 'sum'),
+        lambda: metrics.calculate_period_breakdown(current_data, comparison_data, 'completed_diary_items', 'sum')
+    )
 
     # Download button
 
@@ -1464,63 +721,24 @@ def show_completed_items_details(current_data, comparison_data):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            breakdown.style.format({
-                'Current Period': '{:.0f}',
-                'Comparison Period': '{:.0f}',
-                'Change': '{:+.0f}',
-                'Change %': '{:+.1f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(breakdown, tables.BREAKDOWN_FORMATS['count'])
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Comparison Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Comparison Period'],
-            orientation='h',
-            marker=dict(color='#d4b000')
-        ))
-        fig.add_trace(go.Bar(
-            name='Current Period',
-            y=breakdown['Portfolio Manager'],
-            x=breakdown['Current Period'],
-            orientation='h',
-            marker=dict(color='#ffe512')
-        ))
-
-        fig.update_layout(
-            title='Completed Items by Portfolio Manager',
-            barmode='group',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Count'),
-            yaxis=dict(showgrid=False),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
+        fig = charts.create_period_comparison_chart(breakdown, 'Completed Items by Portfolio Manager', x_title='Count')
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Property Count Trend", width="large")
-def show_property_trend_details(df):
-    """Show property count trend data"""
-    import plotly.graph_objects as go
+def show_property_trend_details(trend_summary):
+    """Show property count trend data with rolling averages from the trend cube"""
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Property Count Over Time")
 
     # Get trend data
-    trend_data = df.groupby('date')['properties'].sum().reset_index()
-    trend_data.columns = ['Date', 'Properties']
-    trend_data = trend_data.sort_values('Date')
+    trend_data = trend_summary[['date', 'properties', 'properties_ma3', 'properties_ma12', 'properties_growth', 'properties_yoy']].copy()
+    trend_data.columns = ['Date', 'Properties', '3M Avg', '12M Avg', 'MoM %', 'YoY %']
 
     # Download button
     with col_download:
@@ -1529,53 +747,38 @@ def show_property_trend_details(df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            trend_data.style.format({
-                'Date': lambda x: x.strftime('%Y-%m-%d'),
-                'Properties': '{:.0f}'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(trend_data, {
+            'Date': 'date',
+            'Properties': 'count',
+            '3M Avg': 'decimal',
+            '12M Avg': 'decimal',
+            'MoM %': 'percent_change',
+            'YoY %': 'percent_change'
+        })
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=trend_data['Date'],
-            y=trend_data['Properties'],
-            mode='lines',
-            fill='tozeroy',
-            line=dict(color='#ffe512', width=2),
-            fillcolor='rgba(255, 229, 18, 0.3)'
-        ))
-
-        fig.update_layout(
-            title='Property Count Trend',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Date'),
-            yaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Properties')
+        fig = charts.create_area_trend_chart(
+            trend_data,
+            'Date',
+            'Properties',
+            'Property Count Trend',
+            x_title='Date',
+            y_title='Properties'
         )
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Occupancy Rate Trend", width="large")
-def show_occupancy_trend_details(df):
-    """Show occupancy rate trend data"""
-    import plotly.graph_objects as go
+def show_occupancy_trend_details(trend_summary):
+    """Show occupancy rate trend data with rolling averages from the trend cube"""
 
     col_title, col_download = st.columns([3, 1])
     with col_title:
         st.markdown("### Average Occupancy Rate Over Time")
 
     # Get trend data
-    trend_data = df.groupby('date')['occupancy_rate'].mean().reset_index()
-    trend_data.columns = ['Date', 'Occupancy Rate']
-    trend_data = trend_data.sort_values('Date')
+    trend_data = trend_summary[['date', 'occupancy_rate', 'occupancy_rate_ma3', 'occupancy_rate_ma12', 'occupancy_rate_yoy']].copy()
+    trend_data.columns = ['Date', 'Occupancy Rate', '3M Avg', '12M Avg', 'YoY %']
 
     # Download button
     with col_download:
@@ -1584,39 +787,25 @@ def show_occupancy_trend_details(df):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        st.dataframe(
-            trend_data.style.format({
-                'Date': lambda x: x.strftime('%Y-%m-%d'),
-                'Occupancy Rate': '{:.2f}%'
-            }),
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+        tables.render_table(trend_data, {
+            'Date': 'date',
+            'Occupancy Rate': 'percent_2dp',
+            '3M Avg': 'percent_2dp',
+            '12M Avg': 'percent_2dp',
+            'YoY %': 'percent_change'
+        })
 
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=trend_data['Date'],
-            y=trend_data['Occupancy Rate'],
-            mode='lines',
-            fill='tozeroy',
-            line=dict(color='#ffe512', width=2),
-            fillcolor='rgba(255, 229, 18, 0.3)'
-        ))
-
-        fig.update_layout(
-            title='Average Occupancy Rate Trend',
-            height=400,
-            font=dict(family="Lato, sans-serif", size=12, color="#595959"),
-            title_font=dict(family="Playfair Display, serif", size=16, color="#595959"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Date'),
-            yaxis=dict(showgrid=True, gridcolor='#e5e5e0', title='Occupancy Rate (%)')
+        fig = charts.create_area_trend_chart(
+            trend_data,
+            'Date',
+            'Occupancy Rate',
+            'Average Occupancy Rate Trend',
+            x_title='Date',
+            y_title='Occupancy Rate (%)'
         )
 
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("Property List", width="large")
 def show_pm_property_list(pm_data: pd.Series, pm_name: str):
@@ -1626,7 +815,10 @@ def show_pm_property_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Properties Managed by {pm_name}")
 
     # Generate property list
-    property_list = data_generator.generate_property_list(pm_data, pm_name)
+    property_list = _drilldown(
+        'property_list', (pm_name, str(pm_data['date'])),
+        lambda: data_generator.generate_property_list(pm_data, pm_name)
+    )
 
     # Download button
     with col_download:
@@ -1634,11 +826,11 @@ def show_pm_property_list(pm_data: pd.Series, pm_name: str):
 
     st.markdown(f"**Total Properties: {len(property_list)} | Leased: {(property_list['Status'] == 'Leased').sum()} | Vacant: {(property_list['Status'] == 'Vacant').sum()}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         property_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"properties_{pm_name}",
+        cache_key=_view_key('property_list', (pm_name, str(pm_data['date']))),
+        formats={'Weekly Rent': 'currency'}
     )
 
 @st.dialog("Lease List", width="large")
@@ -1649,7 +841,10 @@ def show_pm_lease_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Active Leases Managed by {pm_name}")
 
     # Generate lease list
-    lease_list = data_generator.generate_lease_list(pm_data, pm_name)
+    lease_list = _drilldown(
+        'lease_list', (pm_name, str(pm_data['date'])),
+        lambda: data_generator.generate_lease_list(pm_data, pm_name, _as_of())
+    )
 
     # Download button
     with col_download:
@@ -1657,11 +852,11 @@ def show_pm_lease_list(pm_data: pd.Series, pm_name: str):
 
     st.markdown(f"**Total Active Leases: {len(lease_list)}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         lease_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"leases_{pm_name}",
+        cache_key=_view_key('lease_list', (pm_name, str(pm_data['date']))),
+        formats={'Start Date': 'local_date', 'End Date': 'local_date', 'Weekly Rent': 'currency'}
     )
 
 @st.dialog("Overdue Diary Items", width="large")
@@ -1672,7 +867,10 @@ def show_pm_overdue_items_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Overdue Diary Items - {pm_name}")
 
     # Generate diary items list
-    items_list = data_generator.generate_diary_items_list(pm_data, pm_name, "overdue")
+    items_list = _drilldown(
+        'diary_items_list', (pm_name, str(pm_data['date']), "overdue"),
+        lambda: data_generator.generate_diary_items_list(pm_data, pm_name, "overdue", _as_of())
+    )
 
     # Download button
     with col_download:
@@ -1680,11 +878,11 @@ def show_pm_overdue_items_list(pm_data: pd.Series, pm_name: str):
 
     st.markdown(f"**Total Overdue Items: {len(items_list)}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         items_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"overdue_items_{pm_name}",
+        cache_key=_view_key('diary_items_list', (pm_name, str(pm_data['date']), "overdue")),
+        formats={'Due Date': 'local_date', 'Days Overdue': 'count'}
     )
 
 @st.dialog("Completed Diary Items", width="large")
@@ -1695,7 +893,10 @@ def show_pm_completed_items_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Completed Diary Items - {pm_name}")
 
     # Generate diary items list
-    items_list = data_generator.generate_diary_items_list(pm_data, pm_name, "completed")
+    items_list = _drilldown(
+        'diary_items_list', (pm_name, str(pm_data['date']), "completed"),
+        lambda: data_generator.generate_diary_items_list(pm_data, pm_name, "completed", _as_of())
+    )
 
     # Download button
     with col_download:
@@ -1703,11 +904,11 @@ def show_pm_completed_items_list(pm_data: pd.Series, pm_name: str):
 
     st.markdown(f"**Total Completed Items: {len(items_list)}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         items_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"completed_items_{pm_name}",
+        cache_key=_view_key('diary_items_list', (pm_name, str(pm_data['date']), "completed")),
+        formats={'Due Date': 'local_date', 'Days Overdue': 'count'}
     )
 
 @st.dialog("Arrears Bucket Details", width="large")
@@ -1730,7 +931,12 @@ def show_arrears_bucket_list(df: pd.DataFrame, bucket_name: str, selected_pm: st
     bucket_param = bucket_map.get(bucket_name)
 
     # Generate arrears details list
-    arrears_list = data_generator.generate_arrears_details(df, selected_pm, bucket_param)
+    pm_filter = selected_pm if selected_pm != "All Managers" else "Whole Agency"
+    arrears_list = _drilldown(
+        'arrears_details', (pm_filter, bucket_param),
+        lambda: data_generator.generate_arrears_details(df, pm_filter, bucket_param),
+        scoped=True
+    )
 
     # Download button - safe filename
     filename = f"arrears_{bucket_name.replace(' ', '_').replace('+', 'plus')}.csv"
@@ -1740,14 +946,11 @@ def show_arrears_bucket_list(df: pd.DataFrame, bucket_name: str, selected_pm: st
     total_amount = arrears_list['amount_overdue'].sum()
     st.markdown(f"**Total Properties: {len(arrears_list)} | Total Amount: ${total_amount:,.2f}**")
 
-    # Format the amount_overdue column as currency
-    arrears_list['amount_overdue'] = arrears_list['amount_overdue'].apply(lambda x: f"${x:,.2f}")
-
-    st.dataframe(
+    tables.render_paginated_table(
         arrears_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"arrears_{bucket_name}",
+        cache_key=_view_key('arrears_details', (pm_filter, bucket_param)),
+        formats={'amount_overdue': 'currency_cents', 'days_overdue': 'count'}
     )
 
 @st.dialog("Revenue Details", width="large")
@@ -1776,15 +979,8 @@ def show_pm_revenue_details(pm_data: pd.Series, pm_name: str):
 
     # Show breakdown as table
     revenue_breakdown['Percentage'] = (revenue_breakdown['Amount'] / total_revenue * 100).round(1)
-    revenue_breakdown['Amount'] = revenue_breakdown['Amount'].apply(lambda x: f"${x:,.2f}")
-    revenue_breakdown['Percentage'] = revenue_breakdown['Percentage'].apply(lambda x: f"{x}%")
-
-    st.dataframe(
-        revenue_breakdown,
-        use_container_width=True,
-        hide_index=True,
-        height=200
-    )
+
+    tables.render_table(revenue_breakdown, {'Amount': 'currency_cents', 'Percentage': 'percent'}, height=200)
 
     st.markdown("---")
     st.markdown("### Property Metrics")
@@ -1800,12 +996,8 @@ def show_pm_revenue_details(pm_data: pd.Series, pm_name: str):
         ]
     })
 
-    st.dataframe(
-        metrics_data,
-        use_container_width=True,
-        hide_index=True,
-        height=250
-    )
+    # Mixed units in one column, so values stay pre-formatted text
+    tables.render_table(metrics_data, height=250)
 
 @st.dialog("Rent Reviews", width="large")
 def show_pm_rent_reviews_list(pm_data: pd.Series, pm_name: str):
@@ -1815,18 +1007,26 @@ def show_pm_rent_reviews_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Rent Reviews - {pm_name}")
 
     # Generate rent reviews list
-    reviews_list = data_generator.generate_rent_reviews_list(pm_data, pm_name)
+    reviews_list = _drilldown(
+        'rent_reviews_list', (pm_name, str(pm_data['date'])),
+        lambda: data_generator.generate_rent_reviews_list(pm_data, pm_name, _as_of())
+    )
 
     with col_download:
         create_download_button(reviews_list, f"rent_reviews_{pm_name.replace(' ', '_')}.csv")
 
     st.markdown(f"**Total Reviews: {len(reviews_list)}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         reviews_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"rent_reviews_{pm_name}",
+        cache_key=_view_key('rent_reviews_list', (pm_name, str(pm_data['date']))),
+        formats={
+            'Review Date': 'local_date',
+            'Current Rent': 'currency',
+            'Proposed Rent': 'currency',
+            'Increase': 'percent'
+        }
     )
 
 @st.dialog("Lease Expiries", width="large")
@@ -1837,16 +1037,156 @@ def show_pm_lease_expiries_list(pm_data: pd.Series, pm_name: str):
         st.markdown(f"### Lease Expiries - {pm_name}")
 
     # Generate lease expiries list
-    expiries_list = data_generator.generate_lease_expiries_list(pm_data, pm_name)
+    expiries_list = _drilldown(
+        'lease_expiries_list', (pm_name, str(pm_data['date'])),
+        lambda: data_generator.generate_lease_expiries_list(pm_data, pm_name, _as_of())
+    )
 
     with col_download:
         create_download_button(expiries_list, f"lease_expiries_{pm_name.replace(' ', '_')}.csv")
 
     st.markdown(f"**Total Expiring Leases: {len(expiries_list)}**")
 
-    st.dataframe(
+    tables.render_paginated_table(
         expiries_list,
-        use_container_width=True,
-        hide_index=True,
-        height=500
+        key=f"lease_expiries_{pm_name}",
+        cache_key=_view_key('lease_expiries_list', (pm_name, str(pm_data['date']))),
+        formats={'Expiry Date': 'local_date', 'Days to Expiry': 'count', 'Weekly Rent': 'currency'}
+    )
+
+@st.dialog("Landlord Properties", width="large")
+def show_landlord_property_list(pm_data: pd.Series, pm_name: str, landlord_name: str):
+    """Show the properties a landlord owns in a portfolio manager's book"""
+    col_title, col_download = st.columns([3, 1])
+    with col_title:
+        st.markdown(f"### Properties Owned by {landlord_name}")
+
+    property_list = _drilldown(
+        'landlord_properties', (pm_name, str(pm_data['date']), landlord_name),
+        lambda: data_generator.generate_landlord_properties(pm_data, pm_name, landlord_name)
+    )
+
+    with col_download:
+        create_download_button(property_list, f"landlord_properties_{landlord_name.replace(' ', '_')}.csv")
+
+    st.markdown(f"**Total Properties: {len(property_list)} | Leased: {(property_list['Status'] == 'Leased').sum()} | Vacant: {(property_list['Status'] == 'Vacant').sum()}**")
+
+    tables.render_paginated_table(
+        property_list,
+        key=f"landlord_{pm_name}_{landlord_name}",
+        cache_key=_view_key('landlord_properties', (pm_name, str(pm_data['date']), landlord_name)),
+        formats={'Weekly Rent': 'currency'}
+    )
+
+# Search entity source -> (PM list dialog, its table key prefix)
+SEARCH_RESULT_DIALOGS = {
+    'properties': (show_pm_property_list, 'properties'),
+    'leases': (show_pm_lease_list, 'leases'),
+    'overdue_items': (show_pm_overdue_items_list, 'overdue_items'),
+    'completed_items': (show_pm_completed_items_list, 'completed_items'),
+    'rent_reviews': (show_pm_rent_reviews_list, 'rent_reviews'),
+    'lease_expiries': (show_pm_lease_expiries_list, 'lease_expiries'),
+}
+
+def open_search_result(hit: dict, pm_data: pd.Series):
+    """
+    Open the drill-down holding a search hit
+
+    PM lists open filtered to the hit's record id, on the first page.
+
+    Args:
+        hit: Row of search.query() results
+        pm_data: Period row of the hit's portfolio manager
+    """
+    if hit['source'] == search.LANDLORD_SOURCE:
+        show_landlord_property_list(pm_data, hit['portfolio_manager'], hit['record_id'])
+        return
+
+    dialog, prefix = SEARCH_RESULT_DIALOGS[hit['source']]
+    table_key = f"{prefix}_{hit['portfolio_manager']}"
+    st.session_state[f"{table_key}_search"] = hit['record_id']
+    st.session_state[f"{table_key}_page"] = 1
+    dialog(pm_data, hit['portfolio_manager'])
+
+def _drill_to(node: int):
+    """Move the portfolio drill-down to a node; new table keys drop any stale row selection"""
+    st.session_state.drill_node = node
+    st.session_state.drill_step = st.session_state.get('drill_step', 0) + 1
+
+def _drill_to_selected(table_key: str, nodes: list):
+    """on_select callback: drill into the selected row's node"""
+    rows = st.session_state[table_key].selection.rows
+    if rows:
+        _drill_to(nodes[rows[0]])
+
+@st.dialog("Portfolio Drill-down", width="large")
+def show_portfolio_drill(tree: rollup.RollupTree, start_node: int = 0):
+    """
+    Drill agency -> PM -> landlord -> property along a breadcrumb
+
+    Every level reads the rollup tree's precomputed totals. Navigation runs
+    in widget callbacks, so a click only reruns the dialog.
+    """
+    node = st.session_state.get('drill_node', start_node)
+    if not 0 <= node < len(tree.parent):
+        node = start_node
+    step = st.session_state.get('drill_step', 0)
+
+    # Breadcrumb: ancestors are buttons, the current node is plain text
+    trail = rollup.path(tree, node)
+    for column, crumb in zip(st.columns(len(trail)), trail):
+        with column:
+            if crumb == node:
+                st.markdown(f"**{tree.label[crumb]}**")
+            else:
+                st.button(tree.label[crumb], key=f"drill_crumb_{step}_{crumb}", on_click=_drill_to, args=(crumb,),
+                          use_container_width=True)
+
+    summary = rollup.node_summary(tree, node)
+    col_title, col_download = st.columns([3, 1])
+    with col_title:
+        heading = summary['label'] if summary['level'] == summary['label'] else f"{summary['level']}: {summary['label']}"
+        st.markdown(f"### {heading}")
+    st.markdown(
+        f"**Properties: {summary['properties']:,.0f} | Leases: {summary['leases']:,.0f} | "
+        f"Vacancies: {summary['vacancies']:,.0f} | Occupancy: {summary['occupancy_rate']:.1f}% | "
+        f"Weekly Rent: ${summary['weekly_rent']:,.0f}**"
+    )
+
+    children = rollup.children(tree, node)
+    if children.empty:
+        return
+
+    child_level = rollup.LEVELS[tree.level[node] + 1]
+    if child_level == 'Property':
+        table = pd.DataFrame({
+            'Property ID': children['key'],
+            'Address': children['name'],
+            'Status': children['leases'].map(lambda leases: 'Leased' if leases else 'Vacant'),
+            'Weekly Rent': children['weekly_rent'],
+        })
+        formats = {'Weekly Rent': 'currency'}
+    else:
+        table = children[['name', 'properties', 'leases', 'vacancies', 'occupancy_rate', 'weekly_rent']].rename(columns={
+            'name': child_level, 'properties': 'Properties', 'leases': 'Leases', 'vacancies': 'Vacancies',
+            'occupancy_rate': 'Occupancy (%)', 'weekly_rent': 'Weekly Rent'
+        })
+        formats = {
+            'Properties': 'count', 'Leases': 'count', 'Vacancies': 'count',
+            'Occupancy (%)': 'percent', 'Weekly Rent': 'currency'
+        }
+
+    with col_download:
+        create_download_button(table, f"drill_{node}_{str(summary['label']).replace(' ', '_')}.csv")
+
+    table_key = f"drill_table_{step}_{node}"
+    tables.render_table(
+        table, formats, key=table_key, selection_mode="single-row",
+        on_select=partial(_drill_to_selected, table_key, children['node'].tolist())
     )
+    st.caption("Select a row to drill down")
+
+def open_portfolio_drill(tree: rollup.RollupTree, start_node: int):
+    """Open the portfolio drill-down at a node (e.g. the sidebar filter's scope)"""
+    _drill_to(start_node)
+    show_portfolio_drill(tree, start_node)
@@ -0,0 +1,139 @@
+"""
+Persistent, size-bounded drill-down cache in SQLite
+"""
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple
+import config
+from utils import singleflight
+
+VALUE_FORMAT = 5  # Bump when cached values change shape (e.g. column types) so old entries are never read
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'errors': 0}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+def enabled() -> bool:
+    """True when a cache file is configured"""
+    return bool(config.DISK_CACHE_PATH)
+
+def _count(name: str, amount: int = 1):
+    with _stats_lock:
+        _stats[name] += amount
+
+def _connection() -> sqlite3.Connection:
+    """Per-thread connection; WAL lets several worker processes share the file"""
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        path = Path(config.DISK_CACHE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(path), timeout=5, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        _local.connection = connection
+    return connection
+
+def make_key(key: Tuple[Hashable, ...]) -> str:
+    """Stable text key: the same tuple maps to the same row in every process"""
+    return hashlib.sha1(repr((VALUE_FORMAT,) + tuple(key)).encode('utf-8')).hexdigest()
+
+def get(key: Tuple[Hashable, ...]) -> Optional[Any]:
+    """Cached value for a key, or None; refreshes the entry's LRU position"""
+    digest = make_key(key)
+    connection = _connection()
+    row = connection.execute("SELECT value FROM entries WHERE key = ?", (digest,)).fetchone()
+    if row is None:
+        return None
+    connection.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), digest))
+    return pickle.loads(row[0])
+
+def put(key: Tuple[Hashable, ...], value: Any):
+    """Store a value (pickle protocol 5) and evict least recently used entries over the size limit"""
+    blob = pickle.dumps(value, protocol=5)
+    connection = _connection()
+    connection.execute(
+        "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+        (make_key(key), sqlite3.Binary(blob), len(blob), time.time())
+    )
+    evict(config.DISK_CACHE_MAX_BYTES)
+
+def evict(max_bytes: int) -> int:
+    """
+    Delete least recently used entries until the cache fits in max_bytes
+
+    Returns:
+        Number of entries deleted
+    """
+    connection = _connection()
+    total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    if total <= max_bytes:
+        return 0
+
+    deleted = []
+    for digest, size in connection.execute("SELECT key, size FROM entries ORDER BY last_access"):
+        if total <= max_bytes:
+            break
+        deleted.append((digest,))
+        total -= size
+    connection.executemany("DELETE FROM entries WHERE key = ?", deleted)
+    _count('evictions', len(deleted))
+    return len(deleted)
+
+def cached(key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+    """
+    Return a persisted value, computing and storing it on a miss
+
+    Keys should start with the data version so entries for old data age out
+    through LRU eviction. Storage errors never reach the caller: the value is
+    computed directly instead.
+
+    Args:
+        key: Tuple of (data version, entity, parameters...)
+        compute: Builds the value on a miss
+
+    Returns:
+        The cached or freshly computed value
+    """
+    if not enabled():
+        return compute()
+
+    try:
+        value = get(key)
+    except (sqlite3.Error, pickle.UnpicklingError, EOFError):
+        _count('errors')
+        return compute()
+    if value is not None:
+        _count('hits')
+        return value
+
+    _count('misses')
+
+    def compute_and_store():
+        result = compute()
+        try:
+            put(key, result)
+        except (sqlite3.Error, pickle.PicklingError):
+            _count('errors')
+        return result
+
+    return singleflight.do(('disk',) + tuple(key), compute_and_store)
+
+def get_stats() -> dict:
+    """Hits, misses, evictions and storage errors in this process"""
+    with _stats_lock:
+        return dict(_stats)
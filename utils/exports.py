@@ -0,0 +1,258 @@
+"""
+Lazy, chunked CSV and Excel exports for dashboard downloads
+"""
+import gzip
+import io
+from typing import Dict, Hashable, Optional, TextIO, Tuple
+import pandas as pd
+import streamlit as st
+import config
+from utils import disk_cache, views
+from utils.data_store import Snapshot
+
+EXCEL_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Excel number formats: cells hold numbers, Excel does the display formatting
+CURRENCY_FORMAT = '$#,##0.00'
+COUNT_FORMAT = '#,##0'
+DECIMAL_FORMAT = '#,##0.00'
+PERCENT_FORMAT = '0.0"%"'  # Values are already percentages (e.g. 92.5)
+DATE_FORMAT = 'dd mmm yyyy'
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')  # Day zero of Excel's 1900 date system
+MONTH_FORMAT = 'mmm yyyy'
+
+WORKBOOK_FORMATS = {
+    'Rent Roll': CURRENCY_FORMAT,
+    'Total Revenue': CURRENCY_FORMAT,
+    'Management Fees': CURRENCY_FORMAT,
+    'Leasing Fees': CURRENCY_FORMAT,
+    'Total Arrears': CURRENCY_FORMAT,
+    'Amount Overdue': CURRENCY_FORMAT,
+    'Occupancy %': PERCENT_FORMAT,
+    'Change %': PERCENT_FORMAT,
+    'Month': MONTH_FORMAT,
+}
+
+def write_csv(data: pd.DataFrame, handle: TextIO, chunk_rows: int = config.EXPORT_CHUNK_ROWS):
+    """Write a frame as CSV in row chunks so only one chunk is formatted at a time"""
+    if data.empty:
+        data.to_csv(handle, index=False)
+        return
+    for start in range(0, len(data), chunk_rows):
+        data.iloc[start:start + chunk_rows].to_csv(handle, index=False, header=start == 0)
+
+def csv_bytes(data: pd.DataFrame, compress: bool = False) -> bytes:
+    """
+    Encode a frame as UTF-8 CSV, optionally gzipped
+
+    Args:
+        data: Frame to export
+        compress: Gzip the output (mtime fixed so identical data gives identical bytes)
+
+    Returns:
+        The encoded file contents
+    """
+    buffer = io.BytesIO()
+    if compress:
+        with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as raw:
+            with io.TextIOWrapper(raw, encoding='utf-8', newline='') as text:
+                write_csv(data, text)
+    else:
+        text = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        write_csv(data, text)
+        text.flush()
+        text.detach()
+    return buffer.getvalue()
+
+def should_compress(data: pd.DataFrame) -> bool:
+    """True when a frame is large enough to download gzipped"""
+    return 0 < config.EXPORT_CSV_GZIP_ROWS <= len(data)
+
+def download_button(data: pd.DataFrame, filename: str, label: str = "📥 Download CSV",
+                    cache_key: Optional[Tuple[Hashable, ...]] = None):
+    """
+    Download button whose CSV is only built when the user clicks it
+
+    Args:
+        data: Frame to export
+        filename: Download file name; '.gz' is appended when the export is compressed
+        label: Button label
+        cache_key: (data version, filters, periods...) identifying the frame; when
+            given, the encoded file is kept in the persistent disk cache
+    """
+    # Callers may reformat columns for display after rendering the button;
+    # with copy-on-write a shallow copy pins the values as they are now
+    data = data.copy(deep=False)
+    compress = should_compress(data)
+    if compress:
+        filename = f"{filename}.gz"
+
+    def build() -> bytes:
+        if cache_key is None:
+            return csv_bytes(data, compress)
+        return disk_cache.cached(tuple(cache_key) + ('csv', filename), lambda: csv_bytes(data, compress))
+
+    st.download_button(
+        label=label,
+        data=build,
+        file_name=filename,
+        mime="application/gzip" if compress else "text/csv",
+        on_click="ignore",
+        use_container_width=True
+    )
+
+def _column_format(series: pd.Series) -> str:
+    """Default Excel number format for a column's dtype"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return DATE_FORMAT
+    if pd.api.types.is_integer_dtype(series):
+        return COUNT_FORMAT
+    if pd.api.types.is_numeric_dtype(series):
+        return DECIMAL_FORMAT
+    return 'General'
+
+def _excel_rows(frame: pd.DataFrame, chunk_rows: int = config.EXPORT_CHUNK_ROWS):
+    """
+    Yield rows as plain Python values, converting one chunk of rows at a time
+
+    Dates become Excel serial day numbers, so the column's date format
+    applies to them; missing values become None (blank cells).
+    """
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[start:start + chunk_rows]
+        columns = []
+        for column in chunk.columns:
+            values = chunk[column]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                values = (values - EXCEL_EPOCH) / pd.Timedelta(days=1)
+            columns.append(values.astype(object).where(values.notna(), None).tolist())
+        yield from zip(*columns)
+
+def excel_bytes(sheets: Dict[str, pd.DataFrame], formats: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    Write frames to an .xlsx workbook, one sheet per frame
+
+    Rows are streamed with xlsxwriter's constant_memory mode, so only the
+    current row of each sheet (and one chunk of converted values) is held in
+    memory. Numeric and date cells keep their values and get Excel number
+    formats per column.
+
+    Args:
+        sheets: Sheet name -> frame, in sheet order
+        formats: Column name -> Excel number format, overriding the dtype default
+
+    Returns:
+        The encoded workbook
+    """
+    import xlsxwriter  # Only needed when a workbook is actually exported
+
+    formats = formats or {}
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {
+        'constant_memory': True,
+        'nan_inf_to_errors': True,
+    })
+    workbook.set_properties({'title': config.EXPORT_EXCEL_SHEET_NAME})
+    header_format = workbook.add_format({'bold': True, 'bottom': 1})
+    cell_formats = {}
+
+    for sheet_name, frame in sheets.items():
+        worksheet = workbook.add_worksheet(sheet_name[:31])
+        for position, column in enumerate(frame.columns):
+            number_format = formats.get(column) or _column_format(frame[column])
+            if number_format not in cell_formats:
+                cell_formats[number_format] = workbook.add_format({'num_format': number_format})
+            width = min(max(len(str(column)), 10) + 2, 50)
+            worksheet.set_column(position, position, width, cell_formats[number_format])
+
+        worksheet.write_row(0, 0, [str(column) for column in frame.columns], header_format)
+        # constant_memory requires writing in row order
+        for row_number, row in enumerate(_excel_rows(frame), start=1):
+            worksheet.write_row(row_number, 0, row)
+        worksheet.freeze_panes(1, 0)
+
+    workbook.close()
+    return buffer.getvalue()
+
+def dashboard_workbook_sheets(snapshot: Snapshot, selected_agency: str, selected_pm: str,
+                              current_date: pd.Timestamp, comparison_date: pd.Timestamp) -> Dict[str, pd.DataFrame]:
+    """
+    One sheet per dashboard tab, built from the cached views for the filters and periods
+
+    Returns:
+        Sheet name -> frame: KPIs, PM Breakdown, Arrears Detail, Critical Dates, Diary Items
+    """
+    kpis = views.period_kpis(snapshot, selected_agency, selected_pm, current_date)
+    comparison_kpis = views.period_kpis(snapshot, selected_agency, selected_pm, comparison_date)
+    kpi_labels = {
+        'landlords': 'Landlords', 'properties': 'Properties', 'leases': 'Leases', 'vacancies': 'Vacancies',
+        'avg_occupancy': 'Average Occupancy %', 'rent_roll': 'Rent Roll', 'total_revenue': 'Total Revenue',
+        'total_arrears': 'Total Arrears', 'avg_fee': 'Average Fee per Tenancy',
+    }
+    kpi_sheet = pd.DataFrame({
+        'KPI': list(kpi_labels.values()),
+        'Current Period': [float(kpis[key]) for key in kpi_labels],
+        'Comparison Period': [float(comparison_kpis[key]) for key in kpi_labels],
+    })
+    kpi_sheet['Change %'] = ((kpi_sheet['Current Period'] - kpi_sheet['Comparison Period'])
+                             / kpi_sheet['Comparison Period'] * 100).round(1)
+
+    _, current_data = views.period_data(snapshot, selected_agency, selected_pm, current_date)
+    pm_sheet = current_data.groupby('portfolio_manager').agg({
+        'properties': 'sum', 'leases': 'sum', 'vacancies': 'sum', 'occupancy_rate': 'mean',
+        'rent_roll': 'sum', 'total_revenue': 'sum', 'management_fees': 'sum',
+        'leasing_fees': 'sum', 'total_arrears': 'sum',
+    }).reset_index()
+    pm_sheet.columns = ['Portfolio Manager', 'Properties', 'Leases', 'Vacancies', 'Occupancy %', 'Rent Roll',
+                        'Total Revenue', 'Management Fees', 'Leasing Fees', 'Total Arrears']
+
+    arrears_sheet = views.arrears_details(snapshot, selected_agency, selected_pm).rename(columns={
+        'property_address': 'Property Address', 'tenant_name': 'Tenant', 'property_type': 'Property Type',
+        'amount_overdue': 'Amount Overdue', 'days_overdue': 'Days Overdue',
+    })
+
+    rent_reviews = views.critical_dates_details(snapshot, selected_agency, selected_pm, "rent_reviews")
+    lease_expiries = views.critical_dates_details(snapshot, selected_agency, selected_pm, "lease_expiries")
+    critical_dates_sheet = pd.DataFrame({
+        'Month': rent_reviews['month_date'],
+        'Rent Reviews': rent_reviews['count'],
+        'Lease Expiries': lease_expiries['count'],
+    })
+
+    diary_sheet = pd.concat([
+        views.diary_items_details(snapshot, selected_agency, selected_pm, status).assign(status=status.title())
+        for status in ('overdue', 'completed')
+    ], ignore_index=True).rename(columns={
+        'item_type': 'Item Type', 'property_address': 'Property Address', 'due_date': 'Due Date',
+        'portfolio_manager': 'Portfolio Manager', 'days_overdue': 'Days Overdue', 'status': 'Status',
+    })
+
+    return {
+        'KPIs': kpi_sheet,
+        'PM Breakdown': pm_sheet,
+        'Arrears Detail': arrears_sheet,
+        'Critical Dates': critical_dates_sheet,
+        'Diary Items': diary_sheet,
+    }
+
+def workbook_download_button(snapshot: Snapshot, selected_agency: str, selected_pm: str,
+                             current_date: pd.Timestamp, comparison_date: pd.Timestamp,
+                             label: str = "📊 Download Excel Workbook"):
+    """Download button for the dashboard workbook; sheets are built and written only on click"""
+    cache_key = (snapshot.version, selected_agency, selected_pm, current_date, comparison_date, 'xlsx')
+
+    def build() -> bytes:
+        return disk_cache.cached(cache_key, lambda: excel_bytes(
+            dashboard_workbook_sheets(snapshot, selected_agency, selected_pm, current_date, comparison_date),
+            WORKBOOK_FORMATS
+        ))
+
+    scope = selected_pm if selected_pm != "All Managers" else selected_agency
+    st.download_button(
+        label=label,
+        data=build,
+        file_name=f"dashboard_{scope.replace(' ', '_')}_{current_date:%Y_%m}.xlsx",
+        mime=EXCEL_MIME,
+        on_click="ignore",
+        use_container_width=True
+    )
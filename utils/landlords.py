@@ -0,0 +1,97 @@
+"""
+Landlord revenue table with precomputed top-K rankings per scope and period
+"""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+import numpy as np
+import pandas as pd
+import config
+from utils import data_generator, data_store, trends
+from utils.data_store import Snapshot
+
+RANKING_COLUMNS = ['landlord_name', 'portfolio_manager', 'properties', 'revenue']
+
+@dataclass(frozen=True)
+class LandlordRanking:
+    """
+    Landlord-month table and, for every (trend scope, month), the rows of
+    its depth highest-revenue landlords, best first
+    """
+    version: str
+    table: pd.DataFrame  # data_generator.generate_landlord_revenue() output
+    depth: int  # Landlords kept per ranking
+    top: Dict[Tuple[str, pd.Timestamp], np.ndarray]  # (scope, month) -> table positions
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k largest values, largest first
+
+    np.argpartition finds them in linear time; only those k are sorted.
+    Equal values keep position order.
+    """
+    if len(values) > k:
+        candidates = np.sort(np.argpartition(-values, k - 1)[:k])
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+def build_ranking(table: pd.DataFrame, version: str, depth: int = config.TOP_LANDLORDS_DEPTH) -> LandlordRanking:
+    """
+    Rank landlords for the whole agency, each agency and each PM in every month
+
+    Args:
+        table: Landlord-month rows from data_generator.generate_landlord_revenue()
+        version: Data version the table belongs to
+        depth: Landlords kept per scope and month
+    """
+    table = table.reset_index(drop=True)
+    revenue = table['revenue'].to_numpy()
+    top = {}
+    for date, positions in table.groupby('date').indices.items():
+        top[(trends.WHOLE_AGENCY_SCOPE, pd.Timestamp(date))] = positions[top_k(revenue[positions], depth)]
+    for column in ('agency', 'portfolio_manager'):
+        for (scope, date), positions in table.groupby([column, 'date']).indices.items():
+            top[(scope, pd.Timestamp(date))] = positions[top_k(revenue[positions], depth)]
+    return LandlordRanking(version=version, table=table, depth=depth, top=top)
+
+def get_ranking(snapshot: Snapshot) -> LandlordRanking:
+    """Landlord rankings for every scope and month, built once per data version"""
+    return data_store.cached(
+        snapshot.version, ('landlord_ranking',),
+        lambda: build_ranking(data_generator.generate_landlord_revenue(snapshot.df), snapshot.version)
+    )
+
+def top_landlords(ranking: LandlordRanking, selected_agency: str, selected_pm: str,
+                  date: pd.Timestamp, limit: int = 10) -> pd.DataFrame:
+    """
+    Highest-revenue landlords for the sidebar filters in one month
+
+    Args:
+        ranking: Rankings from get_ranking()
+        selected_agency: Sidebar agency filter
+        selected_pm: Sidebar PM filter
+        date: Month of the ranking (an exact month in the data)
+        limit: Landlords returned; rankings deeper than ranking.depth are ranked on demand
+
+    Returns:
+        DataFrame with RANKING_COLUMNS, best first
+    """
+    if limit <= ranking.depth:
+        scope = trends.get_scope(selected_agency, selected_pm)
+        positions = ranking.top.get((scope, pd.Timestamp(date)), np.empty(0, dtype=np.int64))
+    else:
+        table = ranking.table
+        in_scope = table['date'] == date
+        if selected_pm != "All Managers":
+            in_scope &= table['portfolio_manager'] == selected_pm
+        elif selected_agency != "Whole Agency":
+            in_scope &= table['agency'] == selected_agency
+        positions = np.flatnonzero(in_scope.to_numpy())
+        positions = positions[top_k(table['revenue'].to_numpy()[positions], limit)]
+    rows = ranking.table.iloc[positions[:limit]].rename(columns={'landlord': 'landlord_name'})
+    return rows[RANKING_COLUMNS].reset_index(drop=True)
+
+def display_names(landlords: pd.DataFrame) -> pd.Series:
+    """Landlord names, with the PM added where the same name appears under more than one PM"""
+    names = landlords['landlord_name']
+    return names.where(~names.duplicated(keep=False), names + " (" + landlords['portfolio_manager'] + ")")
@@ -1,7 +1,8 @@
 """
 Metrics calculation utilities
 """
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 def calculate_percent_change(current: float, previous: float) -> float:
@@ -34,6 +35,16 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     """Format value as percentage"""
     return f"{value:.{decimals}f}%"
 
+def format_age(seconds: float) -> str:
+    """Format an elapsed time as a short 'x ago' string"""
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} d ago"
+
 def calculate_vacancy_rate(vacancies: int, total_properties: int) -> float:
     """Calculate vacancy rate as percentage"""
     if total_properties == 0:
@@ -78,21 +89,53 @@ def get_period_comparison(df: pd.DataFrame, date_column: str, current_date, last
         "last_year": last_year_data
     }
 
+def calculate_period_breakdown(current_data: pd.DataFrame, comparison_data: pd.DataFrame, metric: str,
+                               agg: str = 'sum', decimals: Optional[int] = None) -> pd.DataFrame:
+    """
+    Per-PM current vs comparison values of a metric with absolute and % change
+
+    Args:
+        current_data: Rows for the current period
+        comparison_data: Rows for the comparison period (current values are reused if empty)
+        metric: Column to aggregate
+        agg: 'sum' or 'mean'
+        decimals: Optional rounding applied to both period columns
+
+    Returns:
+        DataFrame with Portfolio Manager, Current Period, Comparison Period,
+        Change and Change %, sorted by Current Period descending
+    """
+    current_breakdown = current_data.groupby('portfolio_manager')[metric].agg(agg).reset_index()
+    current_breakdown.columns = ['Portfolio Manager', 'Current Period']
+    if decimals is not None:
+        current_breakdown['Current Period'] = current_breakdown['Current Period'].round(decimals)
+
+    if comparison_data.empty:
+        comparison_breakdown = current_breakdown.copy()
+    else:
+        comparison_breakdown = comparison_data.groupby('portfolio_manager')[metric].agg(agg).reset_index()
+    comparison_breakdown.columns = ['Portfolio Manager', 'Comparison Period']
+    if decimals is not None:
+        comparison_breakdown['Comparison Period'] = comparison_breakdown['Comparison Period'].round(decimals)
+
+    breakdown = current_breakdown.merge(comparison_breakdown, on='Portfolio Manager', how='outer').fillna(0)
+    breakdown['Change'] = breakdown['Current Period'] - breakdown['Comparison Period']
+    breakdown['Change %'] = ((breakdown['Current Period'] - breakdown['Comparison Period']) / breakdown['Comparison Period'] * 100).round(1)
+    return breakdown.sort_values('Current Period', ascending=False)
+
 def calculate_growth_rate(values: list) -> float:
     """Calculate average growth rate from a list of values"""
-    if len(values) < 2:
+    values = np.asarray(values, dtype=float)
+    if values.size < 2:
         return 0.0
 
-    total_growth = 0.0
-    count = 0
-
-    for i in range(1, len(values)):
-        if values[i-1] != 0:
-            growth = ((values[i] - values[i-1]) / values[i-1]) * 100
-            total_growth += growth
-            count += 1
+    previous, current = values[:-1], values[1:]
+    valid = previous != 0
+    if not valid.any():
+        return 0.0
 
-    return total_growth / count if count > 0 else 0.0
+    growth = (current[valid] - previous[valid]) / previous[valid] * 100
+    return float(growth.mean())
 
 def rank_by_value(df: pd.DataFrame, value_column: str, ascending: bool = False) -> pd.DataFrame:
     """Rank dataframe by a value column"""
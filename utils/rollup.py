@@ -0,0 +1,177 @@
+"""
+Precomputed Whole Agency -> agency -> PM -> landlord -> property rollup tree
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from utils import data_generator, data_store, views
+from utils.data_store import Snapshot
+
+LEVELS = ['Whole Agency', 'Agency', 'Portfolio Manager', 'Landlord', 'Property']
+GROUP_COLUMNS = ['agency', 'portfolio_manager', 'landlord']  # Register columns keying levels 1-3
+METRICS = ['properties', 'leases', 'vacancies', 'weekly_rent']
+
+@dataclass(frozen=True)
+class RollupTree:
+    """
+    Nodes stored level by level in flat arrays
+
+    Every node's children are the contiguous range
+    child_start[i]:child_end[i], and metrics hold each node's totals, so any
+    level of the drill reads slices instead of re-grouping.
+    """
+    version: str
+    date: pd.Timestamp  # Period of the register the tree was built from
+    level: np.ndarray  # Node -> index into LEVELS
+    key: np.ndarray  # Node -> agency, PM or landlord name, or property id
+    label: np.ndarray  # Node -> display name (the address for properties)
+    parent: np.ndarray  # Node -> parent node, -1 for the root
+    child_start: np.ndarray
+    child_end: np.ndarray
+    metrics: Dict[str, np.ndarray]  # Metric -> node totals
+
+def build_tree(register: pd.DataFrame, version: str, date: pd.Timestamp) -> RollupTree:
+    """
+    Build the tree from a property register in one pass per level
+
+    Properties are sorted by agency, PM, landlord and id, so each level's
+    groups are runs of rows and a parent's children are adjacent. Totals
+    are summed bottom-up with np.bincount over the run codes.
+
+    Args:
+        register: data_generator.generate_property_register() output
+        version: Data version the register belongs to
+        date: Period of the register
+    """
+    register = register.sort_values(GROUP_COLUMNS + ['property_id'], kind='stable').reset_index(drop=True)
+    size = len(register)
+
+    # Run starts and codes per grouped level: a new run begins wherever any key up to that level changes
+    starts, codes = [], []
+    changed = np.zeros(size, dtype=bool)
+    if size:
+        changed[0] = True
+    for column in GROUP_COLUMNS:
+        values = register[column].to_numpy(dtype=object)
+        changed = changed | np.concatenate([[size > 0], values[1:] != values[:-1]])[:size]
+        starts.append(np.flatnonzero(changed))
+        codes.append(np.cumsum(changed) - 1)
+
+    counts = [1] + [len(level_starts) for level_starts in starts] + [size]
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    leased = (register['status'] == 'Leased').to_numpy(dtype=np.float64)
+    leaf = {
+        'properties': np.ones(size),
+        'leases': leased,
+        'vacancies': 1 - leased,
+        'weekly_rent': register['weekly_rent'].fillna(0).to_numpy(dtype=np.float64),
+    }
+
+    # Bottom-up totals: leaves -> landlords -> PMs -> agencies -> root
+    per_level = {metric: [values] for metric, values in leaf.items()}
+    child_codes = [codes[2]] + [codes[depth - 1][starts[depth]] for depth in (2, 1)]
+    for depth, group_codes in zip((3, 2, 1), child_codes):
+        for metric in METRICS:
+            per_level[metric].insert(0, np.bincount(group_codes, weights=per_level[metric][0], minlength=counts[depth]))
+    for metric in METRICS:
+        per_level[metric].insert(0, np.array([per_level[metric][0].sum()]))
+    metrics = {metric: np.concatenate(levels) for metric, levels in per_level.items()}
+
+    parent = np.concatenate([
+        [-1],
+        np.zeros(counts[1], dtype=np.int64),
+        offsets[1] + codes[0][starts[1]],
+        offsets[2] + codes[1][starts[2]],
+        offsets[3] + codes[2],
+    ]).astype(np.int32)
+    level = np.repeat(np.arange(len(LEVELS), dtype=np.int8), counts)
+
+    keys = [np.array(["Whole Agency"], dtype=object)]
+    keys += [register[column].to_numpy(dtype=object)[level_starts] for column, level_starts in zip(GROUP_COLUMNS, starts)]
+    labels = keys + [register['address'].to_numpy(dtype=object)]
+    keys = keys + [register['property_id'].to_numpy(dtype=object)]
+
+    # Levels are stored in order and runs are sorted, so parent ids never decrease along the arrays
+    nodes = np.arange(len(parent))
+    return RollupTree(
+        version=version,
+        date=date,
+        level=level,
+        key=np.concatenate(keys),
+        label=np.concatenate(labels),
+        parent=parent,
+        child_start=np.searchsorted(parent, nodes, side='left').astype(np.int32),
+        child_end=np.searchsorted(parent, nodes, side='right').astype(np.int32),
+        metrics=metrics,
+    )
+
+def get_tree(snapshot: Snapshot, date: pd.Timestamp) -> RollupTree:
+    """Rollup tree for the month on or before a date, built once per data version and month"""
+    actual_date, rows = views.period_data(snapshot, "Whole Agency", "All Managers", date)
+    return data_store.cached(
+        snapshot.version, ('rollup_tree', actual_date),
+        lambda: build_tree(data_generator.generate_property_register(rows), snapshot.version, actual_date)
+    )
+
+def path(tree: RollupTree, node: int) -> List[int]:
+    """Nodes from the root down to node, for a breadcrumb"""
+    nodes = [node]
+    while tree.parent[nodes[-1]] >= 0:
+        nodes.append(int(tree.parent[nodes[-1]]))
+    return nodes[::-1]
+
+def find(tree: RollupTree, *keys: str) -> int:
+    """
+    Node reached by following keys down from the root, e.g. find(tree, agency, pm)
+
+    Returns:
+        The deepest node matched; stops early at a key that isn't found
+    """
+    node = 0
+    for key in keys:
+        children = tree.key[tree.child_start[node]:tree.child_end[node]]
+        matches = np.flatnonzero(children == key)
+        if not len(matches):
+            break
+        node = int(tree.child_start[node] + matches[0])
+    return node
+
+def scope_node(tree: RollupTree, selected_agency: str, selected_pm: str) -> int:
+    """Node for the sidebar filters: the PM's node, else the agency's, else the root"""
+    if selected_pm != "All Managers":
+        matches = np.flatnonzero((tree.level == LEVELS.index('Portfolio Manager')) & (tree.key == selected_pm))
+        if len(matches):
+            return int(matches[0])
+    if selected_agency != "Whole Agency":
+        return find(tree, selected_agency)
+    return 0
+
+def node_summary(tree: RollupTree, node: int) -> dict:
+    """A node's level, label and totals, with occupancy in percent"""
+    summary = {'level': LEVELS[tree.level[node]], 'label': tree.label[node]}
+    summary.update({metric: float(values[node]) for metric, values in tree.metrics.items()})
+    summary['occupancy_rate'] = summary['leases'] / summary['properties'] * 100 if summary['properties'] else 0.0
+    return summary
+
+def children(tree: RollupTree, node: int) -> pd.DataFrame:
+    """
+    A node's children with their precomputed totals
+
+    Returns:
+        DataFrame with node, key, name and the METRICS columns plus
+        occupancy_rate, in tree order
+    """
+    start, end = int(tree.child_start[node]), int(tree.child_end[node])
+    frame = pd.DataFrame({
+        'node': np.arange(start, end),
+        'key': tree.key[start:end],
+        'name': tree.label[start:end],
+    })
+    for metric, values in tree.metrics.items():
+        frame[metric] = values[start:end]
+    properties = frame['properties'].to_numpy()
+    frame['occupancy_rate'] = np.divide(frame['leases'].to_numpy() * 100, properties,
+                                        out=np.zeros(len(frame)), where=properties > 0)
+    return frame
@@ -0,0 +1,204 @@
+"""
+In-memory full-text search over drill-down entities: properties, leases, tenants, landlords and diary items
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import reduce
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from utils import bulk_export, data_store, views
+from utils.data_store import Snapshot
+
+# PM list (see bulk_export.PM_LISTS) -> (entity kind, title column, detail column, record id column)
+ENTITY_SOURCES = {
+    'properties': ('Property', 'Address', 'Property Type', 'Property ID'),
+    'leases': ('Lease', 'Address', 'Tenant', 'Lease ID'),
+    'overdue_items': ('Overdue item', 'Property', 'Task Type', 'Item ID'),
+    'completed_items': ('Completed item', 'Property', 'Task Type', 'Item ID'),
+    'rent_reviews': ('Rent review', 'Address', 'Tenant', 'Property ID'),
+    'lease_expiries': ('Lease expiry', 'Address', 'Tenant', 'Lease ID'),
+}
+LANDLORD_SOURCE = 'landlord_properties'
+TOP_LANDLORDS_PER_PM = 10
+
+ENTITY_COLUMNS = ['kind', 'title', 'detail', 'record_id', 'source', 'portfolio_manager', 'agency', 'properties']
+EMPTY = np.empty(0, dtype=np.int32)
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Token and trigram inverted indexes over one data version's entities"""
+    version: str
+    date: pd.Timestamp  # Period the entities were generated for
+    entities: pd.DataFrame  # One row per entity, ENTITY_COLUMNS
+    pm_rows: Dict[str, dict]  # PM name -> its period row, to open drill-downs
+    vocabulary: List[str]  # Sorted distinct tokens
+    postings: List[np.ndarray]  # Token id -> sorted entity ids containing the token
+    trigrams: Dict[str, np.ndarray]  # Trigram -> sorted token ids containing it
+    agency_codes: np.ndarray  # Entity id -> code into agencies
+    agencies: List[str]
+    pm_codes: np.ndarray  # Entity id -> code into managers
+    managers: List[str]
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens: '42 King St, Glebe' -> ['42', 'king', 'st', 'glebe']"""
+    return _TOKEN.findall(text.lower())
+
+def _trigrams(token: str) -> set:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+def collect_entities(snapshot: Snapshot, date: pd.Timestamp) -> pd.DataFrame:
+    """
+    Searchable entities from every PM's drill-down lists for one period
+
+    Returns:
+        Frame with ENTITY_COLUMNS, in a stable order for a given data version
+    """
+    _, rows = views.period_data(snapshot, "Whole Agency", "All Managers", date)
+    frames = []
+    for row in rows.sort_values('portfolio_manager').to_dict('records'):
+        pm_name, pm_data = row['portfolio_manager'], pd.Series(row)
+        for source, (kind, title, detail, record_id) in ENTITY_SOURCES.items():
+            data = bulk_export.PM_LISTS[source](pm_data, pm_name, snapshot.as_of)
+            if data.empty:
+                continue
+            frames.append(pd.DataFrame({
+                'kind': kind,
+                'title': data[title].astype(str),
+                'detail': data[detail].astype(str),
+                'record_id': data[record_id].astype(str),
+                'source': source,
+                'portfolio_manager': pm_name,
+                'agency': row['agency'],
+                'properties': 0,
+            }))
+
+        landlords = views.top_landlords(snapshot, "Whole Agency", pm_name, date, limit=TOP_LANDLORDS_PER_PM)
+        if not landlords.empty:
+            frames.append(pd.DataFrame({
+                'kind': 'Landlord',
+                'title': landlords['landlord_name'],
+                'detail': landlords['properties'].map(lambda count: f"{count} properties"),
+                'record_id': landlords['landlord_name'],
+                'source': LANDLORD_SOURCE,
+                'portfolio_manager': pm_name,
+                'agency': row['agency'],
+                'properties': landlords['properties'],
+            }))
+
+    if not frames:
+        return pd.DataFrame(columns=ENTITY_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[ENTITY_COLUMNS]
+
+def build_index(version: str, date: pd.Timestamp, entities: pd.DataFrame, pm_rows: Dict[str, dict]) -> SearchIndex:
+    """
+    Index entity titles, details and record ids
+
+    Tokens map to the entities containing them; trigrams map to the tokens
+    containing them, so a partial word is resolved against the (small)
+    vocabulary before touching entity postings.
+    """
+    token_entities: Dict[str, List[int]] = {}
+    text = entities['title'] + ' ' + entities['detail'] + ' ' + entities['record_id']
+    for entity_id, value in enumerate(text):
+        for token in set(tokenize(value)):
+            token_entities.setdefault(token, []).append(entity_id)
+
+    vocabulary = sorted(token_entities)
+    postings = [np.asarray(token_entities[token], dtype=np.int32) for token in vocabulary]
+
+    gram_tokens: Dict[str, List[int]] = {}
+    for token_id, token in enumerate(vocabulary):
+        for gram in _trigrams(token):
+            gram_tokens.setdefault(gram, []).append(token_id)
+    trigrams = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in gram_tokens.items()}
+
+    agencies = pd.Categorical(entities['agency'])
+    managers = pd.Categorical(entities['portfolio_manager'])
+    # Object columns: taking a handful of hits from Arrow-backed strings costs milliseconds per column
+    entities = entities.astype({column: object for column in ENTITY_COLUMNS if column != 'properties'})
+    return SearchIndex(
+        version=version,
+        date=date,
+        entities=entities,
+        pm_rows=pm_rows,
+        vocabulary=vocabulary,
+        postings=postings,
+        trigrams=trigrams,
+        agency_codes=np.asarray(agencies.codes),
+        agencies=list(agencies.categories),
+        pm_codes=np.asarray(managers.codes),
+        managers=list(managers.categories),
+    )
+
+def get_index(snapshot: Snapshot) -> SearchIndex:
+    """Search index for the latest period, built once per data version"""
+    def build():
+        date, _ = views.default_periods(snapshot)
+        _, rows = views.period_data(snapshot, "Whole Agency", "All Managers", date)
+        pm_rows = {row['portfolio_manager']: row for row in rows.to_dict('records')}
+        return build_index(snapshot.version, date, collect_entities(snapshot, date), pm_rows)
+
+    return data_store.cached(snapshot.version, ('search_index',), build)
+
+def _term_tokens(index: SearchIndex, term: str) -> List[int]:
+    """Ids of vocabulary tokens containing a query term (prefix match for terms under 3 characters)"""
+    if len(term) < 3:
+        start = bisect_left(index.vocabulary, term)
+        end = bisect_left(index.vocabulary, term + '\uffff')
+        return list(range(start, end))
+    candidates = reduce(
+        lambda left, right: np.intersect1d(left, right, assume_unique=True),
+        sorted((index.trigrams.get(gram, EMPTY) for gram in _trigrams(term)), key=len)
+    )
+    # Trigrams only bound the match; confirm the term is a real substring
+    return [int(token_id) for token_id in candidates if term in index.vocabulary[token_id]]
+
+def query(index: SearchIndex, text: str, selected_agency: str = "Whole Agency",
+          selected_pm: str = "All Managers", limit: int = 10) -> pd.DataFrame:
+    """
+    Entities matching every term of a query, best matches first
+
+    A term scores 2 where it is a whole token of the entity and 1 where it
+    is only part of one. Ties keep index order.
+
+    Args:
+        index: Index from get_index()
+        text: Free-text query
+        selected_agency: Restrict hits to an agency ("Whole Agency" for all)
+        selected_pm: Restrict hits to a portfolio manager ("All Managers" for all)
+        limit: Maximum hits returned
+
+    Returns:
+        Matching rows of index.entities with an added 'score' column
+    """
+    terms = list(dict.fromkeys(tokenize(text)))
+    if not terms:
+        return index.entities.iloc[:0].assign(score=pd.Series(dtype='int64'))
+
+    # Boolean masks over entity ids: unions and intersections cost O(postings), not a sort
+    size = len(index.entities)
+    matched = np.ones(size, dtype=bool)
+    if selected_agency != "Whole Agency":
+        matched &= index.agency_codes == (index.agencies.index(selected_agency) if selected_agency in index.agencies else -2)
+    if selected_pm != "All Managers":
+        matched &= index.pm_codes == (index.managers.index(selected_pm) if selected_pm in index.managers else -2)
+
+    whole_tokens = np.zeros(size, dtype=np.int16)
+    for term in terms:
+        term_matched = np.zeros(size, dtype=bool)
+        for token_id in _term_tokens(index, term):
+            term_matched[index.postings[token_id]] = True
+        matched &= term_matched
+
+        position = bisect_left(index.vocabulary, term)
+        if position < len(index.vocabulary) and index.vocabulary[position] == term:
+            whole_tokens[index.postings[position]] += 1
+
+    candidates = np.flatnonzero(matched)
+    scores = len(terms) + whole_tokens[candidates]
+    # Stable sort on small integers keeps index order within a score
+    order = np.argsort(-scores, kind='stable')[:limit]
+    return index.entities.iloc[candidates[order]].assign(score=scores[order].astype('int64'))
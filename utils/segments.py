@@ -0,0 +1,157 @@
+"""
+Memory-mapped dataset segments shared by every worker process on a host
+"""
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+import config
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, workers may publish the same data twice
+    fcntl = None
+
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "current.json"
+LOCK_NAME = ".publish.lock"
+
+def enabled() -> bool:
+    """True when a segment directory is configured"""
+    return bool(config.DATA_SEGMENT_DIR)
+
+def _root() -> Path:
+    root = Path(config.DATA_SEGMENT_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+@contextmanager
+def publish_lock():
+    """Exclusive lock across worker processes while a new version is published"""
+    with open(_root() / LOCK_NAME, "w") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+def _write_json(path: Path, payload: dict):
+    """Write JSON atomically so readers never see a partial file"""
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    tmp.write_text(json.dumps(payload, indent=2))
+    os.replace(tmp, path)
+
+def _write_frame(df: pd.DataFrame, directory: Path) -> list:
+    """
+    Save each column as its own .npy file
+
+    Numeric columns are stored as-is, datetimes as int64 ticks of their
+    unit and text columns as integer codes with their categories kept in
+    the manifest.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    columns = []
+    for position, name in enumerate(df.columns):
+        series = df[name]
+        entry = {'name': name, 'file': f"{position:03d}.npy"}
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.to_numpy()
+            entry['kind'] = 'datetime'
+            entry['dtype'] = str(values.dtype)
+            values = values.view('int64')
+        elif pd.api.types.is_numeric_dtype(series):
+            values = series.to_numpy()
+            entry['kind'] = 'numeric'
+        else:
+            categorical = pd.Categorical(series)
+            values = categorical.codes
+            entry['kind'] = 'category'
+            entry['categories'] = [str(category) for category in categorical.categories]
+        np.save(directory / entry['file'], np.ascontiguousarray(values))
+        columns.append(entry)
+    return columns
+
+def _read_frame(directory: Path, columns: list) -> pd.DataFrame:
+    """Attach to saved columns; numeric and datetime columns stay memory-mapped"""
+    data = {}
+    for entry in columns:
+        values = np.load(directory / entry['file'], mmap_mode='r')
+        if entry['kind'] == 'datetime':
+            values = values.view(entry['dtype'])
+        elif entry['kind'] == 'category':
+            # Text can't be memory-mapped; decode the shared codes into this worker's strings (code -1 -> NaN)
+            values = np.asarray(pd.Categorical.from_codes(values, entry['categories']), dtype=object)
+        data[entry['name']] = values
+    return pd.DataFrame(data, copy=False)
+
+def publish(version: str, frames: Dict[str, pd.DataFrame], metadata: Optional[dict] = None) -> dict:
+    """
+    Write frames as a new versioned segment and make it current
+
+    Call inside publish_lock() when several workers may publish at once.
+    Versions are content fingerprints, so a version that is already on disk
+    is re-stamped and made current rather than rewritten under workers that
+    may have it mapped.
+
+    Args:
+        version: Snapshot version, used as the segment directory name
+        frames: Named frames to store (e.g. 'df', 'trend_cube')
+        metadata: JSON-serialisable values kept with the manifest (e.g. the as-of date)
+
+    Returns:
+        The manifest written for this version
+    """
+    directory = _root() / version
+    try:
+        manifest = json.loads((directory / MANIFEST_NAME).read_text())
+        manifest['created_at'] = time.time()
+    except (FileNotFoundError, ValueError):
+        manifest = {
+            'version': version,
+            'created_at': time.time(),
+            'metadata': metadata or {},
+            'frames': {name: _write_frame(df, directory / name) for name, df in frames.items()}
+        }
+    _write_json(directory / MANIFEST_NAME, manifest)
+    _write_json(_root() / CURRENT_NAME, {'version': version})
+    return manifest
+
+def current_manifest() -> Optional[dict]:
+    """Manifest of the current segment, or None if nothing has been published"""
+    try:
+        version = json.loads((_root() / CURRENT_NAME).read_text())['version']
+        return json.loads((_root() / version / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+def attach(manifest: dict) -> Dict[str, pd.DataFrame]:
+    """Open every frame of a published segment zero-copy"""
+    directory = _root() / manifest['version']
+    return {name: _read_frame(directory / name, columns) for name, columns in manifest['frames'].items()}
+
+def retire(keep: int = 2):
+    """
+    Delete all but the newest `keep` segments
+
+    The previous version is kept so sessions still rendering it are not cut
+    off; on POSIX, workers that have a retired segment mapped keep reading it
+    until they drop the snapshot.
+    """
+    current = current_manifest()
+    versions = []
+    for directory in _root().iterdir():
+        manifest_path = directory / MANIFEST_NAME
+        if directory.is_dir() and manifest_path.exists():
+            created_at = json.loads(manifest_path.read_text()).get('created_at', 0)
+            versions.append((created_at, directory))
+
+    for _, directory in sorted(versions, reverse=True)[keep:]:
+        if current is None or directory.name != current['version']:
+            shutil.rmtree(directory, ignore_errors=True)
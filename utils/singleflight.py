@@ -0,0 +1,66 @@
+"""
+Single-flight call coalescing for expensive loads
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+# key -> in-flight call record: {'done': Event, 'result': value, 'error': exception}
+_calls: Dict[Hashable, Dict[str, Any]] = {}
+_lock = threading.Lock()
+_stats = {'calls': 0, 'executed': 0, 'coalesced': 0, 'errors': 0}
+
+def do(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """
+    Run compute once for all concurrent callers asking for the same key
+
+    The first caller (the leader) runs compute; callers arriving while it is
+    in flight wait for its result instead of starting their own. Errors are
+    re-raised in every waiting caller. Nothing is remembered once the call
+    completes; caching results is the caller's job.
+
+    Args:
+        key: Hashable identity of the computation
+        compute: Function producing the value
+
+    Returns:
+        The value returned by the leader's compute
+    """
+    with _lock:
+        _stats['calls'] += 1
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = {'done': threading.Event(), 'result': None, 'error': None}
+            _calls[key] = call
+            _stats['executed'] += 1
+        else:
+            _stats['coalesced'] += 1
+
+    if not leader:
+        call['done'].wait()
+        if call['error'] is not None:
+            raise call['error']
+        return call['result']
+
+    try:
+        call['result'] = compute()
+    except BaseException as exc:
+        call['error'] = exc
+        with _lock:
+            _stats['errors'] += 1
+        raise
+    finally:
+        with _lock:
+            del _calls[key]
+        call['done'].set()
+    return call['result']
+
+def in_flight() -> int:
+    """Number of computations currently running"""
+    with _lock:
+        return len(_calls)
+
+def get_stats() -> Dict[str, int]:
+    """Counters: calls, executed (leaders), coalesced (followers) and errors"""
+    with _lock:
+        return dict(_stats)
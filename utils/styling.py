@@ -2,381 +2,47 @@
 Styling and UI components for the dashboard
 Brand-inspired design with clean, premium aesthetic
 """
+import re
+from functools import lru_cache
+from pathlib import Path
 import streamlit as st
 
-def apply_custom_css():
-    """Apply custom CSS styling with brand-inspired design language"""
-    st.markdown("""
-    <style>
-        /* Import brand-inspired fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;600;700;800&family=Lato:wght@300;400;700;900&display=swap');
-
-        /* Global styling */
-        * {
-            font-family: 'Lato', -apple-system, BlinkMacSystemFont, sans-serif;
-        }
-
-        /* Main container - clean ecru background */
-        .main {
-            background: #FAF9F2;
-            padding: 0rem 1rem;
-        }
-
-        .block-container {
-            padding-top: 1.5rem;
-            padding-bottom: 2rem;
-            max-width: 1400px;
-        }
-
-        /* Header styling - elegant and clean */
-        .dashboard-header {
-            background: #ffffff;
-            padding: 1rem 1.5rem;
-            border-radius: 4px;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 1px 3px rgba(89, 89, 89, 0.12);
-            border-bottom: 3px solid #ffe512;
-        }
-
-        .dashboard-title {
-            font-family: 'Playfair Display', serif;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #595959;
-            margin: 0;
-            letter-spacing: -0.3px;
-        }
-
-        .dashboard-subtitle {
-            font-family: 'Lato', sans-serif;
-            font-size: 0.875rem;
-            color: #7a7a7a;
-            margin-top: 0.25rem;
-            font-weight: 400;
-            letter-spacing: 0.3px;
-        }
-
-        /* KPI Card styling - clean and minimal */
-        .kpi-card {
-            background: #ffffff;
-            padding: 1.5rem;
-            border-radius: 4px;
-            box-shadow: 0 1px 3px rgba(89, 89, 89, 0.12);
-            border-top: 3px solid #ffe512;
-            margin-bottom: 1rem;
-            transition: all 0.2s ease;
-            min-height: 180px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        }
-
-        .kpi-card:hover {
-            box-shadow: 0 4px 12px rgba(89, 89, 89, 0.15);
-            transform: translateY(-2px);
-        }
-
-        .kpi-label {
-            font-family: 'Lato', sans-serif;
-            font-size: 0.75rem;
-            color: #7a7a7a;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 0.75rem;
-        }
-
-        .kpi-value {
-            font-family: 'Playfair Display', serif;
-            font-size: 2.25rem;
-            font-weight: 700;
-            color: #595959;
-            margin: 0.5rem 0;
-            line-height: 1.1;
-        }
-
-        .kpi-delta {
-            font-family: 'Lato', sans-serif;
-            font-size: 0.8125rem;
-            font-weight: 600;
-            margin-top: 0.75rem;
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }
-
-        .kpi-delta-positive {
-            color: #2d5f3f;
-        }
-
-        .kpi-delta-negative {
-            color: #8b3a3a;
-        }
-
-        .kpi-delta-neutral {
-            color: #7a7a7a;
-        }
-
-        /* Sidebar styling - clean and professional */
-        section[data-testid="stSidebar"] {
-            background: #ffffff;
-            border-right: 1px solid #e5e5e0;
-        }
-
-        section[data-testid="stSidebar"] > div {
-            background: transparent;
-        }
-
-        section[data-testid="stSidebar"] .stMarkdown h3,
-        section[data-testid="stSidebar"] .stMarkdown h2,
-        section[data-testid="stSidebar"] .stMarkdown h1 {
-            font-family: 'Playfair Display', serif;
-            color: #595959 !important;
-            font-weight: 700;
-        }
-
-        section[data-testid="stSidebar"] label {
-            font-family: 'Lato', sans-serif;
-            color: #595959 !important;
-            font-weight: 600;
-            font-size: 0.875rem;
-        }
-
-        section[data-testid="stSidebar"] .stSelectbox label,
-        section[data-testid="stSidebar"] .stDateInput label {
-            color: #7a7a7a !important;
-            font-weight: 600;
-        }
-
-        /* Section headers - elegant typography */
-        .section-header {
-            font-family: 'Playfair Display', serif;
-            font-size: 1.75rem;
-            font-weight: 700;
-            color: #595959;
-            margin: 2rem 0 1.25rem 0;
-            padding-bottom: 0.75rem;
-            border-bottom: 2px solid #ffe512;
-        }
-
-        /* Chart container - clean white cards */
-        .chart-container {
-            background: #ffffff;
-            padding: 1.5rem;
-            border-radius: 4px;
-            box-shadow: 0 1px 3px rgba(89, 89, 89, 0.12);
-            margin-bottom: 1.5rem;
-        }
-
-        /* Tabs styling - minimal and clean */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background-color: transparent;
-            border-bottom: 1px solid #e5e5e0;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            font-family: 'Lato', sans-serif;
-            height: 48px;
-            background-color: transparent;
-            border-radius: 0;
-            padding: 0 24px;
-            font-weight: 600;
-            font-size: 0.9375rem;
-            border: none;
-            border-bottom: 3px solid transparent;
-            color: #7a7a7a;
-            transition: all 0.2s ease;
-        }
-
-        .stTabs [data-baseweb="tab"]:hover {
-            color: #595959;
-            border-bottom-color: #d4b000;
-        }
-
-        .stTabs [aria-selected="true"] {
-            background-color: transparent;
-            color: #595959 !important;
-            border-bottom-color: #ffe512;
-        }
-
-        /* Metric styling */
-        [data-testid="stMetricValue"] {
-            font-family: 'Playfair Display', serif;
-            font-size: 2rem;
-            font-weight: 700;
-            color: #595959;
-        }
-
-        [data-testid="stMetricLabel"] {
-            font-family: 'Lato', sans-serif;
-            font-size: 0.875rem;
-            color: #7a7a7a;
-        }
-
-        /* Dataframe styling */
-        .stDataFrame {
-            border-radius: 4px;
-            overflow: hidden;
-            font-family: 'Lato', sans-serif;
-        }
+STYLESHEET_PATH = Path(__file__).resolve().parent.parent / "static" / "dashboard.css"
+STATIC_URL = "app/static/"
+# Fonts needed for first paint; the rest load on demand from the stylesheet's @font-face rules
+PRELOAD_FONTS = ("app/static/fonts/Lato-Regular.woff2", "app/static/fonts/PlayfairDisplay-Variable.woff2")
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace browsers ignore: '.a > b {\n  color: red;\n}' -> '.a>b{color:red}'"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+@lru_cache(maxsize=1)
+def _style_block() -> str:
+    """static/dashboard.css as a minified <style> block, built once per process"""
+    css = minify_css(STYLESHEET_PATH.read_text(encoding='utf-8'))
+    # Inline url()s resolve against the page, not static/, so point the fonts at the static route
+    css = css.replace("url('fonts/", f"url('{STATIC_URL}fonts/")
+    return f"<style>{css}</style>"
 
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            font-family: 'Lato', sans-serif;
-            background-color: #ffffff;
-            border: 1px solid #e5e5e0;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.875rem;
-            color: #595959;
-            padding: 0.75rem 1rem;
-        }
-
-        .streamlit-expanderHeader:hover {
-            background-color: #FAF9F2;
-            border-color: #ffe512;
-        }
-
-        /* Button styling - yellow accent */
-        .stButton > button {
-            font-family: 'Lato', sans-serif;
-            background: #ffe512;
-            color: #595959;
-            border: none;
-            border-radius: 4px;
-            padding: 0.5rem 2rem;
-            font-weight: 700;
-            font-size: 0.9375rem;
-            transition: all 0.2s ease;
-        }
-
-        .stButton > button:hover {
-            background: #d4b000;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(255, 229, 18, 0.3);
-        }
-
-        /* KPI Button - make invisible, positioned over card */
-        .stButton > button[kind="secondary"] {
-            background: transparent !important;
-            color: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            padding: 0 !important;
-            height: 180px !important;
-            margin-top: -180px !important;
-            margin-bottom: 0 !important;
-            position: relative !important;
-            z-index: 10 !important;
-            cursor: pointer !important;
-            font-size: 0 !important;
-        }
-
-        .stButton > button[kind="secondary"]:hover {
-            background: transparent !important;
-            box-shadow: none !important;
-            transform: none !important;
-        }
-
-        .stButton > button[kind="secondary"]:active {
-            transform: none !important;
-        }
-
-        .stButton > button[kind="secondary"]:focus {
-            box-shadow: none !important;
-        }
-
-        .stButton > button[kind="secondary"] p {
-            display: none !important;
-        }
-
-        /* Info/Warning/Success boxes */
-        .stAlert {
-            font-family: 'Lato', sans-serif;
-            border-radius: 4px;
-            border-left-width: 4px;
-        }
-
-        /* Headings */
-        h1, h2, h3, h4, h5, h6 {
-            font-family: 'Playfair Display', serif;
-            color: #595959;
-            font-weight: 700;
-        }
-
-        /* Body text */
-        p, div, span, label {
-            font-family: 'Lato', sans-serif;
-            color: #595959;
-        }
-
-        /* Footer */
-        .dashboard-footer {
-            text-align: center;
-            color: #7a7a7a;
-            padding: 2rem 0 1rem 0;
-            font-size: 0.875rem;
-            border-top: 1px solid #e5e5e0;
-            margin-top: 3rem;
-            font-family: 'Lato', sans-serif;
-        }
-
-        /* Clean scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: #FAF9F2;
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: #d4b000;
-            border-radius: 4px;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: #ffe512;
-        }
-
-        /* Plotly chart styling */
-        .js-plotly-plot {
-            border-radius: 4px;
-        }
-
-        /* Remove default streamlit branding colors */
-        .stApp header {
-            background-color: transparent;
-        }
-
-        /* Select box styling */
-        .stSelectbox > div > div {
-            background-color: #ffffff;
-            border: 1px solid #e5e5e0;
-            border-radius: 4px;
-        }
-
-        /* Date input styling */
-        .stDateInput > div > div {
-            background-color: #ffffff;
-            border: 1px solid #e5e5e0;
-            border-radius: 4px;
-        }
-
-        /* Radio button styling */
-        .stRadio > div {
-            gap: 1rem;
-        }
-
-        .stRadio label {
-            font-family: 'Lato', sans-serif;
-            font-weight: 500;
-            color: #595959;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+def apply_custom_css():
+    """
+    Inject the dashboard stylesheet with brand-inspired design language
+
+    The CSS lives in static/dashboard.css and is injected inline, minified:
+    the Tornado server of the Streamlit versions we support serves .css
+    from the static route as text/plain with nosniff, which browsers
+    refuse as a stylesheet, so it cannot be linked and cached. Fonts are
+    bundled under static/fonts and served from the static route, so
+    nothing is fetched from external hosts.
+    """
+    preload = "".join(
+        f'<link rel="preload" href="{font}" as="font" type="font/woff2" crossorigin>' for font in PRELOAD_FONTS
+    )
+    st.markdown(preload + _style_block(), unsafe_allow_html=True)
 
 def create_header(title: str, subtitle: str):
     """Create clean, elegant dashboard header"""
@@ -436,40 +102,20 @@ def create_clickable_kpi_button(label: str, value: str, delta: float = None, del
     """
     if delta is not None:
         if inverse:
-            delta_class = "kpi-delta-positive" if delta < 0 else "kpi-delta-negative" if delta > 0 else "kpi-delta-neutral"
-            delta_color = "#2d5f3f" if delta < 0 else "#8b3a3a" if delta > 0 else "#7a7a7a"
+            delta_trend = "positive" if delta < 0 else "negative" if delta > 0 else "neutral"
         else:
-            delta_class = "kpi-delta-positive" if delta > 0 else "kpi-delta-negative" if delta < 0 else "kpi-delta-neutral"
-            delta_color = "#2d5f3f" if delta > 0 else "#8b3a3a" if delta < 0 else "#7a7a7a"
+            delta_trend = "positive" if delta > 0 else "negative" if delta < 0 else "neutral"
 
         delta_symbol = "▲" if delta > 0 else "▼" if delta < 0 else "●"
-        delta_html = f'<div style="font-size: 0.8125rem; font-weight: 600; color: {delta_color}; margin-top: 0.75rem;">{delta_symbol} {abs(delta):.1f}% {delta_label}</div>'
+        delta_html = f'<div class="clickable-kpi-delta" data-trend="{delta_trend}">{delta_symbol} {abs(delta):.1f}% {delta_label}</div>'
     else:
-        delta_html = '<div style="height: 1.5rem;"></div>'  # Placeholder for spacing
+        delta_html = '<div class="clickable-kpi-delta"></div>'  # Placeholder for spacing
 
-    # Create the full card as HTML
+    # Card styling comes from the shared .clickable-kpi-* rules in static/dashboard.css
     card_html = f"""
-    <style>
-        .clickable-kpi-card-{key} {{
-            background: #ffffff;
-            padding: 1.5rem;
-            border-radius: 4px;
-            box-shadow: 0 1px 3px rgba(89, 89, 89, 0.12);
-            border-top: 3px solid #ffe512;
-            margin-bottom: 0.5rem;
-            min-height: 148px;
-            transition: all 0.2s ease;
-            cursor: pointer;
-            pointer-events: none;
-        }}
-        .clickable-kpi-card-{key}:hover {{
-            box-shadow: 0 4px 12px rgba(89, 89, 89, 0.15);
-            transform: translateY(-2px);
-        }}
-    </style>
-    <div class="clickable-kpi-card-{key}">
-        <div style="font-size: 0.75rem; color: #7a7a7a; font-weight: 700; text-transform: uppercase; letter-spacing: 1px;">{label}</div>
-        <div style="font-family: 'Playfair Display', serif; font-size: 2.25rem; font-weight: 700; color: #595959; margin: 0.5rem 0;">{value}</div>
+    <div class="clickable-kpi-card" data-kpi="{key}">
+        <div class="clickable-kpi-label">{label}</div>
+        <div class="clickable-kpi-value">{value}</div>
         {delta_html}
     </div>
     """
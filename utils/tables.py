@@ -0,0 +1,186 @@
+"""
+Table rendering: typed columns formatted by st.column_config, and server-side pagination
+"""
+import math
+from typing import Dict, Hashable, Optional, Tuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+import config
+from utils import data_store
+
+ROW_HEIGHT = 35  # st.dataframe row height in pixels
+
+# Display format name -> st.column_config.NumberColumn format (sprintf-js; ',' groups thousands)
+NUMBER_FORMATS = {
+    'count': '%,.0f',
+    'decimal': '%,.1f',
+    'change': '%+,.0f',
+    'currency': '$%,.0f',
+    'currency_cents': '$%,.2f',
+    'currency_change': '$%+,.0f',
+    'percent': '%.1f%%',
+    'percent_2dp': '%.2f%%',
+    'percent_change': '%+.1f%%',
+}
+
+# Display format name -> st.column_config.DateColumn format (Moment.js)
+DATE_FORMATS = {
+    'date': 'YYYY-MM-DD',
+    'local_date': 'DD/MM/YYYY',
+}
+
+# Value format of a metric -> formats for the columns of metrics.calculate_period_breakdown()
+BREAKDOWN_FORMATS = {
+    'count': {'Current Period': 'count', 'Comparison Period': 'count', 'Change': 'change', 'Change %': 'percent_change'},
+    'currency': {'Current Period': 'currency', 'Comparison Period': 'currency', 'Change': 'currency_change', 'Change %': 'percent_change'},
+    'percent': {'Current Period': 'percent', 'Comparison Period': 'percent', 'Change': 'percent_change', 'Change %': 'percent_change'},
+}
+
+def column_config(formats: Optional[Dict[str, str]]) -> Dict[str, object]:
+    """
+    st.column_config entries for named display formats
+
+    Formatting happens in the browser on the typed values, so nothing is
+    converted to strings or styled per cell on the server.
+
+    Args:
+        formats: Column name -> key of NUMBER_FORMATS or DATE_FORMATS
+
+    Returns:
+        Dict to pass as st.dataframe(column_config=...)
+    """
+    config_by_column = {}
+    for column, name in (formats or {}).items():
+        if name in DATE_FORMATS:
+            config_by_column[column] = st.column_config.DateColumn(format=DATE_FORMATS[name])
+        else:
+            config_by_column[column] = st.column_config.NumberColumn(format=NUMBER_FORMATS[name])
+    return config_by_column
+
+def render_table(data: pd.DataFrame, formats: Optional[Dict[str, str]] = None, height=400, **dataframe_kwargs):
+    """
+    Render a whole table with typed columns formatted by column_config
+
+    Args:
+        data: Table to show (treated as read-only)
+        formats: Column name -> display format name (see column_config())
+        height: Table height in pixels, or "auto"
+        **dataframe_kwargs: Extra st.dataframe arguments (e.g. on_select)
+
+    Returns:
+        st.dataframe's return value (the selection state when on_select is set)
+    """
+    return st.dataframe(
+        data,
+        use_container_width=True,
+        hide_index=True,
+        height=height,
+        column_config=column_config(formats),
+        **dataframe_kwargs
+    )
+
+def query_positions(data: pd.DataFrame, search: str = "", sort_by: Optional[str] = None,
+                    ascending: bool = True) -> np.ndarray:
+    """
+    Row positions matching a search, in sort order
+
+    Args:
+        data: Full table
+        search: Case-insensitive text matched against every column; empty keeps all rows
+        sort_by: Column to sort on, or None for the table's own order
+        ascending: Sort direction
+
+    Returns:
+        Integer positions into data (stable sort, so ties keep table order)
+    """
+    positions = np.arange(len(data))
+    if search:
+        matches = np.zeros(len(data), dtype=bool)
+        for column in data.columns:
+            matches |= data[column].astype(str).str.contains(search, case=False, regex=False).to_numpy(dtype=bool)
+        positions = positions[matches]
+    if sort_by is not None:
+        order = data[sort_by].iloc[positions].reset_index(drop=True).sort_values(
+            ascending=ascending, kind='stable', na_position='last'
+        ).index.to_numpy()
+        positions = positions[order]
+    return positions
+
+def matching_positions(data: pd.DataFrame, search: str = "", sort_by: Optional[str] = None, ascending: bool = True,
+                       cache_key: Optional[Tuple[Hashable, ...]] = None) -> np.ndarray:
+    """
+    query_positions(), cached per (cache_key, search, sort) when a key is given
+
+    Paging through a cached result only slices the positions array.
+
+    Args:
+        cache_key: (data version, ...) identifying data, e.g. a dialog's view key
+    """
+    def compute():
+        return query_positions(data, search, sort_by, ascending)
+
+    if cache_key is None:
+        return compute()
+    return data_store.cached(
+        cache_key[0], tuple(cache_key[1:]) + ('table_positions', search, sort_by, ascending), compute
+    )
+
+def query_page(data: pd.DataFrame, page: int, page_size: int, search: str = "", sort_by: Optional[str] = None,
+               ascending: bool = True, cache_key: Optional[Tuple[Hashable, ...]] = None) -> Tuple[pd.DataFrame, int]:
+    """
+    One page of a filtered, sorted table
+
+    Args:
+        page: 1-based page number
+        page_size: Rows per page
+
+    Returns:
+        Tuple of (rows on the page, total matching rows)
+    """
+    positions = matching_positions(data, search, sort_by, ascending, cache_key)
+    start = (page - 1) * page_size
+    return data.iloc[positions[start:start + page_size]], len(positions)
+
+def render_paginated_table(data: pd.DataFrame, key: str, cache_key: Optional[Tuple[Hashable, ...]] = None,
+                           formats: Optional[Dict[str, str]] = None, page_size: int = config.TABLE_PAGE_SIZE,
+                           **dataframe_kwargs):
+    """
+    Render a table one page at a time with search, sort and page controls
+
+    Only the visible page is serialised to the browser, so a 50k-row list
+    costs about the same to open as a 50-row one.
+
+    Args:
+        data: Full table (treated as read-only)
+        key: Widget key prefix, unique within the page or dialog
+        cache_key: Passed to matching_positions() to cache filtered/sorted positions
+        formats: Column name -> display format name (see column_config())
+        page_size: Rows per page
+        **dataframe_kwargs: Extra st.dataframe arguments
+    """
+    col_search, col_sort, col_order, col_page = st.columns([3, 2, 1, 1])
+    with col_search:
+        search = st.text_input("Search", key=f"{key}_search", placeholder="Filter rows…").strip()
+    with col_sort:
+        sort_by = st.selectbox("Sort by", [None] + list(data.columns), key=f"{key}_sort",
+                               format_func=lambda column: "Default order" if column is None else column)
+    with col_order:
+        descending = st.toggle("Descending", key=f"{key}_descending", disabled=sort_by is None)
+
+    # Page count depends on the search; clamp a stale page number before its widget is created
+    positions = matching_positions(data, search, sort_by, not descending, cache_key)
+    pages = max(1, math.ceil(len(positions) / page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with col_page:
+        page = int(st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key))
+
+    start = (page - 1) * page_size
+    rows = data.iloc[positions[start:start + page_size]]
+    render_table(rows, formats, height=min(500, ROW_HEIGHT * (len(rows) + 1) + 3), **dataframe_kwargs)
+    caption = f"Rows {start + 1:,}–{start + len(rows):,} of {len(positions):,}" if len(rows) else "No matching rows"
+    if search:
+        caption += f" (filtered from {len(data):,})"
+    st.caption(caption)
@@ -0,0 +1,111 @@
+"""
+Trend engine: rolling averages, growth rates and YoY series
+"""
+from typing import Dict, Iterable, Optional
+import numpy as np
+import pandas as pd
+
+# How each metric is combined across portfolio managers within a scope
+TREND_METRICS: Dict[str, str] = {
+    'landlords': 'sum',
+    'properties': 'sum',
+    'leases': 'sum',
+    'vacancies': 'sum',
+    'occupancy_rate': 'mean',
+    'management_fees': 'sum',
+    'leasing_fees': 'sum',
+    'other_fees': 'sum',
+    'total_revenue': 'sum',
+    'rent_roll': 'sum',
+    'total_arrears': 'sum',
+    'avg_fee_per_tenancy': 'mean',
+    'overdue_diary_items': 'sum',
+    'completed_diary_items': 'sum',
+}
+
+ROLLING_WINDOWS = (3, 6, 12)
+WHOLE_AGENCY_SCOPE = "Whole Agency"
+
+def get_scope(selected_agency: str, selected_pm: str) -> str:
+    """Map the sidebar filters to a trend cube scope"""
+    if selected_pm != "All Managers":
+        return selected_pm
+    if selected_agency != "Whole Agency":
+        return selected_agency
+    return WHOLE_AGENCY_SCOPE
+
+def _percent_change(values: pd.DataFrame, previous: pd.DataFrame) -> pd.DataFrame:
+    """Percentage change with zero/missing bases mapped to NaN"""
+    change = (values - previous) / previous.where(previous != 0) * 100
+    return change.replace([np.inf, -np.inf], np.nan)
+
+def build_trend_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the trend cube for every scope and metric in one pass
+
+    Scopes are the whole agency, each agency and each portfolio manager.
+    For every metric the cube holds the monthly value, rolling 3/6/12-month
+    averages, month-over-month growth and year-over-year change.
+
+    Args:
+        df: Historical PM-month data from generate_historical_data
+
+    Returns:
+        DataFrame with one row per (scope, date)
+    """
+    metrics = list(TREND_METRICS)
+
+    whole = df.groupby('date').agg(TREND_METRICS).reset_index()
+    whole['scope'] = WHOLE_AGENCY_SCOPE
+    whole['scope_type'] = 'whole_agency'
+
+    agency = df.groupby(['agency', 'date']).agg(TREND_METRICS).reset_index()
+    agency = agency.rename(columns={'agency': 'scope'})
+    agency['scope_type'] = 'agency'
+
+    pm = df.groupby(['portfolio_manager', 'date']).agg(TREND_METRICS).reset_index()
+    pm = pm.rename(columns={'portfolio_manager': 'scope'})
+    pm['scope_type'] = 'portfolio_manager'
+
+    base = pd.concat([whole, agency, pm], ignore_index=True)
+    base = base.sort_values(['scope', 'date']).reset_index(drop=True)
+
+    grouped = base.groupby('scope', sort=False)[metrics]
+    parts = [base[['scope', 'scope_type', 'date'] + metrics]]
+
+    for window in ROLLING_WINDOWS:
+        rolling = grouped.rolling(window, min_periods=1).mean().reset_index(level=0, drop=True)
+        parts.append(rolling.sort_index().add_suffix(f'_ma{window}'))
+
+    parts.append(_percent_change(base[metrics], grouped.shift(1)).add_suffix('_growth'))
+    parts.append(_percent_change(base[metrics], grouped.shift(12)).add_suffix('_yoy'))
+
+    return pd.concat(parts, axis=1)
+
+def get_trend(cube: pd.DataFrame, scope: str, metric: str, stat: Optional[str] = None) -> pd.DataFrame:
+    """
+    Get a single trend series from the cube
+
+    Args:
+        cube: Output of build_trend_cube
+        scope: Scope name (see get_scope)
+        metric: Metric column, e.g. 'properties'
+        stat: Optional derived series ('ma3', 'ma6', 'ma12', 'growth', 'yoy')
+
+    Returns:
+        DataFrame with 'date' and the metric column
+    """
+    column = f'{metric}_{stat}' if stat else metric
+    series = cube.loc[cube['scope'] == scope, ['date', column]]
+    return series.rename(columns={column: metric}).reset_index(drop=True)
+
+def get_group_trend(cube: pd.DataFrame, metric: str, portfolio_managers: Iterable[str]) -> pd.DataFrame:
+    """Get per-PM trend series for the given portfolio managers"""
+    rows = cube[(cube['scope_type'] == 'portfolio_manager') & cube['scope'].isin(list(portfolio_managers))]
+    rows = rows[['date', 'scope', metric]].rename(columns={'scope': 'portfolio_manager'})
+    return rows.reset_index(drop=True)
+
+def get_trend_summary(cube: pd.DataFrame, scope: str, metric: str) -> pd.DataFrame:
+    """Get a metric with its rolling averages, MoM growth and YoY change"""
+    columns = [metric] + [f'{metric}_ma{w}' for w in ROLLING_WINDOWS] + [f'{metric}_growth', f'{metric}_yoy']
+    return cube.loc[cube['scope'] == scope, ['date'] + columns].reset_index(drop=True)
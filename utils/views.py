@@ -0,0 +1,142 @@
+"""
+Cached views and figures shared by the dashboard and the warm-up
+"""
+from typing import Optional, Tuple
+import pandas as pd
+import plotly.graph_objects as go
+from utils import charts, data_generator, data_store, landlords, trends
+from utils.data_store import Snapshot
+
+def _pm_filter(selected_pm: str) -> str:
+    """PM argument expected by the data_generator drill-down functions"""
+    return selected_pm if selected_pm != "All Managers" else "Whole Agency"
+
+def scoped_data(snapshot: Snapshot, selected_agency: str, selected_pm: str) -> pd.DataFrame:
+    """Historical rows for the sidebar agency/PM filters"""
+    def build():
+        df = snapshot.df
+        if selected_agency != "Whole Agency":
+            df = df[df['agency'] == selected_agency]
+        if selected_pm != "All Managers":
+            df = df[df['portfolio_manager'] == selected_pm]
+        return df
+
+    return data_store.cached(snapshot.version, ('scoped_data', selected_agency, selected_pm), build)
+
+def period_data(snapshot: Snapshot, selected_agency: str, selected_pm: str, date: pd.Timestamp) -> Tuple[pd.Timestamp, pd.DataFrame]:
+    """
+    Rows for the latest month on or before a selected date
+
+    Returns:
+        Tuple of (actual month date, rows for that month)
+    """
+    df = scoped_data(snapshot, selected_agency, selected_pm)
+    actual_date = df['date'][df['date'] <= date].max()
+    rows = data_store.cached(
+        snapshot.version,
+        ('period_data', selected_agency, selected_pm, actual_date),
+        lambda: df[df['date'] == actual_date]
+    )
+    return actual_date, rows
+
+def period_kpis(snapshot: Snapshot, selected_agency: str, selected_pm: str, date: pd.Timestamp) -> dict:
+    """Headline KPI totals for the month on or before a selected date"""
+    actual_date, rows = period_data(snapshot, selected_agency, selected_pm, date)
+
+    def build():
+        return {
+            'landlords': rows['landlords'].sum(),
+            'properties': rows['properties'].sum(),
+            'leases': rows['leases'].sum(),
+            'vacancies': rows['vacancies'].sum(),
+            'avg_occupancy': rows['occupancy_rate'].mean(),
+            'rent_roll': rows['rent_roll'].sum(),
+            'total_revenue': rows['total_revenue'].sum(),
+            'total_arrears': rows['total_arrears'].sum(),
+            'avg_fee': rows['avg_fee_per_tenancy'].mean(),
+        }
+
+    return data_store.cached(snapshot.version, ('period_kpis', selected_agency, selected_pm, actual_date), build)
+
+def default_periods(snapshot: Snapshot) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Latest month and the month before it"""
+    dates = snapshot.df['date'].drop_duplicates().sort_values()
+    return dates.iloc[-1], dates.iloc[max(0, len(dates) - 2)]
+
+def pm_bar_chart(snapshot: Snapshot, selected_agency: str, selected_pm: str, date: pd.Timestamp,
+                 metric: str, label: str, title: str) -> go.Figure:
+    """Horizontal bar chart of one metric per portfolio manager for a period"""
+    actual_date, rows = period_data(snapshot, selected_agency, selected_pm, date)
+
+    def build():
+        totals = rows.groupby('portfolio_manager')[metric].sum().reset_index()
+        totals.columns = ['Portfolio Manager', label]
+        fig = charts.create_horizontal_bar_chart(totals, label, 'Portfolio Manager', title)
+        return charts.compact_figure(fig)
+
+    return data_store.cached(snapshot.version, ('pm_bar_chart', selected_agency, selected_pm, actual_date, metric, title), build)
+
+def trend_chart(snapshot: Snapshot, scope: str, metric: str, title: str) -> go.Figure:
+    """Area trend chart of a metric for a trend cube scope"""
+    def build():
+        trend = trends.get_trend(snapshot.trend_cube, scope, metric)
+        fig = charts.create_trend_line_chart(trend, 'date', metric, title, show_area=True)
+        return charts.compact_figure(fig)
+
+    return data_store.cached(snapshot.version, ('trend_chart', scope, metric, title), build)
+
+def revenue_breakdown_chart(snapshot: Snapshot, selected_agency: str, selected_pm: str) -> go.Figure:
+    """Donut chart of revenue by account code"""
+    def build():
+        df = scoped_data(snapshot, selected_agency, selected_pm)
+        breakdown = data_generator.generate_revenue_breakdown(df, _pm_filter(selected_pm))
+        fig = charts.create_donut_chart(breakdown, 'amount', 'account_code', 'Revenue Breakdown by Account Code')
+        return charts.compact_figure(fig)
+
+    return data_store.cached(snapshot.version, ('revenue_breakdown_chart', selected_agency, selected_pm), build)
+
+def top_landlords(snapshot: Snapshot, selected_agency: str, selected_pm: str, date: pd.Timestamp,
+                  limit: int = 10) -> pd.DataFrame:
+    """Top landlords by revenue for the filters in the month on or before a selected date"""
+    actual_date, _ = period_data(snapshot, selected_agency, selected_pm, date)
+    return data_store.cached(
+        snapshot.version, ('top_landlords', selected_agency, selected_pm, actual_date, limit),
+        lambda: landlords.top_landlords(landlords.get_ranking(snapshot), selected_agency, selected_pm, actual_date, limit)
+    )
+
+def top_landlords_chart(snapshot: Snapshot, selected_agency: str, selected_pm: str, date: pd.Timestamp,
+                        limit: int = 10) -> go.Figure:
+    """Horizontal bar chart of the top landlords by revenue, labelled with landlords.display_names()"""
+    actual_date, _ = period_data(snapshot, selected_agency, selected_pm, date)
+
+    def build():
+        ranked = top_landlords(snapshot, selected_agency, selected_pm, actual_date, limit)
+        ranked = ranked.assign(label=landlords.display_names(ranked))
+        fig = charts.create_horizontal_bar_chart(ranked, 'revenue', 'label', f'Top {limit} Landlords by Revenue')
+        return charts.compact_figure(fig)
+
+    return data_store.cached(snapshot.version, ('top_landlords_chart', selected_agency, selected_pm, actual_date, limit), build)
+
+def arrears_details(snapshot: Snapshot, selected_agency: str, selected_pm: str, bucket: Optional[str] = None) -> pd.DataFrame:
+    """Tenant arrears list for the filtered scope, optionally one aging bucket"""
+    def build():
+        df = scoped_data(snapshot, selected_agency, selected_pm)
+        return data_generator.generate_arrears_details(df, _pm_filter(selected_pm), bucket)
+
+    return data_store.cached(snapshot.version, ('arrears_details', selected_agency, selected_pm, bucket), build)
+
+def critical_dates_details(snapshot: Snapshot, selected_agency: str, selected_pm: str, date_type: str) -> pd.DataFrame:
+    """Monthly counts of upcoming rent reviews or lease expiries for the filtered scope"""
+    def build():
+        df = scoped_data(snapshot, selected_agency, selected_pm)
+        return data_generator.generate_critical_dates_details(df, _pm_filter(selected_pm), date_type, snapshot.as_of)
+
+    return data_store.cached(snapshot.version, ('critical_dates_details', selected_agency, selected_pm, date_type), build)
+
+def diary_items_details(snapshot: Snapshot, selected_agency: str, selected_pm: str, status: str) -> pd.DataFrame:
+    """Diary items with a given status for the filtered scope"""
+    def build():
+        df = scoped_data(snapshot, selected_agency, selected_pm)
+        return data_generator.generate_diary_items_details(df, _pm_filter(selected_pm), status, snapshot.as_of)
+
+    return data_store.cached(snapshot.version, ('diary_items_details', selected_agency, selected_pm, status), build)
@@ -0,0 +1,83 @@
+"""
+Background cache warm-up for a freshly started worker
+"""
+import threading
+import time
+from typing import Optional
+import config
+from utils import data_store, landlords, rollup, search, trends, views
+
+_ready = threading.Event()
+_started = False
+_start_lock = threading.Lock()
+_duration: Optional[float] = None
+_error: Optional[BaseException] = None
+
+def warm_default_views(snapshot: data_store.Snapshot):
+    """
+    Precompute what the first request sees: Whole Agency / All Managers,
+    latest month vs the previous month, Overview and Management Fees figures
+    """
+    agency, pm = "Whole Agency", "All Managers"
+    scope = trends.get_scope(agency, pm)
+    current_date, comparison_date = views.default_periods(snapshot)
+
+    views.period_data(snapshot, agency, pm, comparison_date)
+    views.pm_bar_chart(snapshot, agency, pm, current_date, 'properties', 'Properties', 'Properties by Portfolio Manager')
+    views.pm_bar_chart(snapshot, agency, pm, current_date, 'leases', 'Leases', 'Active Leases by Portfolio Manager')
+    views.pm_bar_chart(snapshot, agency, pm, current_date, 'total_revenue', 'Revenue', 'Revenue by Portfolio Manager')
+
+    views.trend_chart(snapshot, scope, 'properties', 'Property Count Trend')
+    views.trend_chart(snapshot, scope, 'occupancy_rate', 'Average Occupancy Rate Trend')
+    views.trend_chart(snapshot, scope, 'total_revenue', 'Total Revenue Trend')
+    views.revenue_breakdown_chart(snapshot, agency, pm)
+    landlords.get_ranking(snapshot)
+    views.top_landlords_chart(snapshot, agency, pm, current_date)
+    search.get_index(snapshot)
+    rollup.get_tree(snapshot, current_date)
+
+def _run():
+    """Warm-up thread body: load the snapshot, build default views, flag readiness"""
+    global _duration, _error
+    start = time.perf_counter()
+    try:
+        warm_default_views(data_store.get_snapshot())
+    except Exception as exc:  # A failed warm-up only costs the first request its head start
+        _error = exc
+    finally:
+        _duration = time.perf_counter() - start
+        _ready.set()
+
+def start() -> bool:
+    """
+    Start the warm-up thread once per process
+
+    Returns:
+        True if this call started it, False if it was already started or disabled
+    """
+    global _started
+    if not config.WARMUP_ON_START:
+        _ready.set()
+        return False
+    with _start_lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=_run, name="dashboard-warmup", daemon=True).start()
+    return True
+
+def is_ready() -> bool:
+    """True once warm-up has finished (or was disabled)"""
+    return _ready.is_set()
+
+def wait(timeout: Optional[float] = None) -> bool:
+    """Block until warm-up finishes; returns False on timeout"""
+    return _ready.wait(timeout)
+
+def get_status() -> dict:
+    """Readiness, duration in seconds and error of the warm-up"""
+    return {
+        'ready': _ready.is_set(),
+        'duration': _duration,
+        'error': repr(_error) if _error else None
+    }